@@ -5,13 +5,38 @@ Main entry point for the ToDo Widget application.
 import os
 import sys
 import json
-from src.ui.main_window import TodoApp
-from src.data.task_manager import TaskManager
+import argparse
+from contextlib import nullcontext
+from src.utils.startup_profiler import StartupProfiler
 
 def main():
     """
     Initialize and run the application.
     """
+    arg_parser = argparse.ArgumentParser(description="Personal ToDo")
+    arg_parser.add_argument(
+        "--asyncio", action="store_true",
+        help="Run Tk from an asyncio event loop and report frame pacing on exit"
+    )
+    arg_parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Report per-module import times, theme creation, data load and first paint"
+    )
+    args = arg_parser.parse_args()
+    
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler()
+        profiler.install()
+    
+    def stage(name):
+        return profiler.stage(name) if profiler else nullcontext()
+    
+    # Imported here rather than at the top so the profiler can time them
+    with stage("import app modules"):
+        from src.ui.main_window import TodoApp
+        from src.data.task_manager import TaskManager
+    
     # Ensure required directories exist
     os.makedirs('data', exist_ok=True)
     
@@ -33,13 +58,17 @@ def main():
                 description="This is a test draft created on startup",
                 tags=["test"]
             )
+            # The draft is written on a background thread; wait for it
+            # before the app loads the file again
+            task_manager.flush_saves()
             print("Added test draft successfully")
         except Exception as e:
             print(f"Error creating test draft: {str(e)}")
     
     # Start the application
-    app = TodoApp()
-    app.run()
+    with stage("TodoApp()"):
+        app = TodoApp(profiler=profiler)
+    app.run(use_asyncio=args.asyncio)
 
 def ensure_json_file(file_path):
     """
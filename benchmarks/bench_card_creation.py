@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark card creation with inline fonts/styles against the card template.
+
+"inline" builds the card widget tree the way cards did before the template:
+font tuples, per-widget padding/foreground options and plain widgets without
+a style, which ttkbootstrap resolves per widget. "template" builds the same
+tree with the named fonts and registered styles of src.utils.card_template.
+Real TaskFrame and DraftTaskFrame cards are timed as well. For each card
+count the reduction of the template tree against the inline one is printed;
+that figure is the one to quote for the change. Needs a display (xvfb-run
+works) and ttkbootstrap.
+
+Usage:
+    python benchmarks/bench_card_creation.py [--cards 100 500] [--rounds 3]
+"""
+import os
+import sys
+import time
+import argparse
+from tkinter import ttk
+from datetime import datetime
+
+import ttkbootstrap as tb
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.custom_theme import create_custom_dark_theme
+from src.utils.card_template import register_card_template, badge_style, title_style
+from src.ui.task_frame import TaskFrame
+from src.ui.draft_frame import DraftTaskFrame
+
+TAGS = ["work", "home", "errand"]
+
+
+def build_inline_card(parent):
+    """
+    A task card's widget tree with inline fonts and options.
+    """
+    card = ttk.Frame(parent, padding=5, width=300, height=180, style="danger.TFrame")
+    container = ttk.Frame(card, padding=8, relief="raised", borderwidth=1)
+    header = ttk.Frame(container)
+    ttk.Label(header, text="Title", font=("Helvetica", 12, "bold"), foreground="#FFFFFF", style="danger.TLabel")
+    ttk.Label(header, text="High", font=("Helvetica", 9), padding=(5, 2), foreground="#FFFFFF", style="danger.Inverse.TLabel")
+    details = ttk.Frame(container, padding=(10, 5, 0, 0))
+    ttk.Label(details, text="Status: To Do", font=("Helvetica", 9))
+    ttk.Label(details, text="Due: Oct 18, 2026", font=("Helvetica", 9))
+    ttk.Label(container, text="Description", font=("Helvetica", 9), foreground="gray")
+    tags = ttk.Frame(container)
+    for tag in TAGS:
+        ttk.Label(tags, text=tag, style="secondary.Inverse.TLabel", font=("Helvetica", 8), padding=(5, 0), foreground="#FFFFFF")
+    return card
+
+
+def build_template_card(parent):
+    """
+    The same widget tree using the card template's fonts and styles.
+    """
+    card = ttk.Frame(parent, padding=5, width=300, height=180, style="danger.TFrame")
+    container = ttk.Frame(card, style="Card.TFrame")
+    header = ttk.Frame(container, style="TFrame")
+    ttk.Label(header, text="Title", style=title_style("danger"))
+    ttk.Label(header, text="High", style=badge_style("danger"))
+    details = ttk.Frame(container, padding=(10, 5, 0, 0), style="TFrame")
+    ttk.Label(details, text="Status: To Do", style="CardBody.TLabel")
+    ttk.Label(details, text="Due: Oct 18, 2026", style="CardBody.TLabel")
+    ttk.Label(container, text="Description", style="CardMuted.TLabel")
+    tags = ttk.Frame(container, style="TFrame")
+    for tag in TAGS:
+        ttk.Label(tags, text=tag, style="CardChip.secondary.Inverse.TLabel")
+    return card
+
+
+def make_task(i):
+    return {
+        "id": f"task{i}",
+        "title": f"Task {i}",
+        "description": "Something to do before the end of the week",
+        "due_date": datetime(2026, 10, 1 + i % 28).isoformat(),
+        "priority": ["High", "Medium", "Low"][i % 3],
+        "status": "To Do",
+        "tags": TAGS[:i % 4],
+        "created_at": datetime(2026, 9, 1).isoformat(),
+    }
+
+
+def make_draft(i):
+    return {
+        "id": f"draft{i}",
+        "title": f"Draft {i}",
+        "description": "An idea worth keeping",
+        "tags": TAGS[:i % 4],
+        "created_at": datetime(2026, 9, 1).isoformat(),
+    }
+
+
+def run_case(root, build, count, rounds):
+    """
+    Time building count cards, including Tk's idle geometry work.
+
+    Returns:
+        float: Best round in milliseconds
+    """
+    best = None
+    for _ in range(rounds):
+        frame = ttk.Frame(root)
+        start = time.perf_counter()
+        for i in range(count):
+            build(frame, i)
+        root.update_idletasks()
+        elapsed = (time.perf_counter() - start) * 1000
+        frame.destroy()
+        root.update_idletasks()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No display: set DISPLAY, e.g. run under xvfb-run")
+
+    root = tb.Window(themename=create_custom_dark_theme())
+    root.withdraw()
+    print(f"register_card_template: {register_card_template():.1f} ms")
+
+    noop = lambda *args: None
+    cases = [
+        ("inline widget tree", lambda parent, i: build_inline_card(parent)),
+        ("template widget tree", lambda parent, i: build_template_card(parent)),
+        ("TaskFrame", lambda parent, i: TaskFrame(parent, make_task(i), noop, noop, noop)),
+        ("DraftTaskFrame", lambda parent, i: DraftTaskFrame(parent, make_draft(i), noop, noop, noop)),
+    ]
+
+    # One untimed card each so first-use style builds are not counted
+    warm = ttk.Frame(root)
+    for _, build in cases:
+        build(warm, 0)
+    warm.destroy()
+
+    print(f"{'case':<22} {'cards':>6} {'best ms':>10} {'ms/card':>9}")
+    for count in args.cards:
+        results = {}
+        for name, build in cases:
+            elapsed = run_case(root, build, count, args.rounds)
+            results[name] = elapsed
+            print(f"{name:<22} {count:>6} {elapsed:>10.1f} {elapsed / count:>9.3f}")
+        inline, template = results["inline widget tree"], results["template widget tree"]
+        print(f"template vs inline at {count} cards: {100 * (1 - template / inline):.0f}% less time per card")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark helpers.format_date against the previous dateutil-only version.
+
+Formats the due and created dates of a synthetic task list, the way a full
+render of the task cards does. "cold" clears the memo before each round so
+only the ISO fast path helps; "warm" keeps it, as on a re-render. A share of
+non-ISO strings exercises the dateutil fallback.
+
+Usage:
+    python benchmarks/bench_format_date.py [--tasks 1000 10000] [--rounds 5] [--non-iso 0.05]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil import parser
+
+from src.utils import helpers
+
+
+def format_date_dateutil(date_str, format_str="%b %d, %Y"):
+    """
+    The previous implementation: a full dateutil parse per call.
+    """
+    if not date_str:
+        return "Not set"
+
+    try:
+        date_obj = parser.parse(date_str)
+        return date_obj.strftime(format_str)
+    except Exception:
+        return date_str
+
+
+def make_dates(count, non_iso, seed=1):
+    """
+    Build the date strings shown for count tasks (due and created dates).
+
+    Due dates cluster on a few weeks, like real task lists; created dates
+    carry times and are mostly unique.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    dates = []
+    for _ in range(count):
+        due = start + timedelta(days=rng.randrange(60))
+        created = start + timedelta(seconds=rng.randrange(60 * 86400), microseconds=rng.randrange(10 ** 6))
+        for value in (due, created):
+            if rng.random() < non_iso:
+                dates.append(value.strftime("%d %B %Y %H:%M"))
+            else:
+                dates.append(value.isoformat())
+    return dates
+
+
+def run_case(format_func, dates, rounds, clear=None):
+    """
+    Time formatting every date once per round.
+
+    Returns:
+        float: Best round in milliseconds
+    """
+    best = None
+    for _ in range(rounds):
+        if clear is not None:
+            clear()
+        start = time.perf_counter()
+        for value in dates:
+            format_func(value)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000])
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    arg_parser.add_argument("--non-iso", type=float, default=0.05, help="Share of dates that are not ISO 8601")
+    args = arg_parser.parse_args()
+
+    # Both versions must agree before their timings mean anything
+    sample = make_dates(200, args.non_iso)
+    mismatches = [value for value in sample if helpers.format_date(value) != format_date_dateutil(value)]
+    if mismatches:
+        print(f"Output differs for {len(mismatches)} dates, e.g. {mismatches[0]!r}")
+        sys.exit(1)
+
+    clear = helpers._format_date_cached.cache_clear
+    cases = [
+        ("dateutil (previous)", format_date_dateutil, None),
+        ("format_date cold", helpers.format_date, clear),
+        ("format_date warm", helpers.format_date, None),
+    ]
+
+    print(f"{'implementation':<22} {'dates':>7} {'best ms':>10} {'us/date':>9}")
+    for count in args.tasks:
+        dates = make_dates(count, args.non_iso)
+        clear()
+        for name, format_func, clear_between in cases:
+            elapsed = run_case(format_func, dates, args.rounds, clear_between)
+            print(f"{name:<22} {len(dates):>7} {elapsed:>10.1f} {elapsed * 1000 / len(dates):>9.2f}")
+    print(f"memo: {helpers._format_date_cached.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
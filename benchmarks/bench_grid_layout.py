@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark grid layout time for batches of cards.
+
+Compares the old one-item-at-a-time relayout (every add re-grids every card)
+with add_items() and a suspend()/resume() block, for SimpleGridLayout and
+EnhancedGridLayout. Needs a display, since it lays out real Tk widgets.
+
+Usage:
+    python benchmarks/bench_grid_layout.py [--sizes 100 1000 5000] [--legacy-max 1000]
+"""
+import os
+import sys
+import time
+import argparse
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.grid_layout import SimpleGridLayout
+from src.utils.enhanced_grid_layout import EnhancedGridLayout
+
+
+def make_cards(frame, count):
+    """
+    Create plain frames standing in for task cards.
+    """
+    return [tk.Frame(frame, width=300, height=180) for _ in range(count)]
+
+
+def add_legacy(layout, cards):
+    """
+    Old behaviour: every add triggers a full relayout.
+    """
+    for card in cards:
+        if isinstance(layout, EnhancedGridLayout):
+            layout.items.append((card, 1, 1))
+            layout._perform_full_layout_update(layout.calculate_columns())
+        else:
+            layout.items.append(card)
+            layout.update_layout()
+
+
+def add_batch(layout, cards):
+    """
+    One add_items() call.
+    """
+    layout.add_items(cards)
+
+
+def add_suspended(layout, cards):
+    """
+    add_item() calls inside a suspend() block.
+    """
+    with layout.suspend():
+        for card in cards:
+            layout.add_item(card)
+
+
+def run_case(root, layout_class, add, count):
+    """
+    Time laying out count cards, including Tk's own geometry pass.
+
+    Returns:
+        float: Elapsed milliseconds
+    """
+    frame = tk.Frame(root, width=1280, height=800)
+    frame.pack(fill=tk.BOTH, expand=True)
+    root.update_idletasks()
+    layout = layout_class(frame, min_column_width=320, padding=5)
+    cards = make_cards(frame, count)
+
+    start = time.perf_counter()
+    add(layout, cards)
+    root.update_idletasks()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    frame.destroy()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument(
+        "--legacy-max", type=int, default=1000,
+        help="Skip the quadratic per-item relayout above this many cards"
+    )
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.geometry("1280x800")
+
+    methods = [("per-item relayout", add_legacy), ("add_items", add_batch), ("suspend/resume", add_suspended)]
+    print(f"{'layout':<20} {'method':<20} {'cards':>6} {'ms':>10}")
+    for layout_class in (SimpleGridLayout, EnhancedGridLayout):
+        for count in args.sizes:
+            for name, add in methods:
+                if add is add_legacy and count > args.legacy_max:
+                    print(f"{layout_class.__name__:<20} {name:<20} {count:>6} {'skipped':>10}")
+                    continue
+                elapsed = run_case(root, layout_class, add, count)
+                print(f"{layout_class.__name__:<20} {name:<20} {count:>6} {elapsed:>10.1f}")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Change notifications from the data layer to the UI.
+"""
+
+TASK_ADDED = "task_added"
+TASK_UPDATED = "task_updated"
+TASK_DELETED = "task_deleted"
+DRAFT_ADDED = "draft_added"
+DRAFT_UPDATED = "draft_updated"
+DRAFT_DELETED = "draft_deleted"
+BULK_RELOADED = "bulk_reloaded"
+
+EVENT_TYPES = [
+    TASK_ADDED, TASK_UPDATED, TASK_DELETED,
+    DRAFT_ADDED, DRAFT_UPDATED, DRAFT_DELETED,
+    BULK_RELOADED
+]
+TASK_EVENTS = [TASK_ADDED, TASK_UPDATED, TASK_DELETED, BULK_RELOADED]
+DRAFT_EVENTS = [DRAFT_ADDED, DRAFT_UPDATED, DRAFT_DELETED, BULK_RELOADED]
+
+
+class ChangeEvent:
+    """
+    One change to the stored tasks or drafts.
+
+    Attributes:
+        type (str): One of EVENT_TYPES
+        item_id (str): ID of the changed task or draft, None for bulk_reloaded
+        item (dict): The stored task or draft (as deleted, for deletes). It is
+            the live dict, so a later update may have changed it by the time
+            the event is delivered; previous and sort_keys are not affected
+        changed (frozenset): Names of the fields an update changed
+        previous (dict): Field name -> value before the update
+        sort_keys (dict): Sort option -> index sort key of a task before the
+            update, empty for other events
+    """
+
+    def __init__(self, type, item_id=None, item=None, previous=None, sort_keys=None):
+        self.type = type
+        self.item_id = item_id
+        self.item = item
+        self.previous = previous or {}
+        self.changed = frozenset(self.previous)
+        self.sort_keys = sort_keys or {}
+
+    def __repr__(self):
+        return f"ChangeEvent({self.type}, {self.item_id}, changed={sorted(self.changed)})"
+
+
+class EventBus:
+    """
+    Publish/subscribe hub for ChangeEvents.
+
+    Handlers run in subscription order on the publishing thread, or through
+    dispatch(deliver, event) when a dispatcher is set, e.g. one that moves
+    delivery to the Tk thread. A failing handler is reported and skipped so
+    one view cannot break the others.
+    """
+
+    def __init__(self, dispatch=None):
+        self._handlers = {event_type: [] for event_type in EVENT_TYPES}
+        self.published = {event_type: 0 for event_type in EVENT_TYPES}
+        self.dispatch = dispatch
+
+    def subscribe(self, event_types, handler):
+        """
+        Call handler(event) for every event of the given types.
+
+        Args:
+            event_types (str or list): One event type or a list of them
+            handler (callable): Receives the ChangeEvent
+
+        Returns:
+            callable: Function that removes the subscription again
+        """
+        if isinstance(event_types, str):
+            event_types = [event_types]
+        for event_type in event_types:
+            if event_type not in self._handlers:
+                raise ValueError(f"Unknown event type: {event_type}")
+            self._handlers[event_type].append(handler)
+        return lambda: self.unsubscribe(event_types, handler)
+
+    def unsubscribe(self, event_types, handler):
+        """
+        Remove a handler added with subscribe.
+
+        Args:
+            event_types (str or list): Event types it was subscribed to
+            handler (callable): The handler
+        """
+        if isinstance(event_types, str):
+            event_types = [event_types]
+        for event_type in event_types:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, event):
+        """
+        Deliver an event to its subscribers.
+
+        Args:
+            event (ChangeEvent): The event
+        """
+        self.published[event.type] += 1
+        if self.dispatch is not None:
+            self.dispatch(self._deliver, event)
+        else:
+            self._deliver(event)
+
+    def _deliver(self, event):
+        """
+        Call the subscribers of an event.
+
+        Args:
+            event (ChangeEvent): The event
+        """
+        # Copy so handlers may unsubscribe while the event is delivered
+        for handler in list(self._handlers[event.type]):
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Error in {event.type} handler {handler}: {e}")
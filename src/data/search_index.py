@@ -0,0 +1,356 @@
+"""
+Incremental trigram search index over tasks and drafts.
+"""
+import heapq
+import itertools
+from collections import namedtuple
+
+from .task_index import iter_bits
+
+SearchResult = namedtuple("SearchResult", ["kind", "id", "item", "spans"])
+SearchResult.__doc__ = """
+A search hit.
+
+kind is "task" or "draft", item is the task/draft dict and spans maps a field
+name ("title", "description", "tags") to (start, end) offsets of every match
+in that field's text. Tags are matched against the tags joined with newlines.
+"""
+
+SEARCH_FIELDS = ("title", "description", "tags")
+GRAM = 3
+MAX_INDEXED_CHARS = 1024  # longer fields are indexed up to here and verified by scan
+FIELD_WEIGHTS = {"title": 4, "tags": 2, "description": 1}
+
+
+def field_texts(item):
+    """
+    Extract the searchable text of a task or draft, lower-cased.
+
+    Args:
+        item (dict): Task or draft
+
+    Returns:
+        dict: Field name -> text
+    """
+    return {
+        "title": (item.get("title") or "").lower(),
+        "description": (item.get("description") or "").lower(),
+        "tags": "\n".join(item.get("tags") or []).lower()
+    }
+
+
+def grams_of(text):
+    """
+    Get the distinct trigrams of a text.
+
+    Args:
+        text (str): Text
+
+    Returns:
+        set: Trigrams
+    """
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+def document_grams(texts):
+    """
+    Get the trigrams a document is indexed under.
+
+    Only the first MAX_INDEXED_CHARS characters of each field count, so a
+    long description adds a bounded number of postings.
+
+    Args:
+        texts (dict): Field name -> text, as returned by field_texts
+
+    Returns:
+        tuple: (set of trigrams, bool whether some field was cut)
+    """
+    grams = set()
+    cut = False
+    for text in texts.values():
+        if len(text) > MAX_INDEXED_CHARS:
+            text = text[:MAX_INDEXED_CHARS]
+            cut = True
+        grams |= grams_of(text)
+    return grams, cut
+
+
+def find_spans(text, term):
+    """
+    Find every (possibly overlapping) occurrence of a term.
+
+    Args:
+        text (str): Text to search
+        term (str): Term to find
+
+    Returns:
+        list: (start, end) offsets
+    """
+    spans = []
+    start = text.find(term)
+    while start != -1:
+        spans.append((start, start + len(term)))
+        start = text.find(term, start + 1)
+    return spans
+
+
+class SearchIndex:
+    """
+    Substring search over tasks and drafts backed by a trigram index.
+
+    Like TaskIndex, every document gets a slot and each trigram owns a Python
+    int whose bit N is set when the document in slot N contains it, so a
+    posting costs one bit however often the trigram occurs and a long
+    description adds at most one bit per distinct trigram. Only the first
+    MAX_INDEXED_CHARS characters of a field are indexed.
+
+    A query of three or more characters ANDs the bitsets of its trigrams,
+    adds the documents with a field longer than that and verifies the
+    survivors. Shorter queries scan the documents, which is cheap for the
+    few characters involved.
+
+    rebuild() only queues the documents; index_pending() indexes them in
+    small batches (the UI runs it in idle time) and searches scan them until
+    then, so the results are the same either way. Documents are added,
+    updated and removed one at a time alongside the TaskManager mutations.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty index.
+        """
+        self.slots = []  # slot -> (kind, id), None for a free slot
+        self.slot_by_key = {}  # (kind, id) -> slot
+        self.free_slots = []  # min-heap of reusable slots, keeps bitsets compact
+        self.postings = {}  # trigram -> bits
+        self.long_bits = 0  # documents with a field cut at MAX_INDEXED_CHARS
+        self.documents = {}  # (kind, id) -> (item, field texts as indexed)
+        self.pending = {}  # (kind, id) -> item, queued by rebuild and not indexed yet
+
+    def rebuild(self, tasks, drafts):
+        """
+        Replace the indexed documents, queueing them for index_pending.
+
+        Args:
+            tasks (list): All tasks
+            drafts (list): All drafts
+        """
+        self.__init__()
+        pending = self.pending
+        for task in tasks:
+            pending[("task", task["id"])] = task
+        for draft in drafts:
+            pending[("draft", draft["id"])] = draft
+
+    def index_pending(self, limit=None):
+        """
+        Index documents queued by rebuild.
+
+        Args:
+            limit (int): Maximum number of documents to index, None for all
+
+        Returns:
+            int: Documents still queued
+        """
+        pending = self.pending
+        count = len(pending) if limit is None else min(limit, len(pending))
+        for _ in range(count):
+            (kind, _), item = pending.popitem()
+            self._index(kind, item)
+        return len(pending)
+
+    def add(self, kind, item):
+        """
+        Index a task or draft, replacing any previous version of it.
+
+        Args:
+            kind (str): "task" or "draft"
+            item (dict): Task or draft
+        """
+        self.remove(kind, item["id"])
+        self._index(kind, item)
+
+    def update(self, kind, item):
+        """
+        Re-index a task or draft after it changed.
+
+        Args:
+            kind (str): "task" or "draft"
+            item (dict): Updated task or draft
+        """
+        self.add(kind, item)
+
+    def remove(self, kind, item_id):
+        """
+        Drop a task or draft from the index.
+
+        Args:
+            kind (str): "task" or "draft"
+            item_id (str): ID of the item
+
+        Returns:
+            bool: True if the item was indexed or queued
+        """
+        key = (kind, item_id)
+        if self.pending.pop(key, None) is not None:
+            return True
+        document = self.documents.pop(key, None)
+        if document is None:
+            return False
+
+        # The stored texts are the ones the bits were set for
+        slot = self.slot_by_key.pop(key)
+        mask = ~(1 << slot)
+        postings = self.postings
+        for gram in document_grams(document[1])[0]:
+            bits = postings[gram] & mask
+            if bits:
+                postings[gram] = bits
+            else:
+                del postings[gram]
+        self.long_bits &= mask
+        self.slots[slot] = None
+        heapq.heappush(self.free_slots, slot)
+        return True
+
+    def _index(self, kind, item):
+        """
+        Give a document that is not indexed yet a slot and set its bits.
+        """
+        key = (kind, item["id"])
+        if self.free_slots:
+            slot = heapq.heappop(self.free_slots)
+            self.slots[slot] = key
+        else:
+            slot = len(self.slots)
+            self.slots.append(key)
+        self.slot_by_key[key] = slot
+
+        texts = field_texts(item)
+        grams, cut = document_grams(texts)
+        bit = 1 << slot
+        postings = self.postings
+        for gram in grams:
+            postings[gram] = postings.get(gram, 0) | bit
+        if cut:
+            self.long_bits |= bit
+        self.documents[key] = (item, texts)
+
+    def _texts(self, key):
+        """
+        Get the field texts of an indexed or queued document.
+        """
+        document = self.documents.get(key)
+        if document is not None:
+            return document[1]
+        return field_texts(self.pending[key])
+
+    def _item(self, key):
+        """
+        Get the task or draft of an indexed or queued document.
+        """
+        document = self.documents.get(key)
+        return document[0] if document is not None else self.pending[key]
+
+    def _candidates(self, term):
+        """
+        Get the keys of documents that may contain a term.
+
+        Every candidate still has to be verified against its texts.
+
+        Returns:
+            list: Document keys
+        """
+        if len(term) < GRAM:
+            candidates = list(self.documents)
+        else:
+            postings = self.postings
+            bits = -1
+            for gram in grams_of(term):
+                bits &= postings.get(gram, 0)
+                if not bits:
+                    break
+            slots = self.slots
+            candidates = [slots[slot] for slot in iter_bits(bits | self.long_bits)]
+        candidates.extend(self.pending)
+        return candidates
+
+    def matches(self, kind, item_id, query):
+        """
+        Check whether one item contains a query.
+
+        Args:
+            kind (str): "task" or "draft"
+            item_id (str): ID of the item
+            query (str): Search text (case-insensitive substring)
+
+        Returns:
+            bool: True if the item is indexed or queued and contains the query
+        """
+        key = (kind, item_id)
+        if key not in self.documents and key not in self.pending:
+            return False
+        term = query.lower()
+        return any(term in text for text in self._texts(key).values())
+
+    def match_ids(self, query, kind=None):
+        """
+        Get the IDs of items containing a query, without computing spans.
+
+        Args:
+            query (str): Search text (case-insensitive substring)
+            kind (str): Restrict to "task" or "draft"
+
+        Returns:
+            set: Matching item IDs
+        """
+        term = query.lower()
+        if not term:
+            keys = itertools.chain(self.documents, self.pending)
+            return {item_id for doc_kind, item_id in keys if kind in (None, doc_kind)}
+
+        return {
+            key[1] for key in self._candidates(term)
+            if kind in (None, key[0]) and any(term in text for text in self._texts(key).values())
+        }
+
+    def search(self, query, kinds=None, limit=None):
+        """
+        Search tasks and drafts.
+
+        Args:
+            query (str): Search text (case-insensitive substring)
+            kinds (iterable): Restrict to these kinds ("task", "draft")
+            limit (int): Maximum number of results
+
+        Returns:
+            list: SearchResult items, best first (title matches rank highest)
+        """
+        term = query.lower()
+        if not term:
+            return []
+
+        ranked = []
+        for key in self._candidates(term):
+            if kinds is not None and key[0] not in kinds:
+                continue
+            texts = self._texts(key)
+            spans = {}
+            score = 0
+            for field in SEARCH_FIELDS:
+                found = find_spans(texts[field], term)
+                if found:
+                    spans[field] = found
+                    score += FIELD_WEIGHTS[field]
+            if not spans:
+                continue
+            if texts["title"].startswith(term):
+                score += FIELD_WEIGHTS["title"]
+            ranked.append((-score, texts["title"], key, SearchResult(key[0], key[1], self._item(key), spans)))
+
+        ranked.sort(key=lambda entry: entry[:3])
+        results = [entry[3] for entry in ranked]
+        return results[:limit] if limit is not None else results
+
+    def __len__(self):
+        return len(self.documents) + len(self.pending)
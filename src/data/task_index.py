@@ -0,0 +1,548 @@
+"""
+Bitset indexes over task attributes for fast multi-criteria filtering.
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+
+SORT_OPTIONS = ["Due Date", "Priority", "Created Date", "Title"]
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+
+def iter_bits(bits):
+    """
+    Iterate over the positions of the set bits in an integer, lowest first.
+
+    Works on the binary string so large bitsets are walked in linear time
+    rather than shifting a big int once per bit.
+
+    Args:
+        bits (int): Bitset
+
+    Yields:
+        int: Position of each set bit
+    """
+    flags = bin(bits)[:1:-1]  # lowest bit first, without the "0b" prefix
+    pos = flags.find("1")
+    while pos != -1:
+        yield pos
+        pos = flags.find("1", pos + 1)
+
+
+def bits_from_slots(slots, size):
+    """
+    Build a bitset from slot numbers in linear time.
+
+    Args:
+        slots (iterable): Slot numbers, all below size
+        size (int): Number of slots
+
+    Returns:
+        int: Bitset
+    """
+    buffer = bytearray((size >> 3) + 1)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def count_bits(bits):
+    """
+    Count the set bits in an integer.
+
+    Args:
+        bits (int): Bitset
+
+    Returns:
+        int: Number of set bits
+    """
+    return bin(bits).count("1")
+
+
+def parse_stored_datetime(value):
+    """
+    Parse a stored date string into a naive datetime.
+
+    ISO-8601 strings (what the dialogs write) take the fast path; anything
+    else falls back to dateutil.
+
+    Args:
+        value (str): Stored date string
+
+    Returns:
+        datetime: Parsed value, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        # dateutil is only needed for non-ISO input, so import it on demand
+        from dateutil import parser
+        try:
+            parsed = parser.parse(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+    return parsed.replace(tzinfo=None)
+
+
+def parse_due_date(value):
+    """
+    Parse a stored due date into a date.
+
+    Args:
+        value (str): Stored due date
+
+    Returns:
+        date: Parsed date, or None if missing or unparseable
+    """
+    parsed = parse_stored_datetime(value)
+    return parsed.date() if parsed else None
+
+
+def sort_key(sort_by, task, slot):
+    """
+    Compute the ordering key of a task for one sort option.
+
+    Every key ends with the slot so entries are unique and can be located by
+    bisection; ties fall back to creation order.
+
+    Args:
+        sort_by (str): One of SORT_OPTIONS
+        task (dict): Task
+        slot (int): Slot of the task
+
+    Returns:
+        tuple: Sort key
+    """
+    if sort_by == "Due Date":
+        # Tasks without a (valid) due date go last
+        due = parse_stored_datetime(task.get("due_date"))
+        return (0, due, slot) if due else (1, datetime.max, slot)
+    if sort_by == "Priority":
+        rank = PRIORITY_RANK.get(task.get("priority"), 3)
+        return (rank, task.get("created_at") or "", slot)
+    if sort_by == "Created Date":
+        created = parse_stored_datetime(task.get("created_at")) or datetime.min
+        return (created, slot)
+    if sort_by == "Title":
+        return ((task.get("title") or "").casefold(), slot)
+    raise ValueError(f"Unknown sort option: {sort_by}")
+
+
+class TaskIndex:
+    """
+    Keeps one bitset per attribute value over task slots.
+
+    Every task is given a slot number and each indexed value (status, priority,
+    tag) owns a Python int whose bit N is set when the task in slot N has that
+    value. Combined filters then resolve with plain bitwise AND/OR/NOT instead
+    of scanning every task.
+
+    Due dates are kept in a sorted list of (date ordinal, slot) pairs so date
+    ranges are answered by bisection, and one presorted list of keys per sort
+    option lets a filtered view be read out in order without sorting.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty index.
+        """
+        self.slots = []  # slot -> task dict, None for a free slot
+        self.slot_by_id = {}  # task id -> slot
+        self.free_slots = []  # min-heap of reusable slots, keeps bitsets compact
+        self.all_bits = 0
+        self.status_bits = {}
+        self.priority_bits = {}
+        self.status_counts = {}  # status -> number of tasks, kept in step with the bitsets
+        self.priority_counts = {}  # priority -> number of tasks
+        self.tag_bits = {}  # casefolded tag -> bits
+        self.tag_names = {}  # casefolded tag -> display name
+        self.due_keys = []  # sorted (date ordinal, slot) pairs
+        self.no_due_bits = 0
+        self.orderings = {sort_by: [] for sort_by in SORT_OPTIONS}  # sorted keys, slot last
+        self.due_groups = {}  # (priority, status) -> sorted "Due Date" keys
+        self._sort_keys = {}  # slot -> {sort option: key} as indexed
+        self._indexed = {}  # slot -> (status, priority, tag keys, due key) as indexed
+
+    def rebuild(self, tasks):
+        """
+        Rebuild the index from scratch.
+
+        Args:
+            tasks (list): All tasks
+        """
+        self.__init__()
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task):
+        """
+        Index a new task.
+
+        Args:
+            task (dict): Task to index
+
+        Returns:
+            int: Slot assigned to the task
+        """
+        if self.free_slots:
+            slot = heapq.heappop(self.free_slots)
+            self.slots[slot] = task
+        else:
+            slot = len(self.slots)
+            self.slots.append(task)
+
+        self.slot_by_id[task["id"]] = slot
+        self.all_bits |= 1 << slot
+        self._index_attributes(slot, task)
+        return slot
+
+    def update(self, task):
+        """
+        Re-index a task whose attributes may have changed.
+
+        Args:
+            task (dict): Updated task
+        """
+        slot = self.slot_by_id.get(task["id"])
+        if slot is None:
+            self.add(task)
+            return
+
+        self._unindex_attributes(slot)
+        self.slots[slot] = task
+        self._index_attributes(slot, task)
+
+    def remove(self, task_id):
+        """
+        Drop a task from the index.
+
+        Args:
+            task_id (str): ID of the task to remove
+
+        Returns:
+            bool: True if the task was indexed
+        """
+        slot = self.slot_by_id.pop(task_id, None)
+        if slot is None:
+            return False
+
+        self._unindex_attributes(slot)
+        self.all_bits &= ~(1 << slot)
+        self.slots[slot] = None
+        heapq.heappush(self.free_slots, slot)
+        return True
+
+    def _index_attributes(self, slot, task):
+        """
+        Set the bit for a slot in each of its attribute bitsets.
+        """
+        bit = 1 << slot
+        status = task.get("status")
+        priority = task.get("priority")
+        tag_keys = []
+
+        self.status_bits[status] = self.status_bits.get(status, 0) | bit
+        self.priority_bits[priority] = self.priority_bits.get(priority, 0) | bit
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.priority_counts[priority] = self.priority_counts.get(priority, 0) + 1
+        for tag in task.get("tags") or []:
+            key = tag.casefold()
+            if key in tag_keys:
+                continue
+            tag_keys.append(key)
+            self.tag_bits[key] = self.tag_bits.get(key, 0) | bit
+            self.tag_names.setdefault(key, tag)
+
+        due = parse_due_date(task.get("due_date"))
+        if due is None:
+            due_key = None
+            self.no_due_bits |= bit
+        else:
+            due_key = (due.toordinal(), slot)
+            insort(self.due_keys, due_key)
+
+        self._indexed[slot] = (status, priority, tuple(tag_keys), due_key)
+
+        keys = {}
+        for sort_by, ordering in self.orderings.items():
+            key = sort_key(sort_by, task, slot)
+            insort(ordering, key)
+            keys[sort_by] = key
+        self._sort_keys[slot] = keys
+
+        insort(self.due_groups.setdefault((priority, status), []), keys["Due Date"])
+
+    def _unindex_attributes(self, slot):
+        """
+        Clear the bit for a slot in the bitsets it was indexed under.
+        """
+        status, priority, tag_keys, due_key = self._indexed.pop(slot)
+        mask = ~(1 << slot)
+
+        if due_key is None:
+            self.no_due_bits &= mask
+        else:
+            del self.due_keys[bisect_left(self.due_keys, due_key)]
+
+        keys = self._sort_keys.pop(slot)
+        for sort_by, key in keys.items():
+            ordering = self.orderings[sort_by]
+            del ordering[bisect_left(ordering, key)]
+
+        group = self.due_groups[(priority, status)]
+        del group[bisect_left(group, keys["Due Date"])]
+        if not group:
+            del self.due_groups[(priority, status)]
+
+        self._clear_bit(self.status_bits, status, mask)
+        self._clear_bit(self.priority_bits, priority, mask)
+        self.status_counts[status] -= 1
+        self.priority_counts[priority] -= 1
+        for key in tag_keys:
+            self._clear_bit(self.tag_bits, key, mask)
+            if key not in self.tag_bits:
+                self.tag_names.pop(key, None)
+
+    @staticmethod
+    def _clear_bit(bitsets, key, mask):
+        """
+        Clear bits from one bitset, dropping it once empty.
+        """
+        bits = bitsets.get(key, 0) & mask
+        if bits:
+            bitsets[key] = bits
+        else:
+            bitsets.pop(key, None)
+
+    def status(self, *statuses):
+        """
+        Get the bitset of tasks with any of the given statuses.
+
+        Returns:
+            int: Bitset
+        """
+        bits = 0
+        for status in statuses:
+            bits |= self.status_bits.get(status, 0)
+        return bits
+
+    def priority(self, *priorities):
+        """
+        Get the bitset of tasks with any of the given priorities.
+
+        Returns:
+            int: Bitset
+        """
+        bits = 0
+        for priority in priorities:
+            bits |= self.priority_bits.get(priority, 0)
+        return bits
+
+    def tag(self, *tags):
+        """
+        Get the bitset of tasks carrying any of the given tags (case-insensitive).
+
+        Returns:
+            int: Bitset
+        """
+        bits = 0
+        for tag in tags:
+            bits |= self.tag_bits.get(tag.casefold(), 0)
+        return bits
+
+    def _due_span(self, start=None, end=None):
+        """
+        Locate the due_keys positions covering a date range.
+
+        Args:
+            start (date): First day included, None for unbounded
+            end (date): Last day included, None for unbounded
+
+        Returns:
+            tuple: (lo, hi) positions in due_keys
+        """
+        keys = self.due_keys
+        lo = 0 if start is None else bisect_left(keys, (start.toordinal(), -1))
+        hi = len(keys) if end is None else bisect_right(keys, (end.toordinal(), len(self.slots)))
+        return lo, max(lo, hi)
+
+    def due_between(self, start=None, end=None, slot=None):
+        """
+        Get the bitset of tasks due within a date range (inclusive).
+
+        Args:
+            start (date): First day included, None for unbounded
+            end (date): Last day included, None for unbounded
+            slot (int): Only test this slot, e.g. after one task changed
+
+        Returns:
+            int: Bitset
+        """
+        if slot is not None:
+            indexed = self._indexed.get(slot)
+            if indexed is None or indexed[3] is None:
+                return 0
+            ordinal = indexed[3][0]
+            if start is not None and ordinal < start.toordinal():
+                return 0
+            if end is not None and ordinal > end.toordinal():
+                return 0
+            return 1 << slot
+
+        lo, hi = self._due_span(start, end)
+        return bits_from_slots((slot for _, slot in self.due_keys[lo:hi]), len(self.slots))
+
+    def count_due_between(self, start=None, end=None):
+        """
+        Count tasks due within a date range without materializing them.
+
+        Args:
+            start (date): First day included, None for unbounded
+            end (date): Last day included, None for unbounded
+
+        Returns:
+            int: Number of tasks
+        """
+        lo, hi = self._due_span(start, end)
+        return hi - lo
+
+    def query(self, statuses=None, priorities=None, tags=None,
+              exclude_statuses=None, match_all_tags=False):
+        """
+        Resolve a combined filter to a bitset.
+
+        Values within one criterion are OR-ed, criteria are AND-ed together.
+
+        Args:
+            statuses (iterable): Keep tasks with any of these statuses
+            priorities (iterable): Keep tasks with any of these priorities
+            tags (iterable): Keep tasks with any of these tags
+            exclude_statuses (iterable): Drop tasks with any of these statuses
+            match_all_tags (bool): Require every tag instead of any
+
+        Returns:
+            int: Bitset of matching slots
+        """
+        bits = self.all_bits
+        if statuses:
+            bits &= self.status(*statuses)
+        if priorities:
+            bits &= self.priority(*priorities)
+        if tags:
+            if match_all_tags:
+                for tag in tags:
+                    bits &= self.tag(tag)
+            else:
+                bits &= self.tag(*tags)
+        if exclude_statuses:
+            bits &= ~self.status(*exclude_statuses)
+        return bits
+
+    def tasks_for_bits(self, bits):
+        """
+        Materialize the tasks for a bitset, in slot order.
+
+        Args:
+            bits (int): Bitset of slots
+
+        Returns:
+            list: Tasks
+        """
+        slots = self.slots
+        return [slots[slot] for slot in iter_bits(bits & self.all_bits)]
+
+    def ordered(self, bits, sort_by, reverse=False):
+        """
+        Materialize the tasks for a bitset in a presorted order.
+
+        Walks the maintained ordering and keeps the members of the bitset, so
+        the cost is one pass with no comparisons.
+
+        Args:
+            bits (int): Bitset of slots
+            sort_by (str): One of SORT_OPTIONS
+            reverse (bool): Return the ordering reversed
+
+        Returns:
+            list: Tasks
+        """
+        flags = bin(bits & self.all_bits)[:1:-1]
+        size = len(flags)
+        slots = self.slots
+        ordering = reversed(self.orderings[sort_by]) if reverse else self.orderings[sort_by]
+        return [
+            slots[key[-1]] for key in ordering
+            if key[-1] < size and flags[key[-1]] == "1"
+        ]
+
+    def sort_key_of(self, task_id, sort_by):
+        """
+        Get the key a task is currently filed under in one sort order.
+
+        Two tasks keep their relative order as long as their keys do not
+        change, so comparing a task's key before and after an update tells
+        whether it moved in a sorted view.
+
+        Args:
+            task_id (str): Task ID
+            sort_by (str): Sort option
+
+        Returns:
+            tuple or None: The sort key, None if the task is not indexed
+        """
+        slot = self.slot_by_id.get(task_id)
+        if slot is None or sort_by not in self.orderings:
+            return None
+        return self._sort_keys[slot][sort_by]
+
+    def due_group_heads(self, count, exclude_statuses=()):
+        """
+        Get the earliest-due tasks of every (priority, status) group.
+
+        Any score that only depends on priority and status and rises as the
+        due date gets earlier is maximized by these heads, so a top-K query
+        only has to look at count entries per group.
+
+        Args:
+            count (int): Heads to take from each group
+            exclude_statuses (iterable): Statuses whose groups are skipped
+
+        Returns:
+            list: (due datetime or None, slot) pairs
+        """
+        heads = []
+        for (_, status), keys in self.due_groups.items():
+            if status in exclude_statuses:
+                continue
+            for key in keys[:count]:
+                heads.append((key[1] if key[0] == 0 else None, key[-1]))
+        return heads
+
+    def bits_for_ids(self, task_ids):
+        """
+        Get the bitset for a collection of task IDs.
+
+        Args:
+            task_ids (iterable): Task IDs
+
+        Returns:
+            int: Bitset
+        """
+        slot_by_id = self.slot_by_id
+        slots = (slot_by_id[task_id] for task_id in task_ids if task_id in slot_by_id)
+        return bits_from_slots(slots, len(self.slots))
+
+    def all_tags(self):
+        """
+        Get every indexed tag, sorted case-insensitively.
+
+        Returns:
+            list: Tag display names
+        """
+        return [self.tag_names[key] for key in sorted(self.tag_names)]
+
+    def __len__(self):
+        return len(self.slot_by_id)
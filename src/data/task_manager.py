@@ -1,17 +1,48 @@
 """
 Task management for the ToDo application.
 """
+import functools
+import heapq
+import itertools
+import threading
 import uuid
-from datetime import datetime
-from dateutil import parser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from .json_handler import JsonHandler
+from .task_index import TaskIndex, SORT_OPTIONS, count_bits
+from .search_index import SearchIndex
+from .event_bus import (
+    EventBus, ChangeEvent, TASK_ADDED, TASK_UPDATED, TASK_DELETED,
+    DRAFT_ADDED, DRAFT_UPDATED, DRAFT_DELETED, BULK_RELOADED
+)
+
+def locked(method):
+    """
+    Run a TaskManager method while holding the manager's lock.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class TaskManager:
     """
     Manages all task operations.
+    
+    Public methods are safe to call from any thread: each holds a reentrant
+    lock for its duration. Saves are written by a single writer thread from
+    a snapshot taken under the lock, so callers never wait for disk I/O.
+    Change events are published on the thread that made the change unless
+    the bus has a dispatcher (the UI installs one that moves them to Tk).
     """
     PRIORITY_LEVELS = ["Low", "Medium", "High"]
     STATUS_OPTIONS = ["To Do", "In Progress", "Completed"]
+    SORT_OPTIONS = SORT_OPTIONS
+    PRIORITY_WEIGHTS = {"High": 30, "Medium": 20, "Low": 10}
+    STATUS_WEIGHTS = {"In Progress": 5}
+    DUE_FILTERS = ["Overdue", "Due Today", "Tomorrow", "This Week", "Next 7 Days", "No Due Date"]
     
     def __init__(self, file_path="data/todos.json", drafts_path="data/drafts.json"):
         """
@@ -21,13 +52,37 @@ class TaskManager:
             file_path (str): Path to the tasks JSON file
             drafts_path (str): Path to the drafts JSON file
         """
+        self.lock = threading.RLock()
         self.json_handler = JsonHandler(file_path)
         self.drafts_handler = JsonHandler(drafts_path)
         
+        # One writer thread keeps saves in order; a save queued behind
+        # another for the same file replaces its snapshot
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="todo-writer")
+        self._save_lock = threading.Lock()
+        self._queued_saves = {}  # JsonHandler -> snapshot waiting to be written
+        
         # Load tasks and drafts
         self.tasks = self.json_handler.load_data()
         self.drafts = self.drafts_handler.load_data()
         
+        # Bitset index over task attributes for multi-criteria filtering
+        self.index = TaskIndex()
+        self.index.rebuild(self.tasks)
+        
+        # Substring search index shared by tasks and drafts; documents are
+        # only queued here and indexed later by index_search_step
+        self.search_index = SearchIndex()
+        self.search_index.rebuild(self.tasks, self.drafts)
+        
+        # Per-item versions, bumped on every change so views can skip unchanged items
+        self._version_counter = itertools.count(1)
+        self.versions = {}
+        self._touch_all()
+        
+        # Views subscribe here to hear about changes instead of polling flags
+        self.events = EventBus()
+        
         # Print loaded data for debugging
         print(f"Loaded {len(self.tasks)} tasks from {file_path}")
         print(f"Loaded {len(self.drafts)} drafts from {drafts_path}")
@@ -36,18 +91,93 @@ class TaskManager:
         if self.tasks and len(self.tasks) > 0:
             print(f"First task: {self.tasks[0]['title']} - Status: {self.tasks[0]['status']}")
     
+    @locked
     def refresh_data(self):
         """
         Refresh tasks and drafts data from files.
         
         Returns:
-            tuple: (tasks, drafts) freshly loaded data
+            tuple: (tasks, drafts) freshly loaded data, as copies
         """
+        # Writes still queued would otherwise land after (or race with) the read
+        self.flush_saves()
         self.tasks = self.json_handler.load_data()
         self.drafts = self.drafts_handler.load_data()
+        self.index.rebuild(self.tasks)
+        self.search_index.rebuild(self.tasks, self.drafts)
+        self._touch_all()
         print(f"Refreshed data: {len(self.tasks)} tasks, {len(self.drafts)} drafts")
-        return self.tasks, self.drafts
+        self.events.publish(ChangeEvent(BULK_RELOADED))
+        return list(self.tasks), list(self.drafts)
+    
+    def _save(self, handler, items):
+        """
+        Queue a save of tasks or drafts on the writer thread.
+        
+        Args:
+            handler (JsonHandler): Handler of the file to write
+            items (list): Tasks or drafts to save
+        """
+        # Copy the dicts so later edits cannot change what is being written
+        snapshot = [dict(item) for item in items]
+        with self._save_lock:
+            queued = handler in self._queued_saves
+            self._queued_saves[handler] = snapshot
+        if not queued:
+            self._writer.submit(self._write_queued, handler)
+    
+    def _write_queued(self, handler):
+        """
+        Write the newest snapshot queued for a file (writer thread).
+        
+        Args:
+            handler (JsonHandler): Handler of the file to write
+        """
+        with self._save_lock:
+            snapshot = self._queued_saves.pop(handler, None)
+        if snapshot is not None:
+            handler.save_data(snapshot)
+    
+    def flush_saves(self):
+        """
+        Wait until every queued save has been written.
+        """
+        self._writer.submit(lambda: None).result()
+    
+    def _touch(self, item_id):
+        """
+        Give a task or draft a new version number.
+        
+        Args:
+            item_id (str): ID of the changed item
+        """
+        self.versions[item_id] = next(self._version_counter)
     
+    def _touch_all(self):
+        """
+        Give every task and draft a new version number, e.g. after a reload.
+        """
+        self.versions = {}
+        for item in self.tasks + self.drafts:
+            self._touch(item["id"])
+    
+    @locked
+    def get_version(self, item_id):
+        """
+        Get the current version of a task or draft.
+        
+        Versions are unique and increase on every add, update or reload, so a
+        view can compare them to decide whether its rendering is stale.
+        
+        Args:
+            item_id (str): Task or draft ID
+            
+        Returns:
+            int: Version, or 0 if unknown
+        """
+        return self.versions.get(item_id, 0)
+    
+    @locked
     def add_task(self, title, description="", due_date=None, 
                 priority="Medium", tags=None, status="To Do"):
         """
@@ -80,9 +210,14 @@ class TaskManager:
         }
         
         self.tasks.append(new_task)
-        self.json_handler.save_data(self.tasks)
+        self.index.add(new_task)
+        self.search_index.add("task", new_task)
+        self._touch(new_task["id"])
+        self._save(self.json_handler, self.tasks)
+        self.events.publish(ChangeEvent(TASK_ADDED, new_task["id"], new_task))
         return new_task
     
+    @locked
     def add_draft(self, title, description="", tags=None):
         """
         Add a new draft task.
@@ -107,9 +242,13 @@ class TaskManager:
         }
         
         self.drafts.append(new_draft)
-        self.drafts_handler.save_data(self.drafts)
+        self.search_index.add("draft", new_draft)
+        self._touch(new_draft["id"])
+        self._save(self.drafts_handler, self.drafts)
+        self.events.publish(ChangeEvent(DRAFT_ADDED, new_draft["id"], new_draft))
         return new_draft
     
+    @locked
     def update_task(self, task_id, **kwargs):
         """
         Update an existing task.
@@ -123,6 +262,10 @@ class TaskManager:
         """
         for i, task in enumerate(self.tasks):
             if task["id"] == task_id:
+                before = dict(task)
+                # Views compare these with the new keys to see whether the card moves
+                sort_keys = {sort_by: self.index.sort_key_of(task_id, sort_by) for sort_by in SORT_OPTIONS}
+                
                 # Update task with provided values
                 for key, value in kwargs.items():
                     if key in task:
@@ -136,10 +279,16 @@ class TaskManager:
                     task["completed_at"] = None
                     
                 self.tasks[i] = task
-                self.json_handler.save_data(self.tasks)
+                self.index.update(task)
+                self.search_index.update("task", task)
+                self._touch(task_id)
+                self._save(self.json_handler, self.tasks)
+                previous = {key: value for key, value in before.items() if task.get(key) != value}
+                self.events.publish(ChangeEvent(TASK_UPDATED, task_id, task, previous, sort_keys))
                 return task
         return None
     
+    @locked
     def update_draft(self, draft_id, **kwargs):
         """
         Update an existing draft.
@@ -153,16 +302,23 @@ class TaskManager:
         """
         for i, draft in enumerate(self.drafts):
             if draft["id"] == draft_id:
+                before = dict(draft)
+                
                 # Update draft with provided values
                 for key, value in kwargs.items():
                     if key in draft:
                         draft[key] = value
                     
                 self.drafts[i] = draft
-                self.drafts_handler.save_data(self.drafts)
+                self.search_index.update("draft", draft)
+                self._touch(draft_id)
+                self._save(self.drafts_handler, self.drafts)
+                previous = {key: value for key, value in before.items() if draft.get(key) != value}
+                self.events.publish(ChangeEvent(DRAFT_UPDATED, draft_id, draft, previous))
                 return draft
         return None
     
+    @locked
     def delete_task(self, task_id):
         """
         Delete a task.
@@ -176,10 +332,15 @@ class TaskManager:
         for i, task in enumerate(self.tasks):
             if task["id"] == task_id:
                 del self.tasks[i]
-                self.json_handler.save_data(self.tasks)
+                self.index.remove(task_id)
+                self.search_index.remove("task", task_id)
+                self.versions.pop(task_id, None)
+                self._save(self.json_handler, self.tasks)
+                self.events.publish(ChangeEvent(TASK_DELETED, task_id, task))
                 return True
         return False
     
+    @locked
     def delete_draft(self, draft_id):
         """
         Delete a draft.
@@ -193,28 +354,121 @@ class TaskManager:
         for i, draft in enumerate(self.drafts):
             if draft["id"] == draft_id:
                 del self.drafts[i]
-                self.drafts_handler.save_data(self.drafts)
+                self.search_index.remove("draft", draft_id)
+                self.versions.pop(draft_id, None)
+                self._save(self.drafts_handler, self.drafts)
+                self.events.publish(ChangeEvent(DRAFT_DELETED, draft_id, draft))
                 return True
         return False
     
+    @locked
     def get_all_tasks(self):
         """
         Get all tasks.
         
+        The list is a copy taken under the lock, so it can be iterated on any
+        thread while other threads add or delete tasks.
+        
         Returns:
             list: All tasks
         """
-        return self.tasks
+        return list(self.tasks)
     
+    @locked
     def get_all_drafts(self):
         """
         Get all draft tasks.
         
+        Like get_all_tasks, returns a copy taken under the lock.
+        
         Returns:
             list: All draft tasks
         """
-        return self.drafts
+        return list(self.drafts)
+    
+    @locked
+    def get_sorted_tasks(self, bits=None, sort_by="Due Date"):
+        """
+        Get tasks in a sort order, optionally restricted to an index bitset.
+        
+        Uses the orderings maintained by the index, so no comparison sort runs.
+        
+        Args:
+            bits (int): Bitset of task slots from the index, None for all tasks
+            sort_by (str): One of SORT_OPTIONS
+            
+        Returns:
+            list: Sorted tasks
+        """
+        if bits is None:
+            bits = self.index.all_bits
+        return self.index.ordered(bits, sort_by)
+    
+    @locked
+    def search(self, query, kinds=None, limit=None):
+        """
+        Search tasks and drafts by title, description and tags.
+        
+        Args:
+            query (str): Case-insensitive substring
+            kinds (iterable): Restrict to "task" and/or "draft"
+            limit (int): Maximum number of results
+            
+        Returns:
+            list: SearchResult items with highlight spans, best first
+        """
+        return self.search_index.search(query, kinds=kinds, limit=limit)
+    
+    @locked
+    def index_search_step(self, limit=10):
+        """
+        Index a batch of the documents queued since the last (re)load.
+        
+        Searches give the same results either way; indexed documents are
+        just found without a scan. The UI calls this in idle time.
+        
+        Args:
+            limit (int): Maximum number of documents to index
+            
+        Returns:
+            int: Documents still waiting to be indexed
+        """
+        return self.search_index.index_pending(limit)
+    
+    @locked
+    def search_task_bits(self, query, slot=None):
+        """
+        Get the index bitset of tasks matching a search query.
+        
+        Args:
+            query (str): Case-insensitive substring
+            slot (int): Only test the task in this slot, e.g. after it changed
+            
+        Returns:
+            int: Bitset of task slots
+        """
+        if slot is not None:
+            task = self.index.slots[slot]
+            return 1 << slot if task and self.search_index.matches("task", task["id"], query) else 0
+        return self.index.bits_for_ids(self.search_index.match_ids(query, kind="task"))
     
+    @locked
+    def search_drafts(self, query):
+        """
+        Get drafts matching a search query, in their stored order.
+        
+        Args:
+            query (str): Case-insensitive substring
+            
+        Returns:
+            list: Matching drafts
+        """
+        if not query:
+            return list(self.drafts)
+        ids = self.search_index.match_ids(query, kind="draft")
+        return [draft for draft in self.drafts if draft["id"] in ids]
+    
+    @locked
     def get_task_by_id(self, task_id):
         """
         Get a task by ID.
@@ -225,11 +479,10 @@ class TaskManager:
         Returns:
             dict: Task or None if not found
         """
-        for task in self.tasks:
-            if task["id"] == task_id:
-                return task
-        return None
+        slot = self.index.slot_by_id.get(task_id)
+        return self.index.slots[slot] if slot is not None else None
     
+    @locked
     def get_draft_by_id(self, draft_id):
         """
         Get a draft by ID.
@@ -245,6 +498,7 @@ class TaskManager:
                 return draft
         return None
     
+    @locked
     def get_tasks_by_status(self, status):
         """
         Get tasks by status.
@@ -255,8 +509,9 @@ class TaskManager:
         Returns:
             list: Tasks with the specified status
         """
-        return [task for task in self.tasks if task["status"] == status]
+        return self.index.tasks_for_bits(self.index.status(status))
     
+    @locked
     def get_tasks_by_priority(self, priority):
         """
         Get tasks by priority.
@@ -267,11 +522,12 @@ class TaskManager:
         Returns:
             list: Tasks with the specified priority
         """
-        return [task for task in self.tasks if task["priority"] == priority]
+        return self.index.tasks_for_bits(self.index.priority(priority))
     
+    @locked
     def get_tasks_by_tag(self, tag):
         """
-        Get tasks by tag.
+        Get tasks by tag (case-insensitive).
         
         Args:
             tag (str): Task tag
@@ -279,8 +535,133 @@ class TaskManager:
         Returns:
             list: Tasks with the specified tag
         """
-        return [task for task in self.tasks if tag in task["tags"]]
+        return self.index.tasks_for_bits(self.index.tag(tag))
+    
+    @locked
+    def get_all_tags(self):
+        """
+        Get every tag used by at least one task.
+        
+        Returns:
+            list: Tag names sorted case-insensitively
+        """
+        return self.index.all_tags()
+    
+    @locked
+    def filter_tasks(self, statuses=None, priorities=None, tags=None,
+                     exclude_statuses=None, match_all_tags=False):
+        """
+        Get tasks matching a combination of criteria.
+        
+        Values within a criterion are OR-ed and criteria are AND-ed, e.g.
+        ``filter_tasks(priorities=["High"], tags=["work"],
+        exclude_statuses=["Completed"])``.
+        
+        Args:
+            statuses (iterable): Statuses to keep
+            priorities (iterable): Priorities to keep
+            tags (iterable): Tags to keep
+            exclude_statuses (iterable): Statuses to drop
+            match_all_tags (bool): Require every tag instead of any
+            
+        Returns:
+            list: Matching tasks
+        """
+        bits = self.index.query(
+            statuses=statuses,
+            priorities=priorities,
+            tags=tags,
+            exclude_statuses=exclude_statuses,
+            match_all_tags=match_all_tags
+        )
+        return self.index.tasks_for_bits(bits)
+    
+    @staticmethod
+    def get_due_range(name, today=None):
+        """
+        Resolve a relative due-date filter to a date range.
+        
+        Args:
+            name (str): One of DUE_FILTERS other than "No Due Date"
+            today (date): Reference day, defaults to the current date
+            
+        Returns:
+            tuple: (start, end) dates, inclusive; None means unbounded
+        """
+        if today is None:
+            today = datetime.now().date()
+        
+        if name == "Overdue":
+            return None, today - timedelta(days=1)
+        if name == "Due Today":
+            return today, today
+        if name == "Tomorrow":
+            tomorrow = today + timedelta(days=1)
+            return tomorrow, tomorrow
+        if name == "This Week":
+            # Monday through Sunday of the current week
+            start = today - timedelta(days=today.weekday())
+            return start, start + timedelta(days=6)
+        if name == "Next 7 Days":
+            return today, today + timedelta(days=6)
+        raise ValueError(f"Unknown due filter: {name}")
     
+    @locked
+    def get_due_filter_bits(self, name, today=None, slot=None):
+        """
+        Get the index bitset for a due-date filter.
+        
+        Args:
+            name (str): One of DUE_FILTERS
+            today (date): Reference day, defaults to the current date
+            slot (int): Only test this slot; other bits may be set too
+            
+        Returns:
+            int: Bitset of matching task slots
+        """
+        if name == "No Due Date":
+            return self.index.no_due_bits
+        start, end = self.get_due_range(name, today)
+        return self.index.due_between(start, end, slot=slot)
+    
+    @locked
+    def get_due_filter_counts(self, today=None):
+        """
+        Count tasks for every due-date filter.
+        
+        Range counts come straight from bisecting the due-date index, so this
+        is cheap enough to call whenever the filter dropdown opens.
+        
+        Args:
+            today (date): Reference day, defaults to the current date
+            
+        Returns:
+            dict: Filter name -> task count
+        """
+        counts = {}
+        for name in self.DUE_FILTERS:
+            if name == "No Due Date":
+                counts[name] = count_bits(self.index.no_due_bits)
+            else:
+                start, end = self.get_due_range(name, today)
+                counts[name] = self.index.count_due_between(start, end)
+        return counts
+    
+    @locked
+    def get_tasks_due_between(self, start=None, end=None):
+        """
+        Get tasks due within a date range.
+        
+        Args:
+            start (date): First day included, None for unbounded
+            end (date): Last day included, None for unbounded
+            
+        Returns:
+            list: Tasks due in the range
+        """
+        return self.index.tasks_for_bits(self.index.due_between(start, end))
+    
+    @locked
     def get_tasks_due_today(self):
         """
         Get tasks due today.
@@ -288,15 +669,11 @@ class TaskManager:
         Returns:
             list: Tasks due today
         """
-        today = datetime.now().date()
-        due_today = [
-            task for task in self.tasks 
-            if task["due_date"] and 
-            parser.parse(task["due_date"]).date() == today
-        ]
-        print(f"Due today: {len(due_today)} tasks, today is {today}")
+        due_today = self.index.tasks_for_bits(self.get_due_filter_bits("Due Today"))
+        print(f"Due today: {len(due_today)} tasks, today is {datetime.now().date()}")
         return due_today
     
+    @locked
     def get_tasks_overdue(self):
         """
         Get overdue tasks.
@@ -304,16 +681,78 @@ class TaskManager:
         Returns:
             list: Overdue tasks
         """
-        today = datetime.now().date()
-        overdue = [
-            task for task in self.tasks 
-            if (task["status"] != "Completed" and
-               task["due_date"] and 
-               parser.parse(task["due_date"]).date() < today)
-        ]
-        print(f"Overdue: {len(overdue)} tasks, today is {today}")
+        bits = self.get_due_filter_bits("Overdue") & ~self.index.status("Completed")
+        overdue = self.index.tasks_for_bits(bits)
+        print(f"Overdue: {len(overdue)} tasks, today is {datetime.now().date()}")
         return overdue
     
+    @classmethod
+    def urgency_score(cls, task, due, today=None):
+        """
+        Score how urgent an open task is.
+        
+        Priority and status give a base weight. Overdue tasks score highest
+        and keep rising with overdue age, tasks due today come next, and the
+        due-date bonus fades out over the following ten days. The score never
+        drops as the due date moves earlier, which top_tasks relies on.
+        
+        Args:
+            task (dict): Task
+            due (datetime): Parsed due date, or None
+            today (date): Reference day, defaults to the current date
+            
+        Returns:
+            int: Urgency score, higher is more urgent
+        """
+        if today is None:
+            today = datetime.now().date()
+        
+        score = cls.PRIORITY_WEIGHTS.get(task.get("priority"), 0)
+        score += cls.STATUS_WEIGHTS.get(task.get("status"), 0)
+        
+        if due is not None:
+            days = (due.date() - today).days
+            if days < 0:
+                score += 40 + min(-days, 30)
+            elif days == 0:
+                score += 35
+            else:
+                score += max(0, 30 - 3 * days)
+        return score
+    
+    @locked
+    def top_tasks(self, k=5, today=None):
+        """
+        Get the K most urgent open tasks.
+        
+        Only the earliest-due heads of each (priority, status) group can make
+        the top K, so heapq.nlargest runs over a handful of candidates instead
+        of every task.
+        
+        Args:
+            k (int): Number of tasks to return
+            today (date): Reference day, defaults to the current date
+            
+        Returns:
+            list: Tasks, most urgent first
+        """
+        if k <= 0:
+            return []
+        if today is None:
+            today = datetime.now().date()
+        
+        slots = self.index.slots
+        scored = (
+            (-self.urgency_score(slots[slot], due, today), due or datetime.max, slot)
+            for due, slot in self.index.due_group_heads(k, exclude_statuses=("Completed",))
+        )
+        # Ties go to the earlier due date, then the lower slot: the order the
+        # heads are taken in, so a capped score cannot favour a task that is
+        # not a head
+        top = heapq.nsmallest(k, scored)
+        return [slots[slot] for _, _, slot in top]
+    
+    @locked
     def get_stats(self):
         """
         Get task statistics.
@@ -321,19 +760,22 @@ class TaskManager:
         Returns:
             dict: Task statistics
         """
+        # Status and priority counts are kept up to date by the index
+        status_counts = self.index.status_counts
+        priority_counts = self.index.priority_counts
         total = len(self.tasks)
-        completed = len([t for t in self.tasks if t["status"] == "Completed"])
-        in_progress = len([t for t in self.tasks if t["status"] == "In Progress"])
-        todo = len([t for t in self.tasks if t["status"] == "To Do"])
+        completed = status_counts.get("Completed", 0)
+        in_progress = status_counts.get("In Progress", 0)
+        todo = status_counts.get("To Do", 0)
         
         priority_stats = {
-            "Low": len([t for t in self.tasks if t["priority"] == "Low"]),
-            "Medium": len([t for t in self.tasks if t["priority"] == "Medium"]),
-            "High": len([t for t in self.tasks if t["priority"] == "High"])
+            "Low": priority_counts.get("Low", 0),
+            "Medium": priority_counts.get("Medium", 0),
+            "High": priority_counts.get("High", 0)
         }
         
-        overdue = len(self.get_tasks_overdue())
-        due_today = len(self.get_tasks_due_today())
+        overdue = count_bits(self.get_due_filter_bits("Overdue") & ~self.index.status("Completed"))
+        due_today = self.index.count_due_between(*self.get_due_range("Due Today"))
         draft_count = len(self.drafts)
         
         return {
@@ -1,6 +1,17 @@
 """
 UI package for the ToDo application.
 """
-from .edit_draft_dialog import EditDraftDialog
-from .view_task_dialog import ViewTaskDialog
-from .view_draft_dialog import ViewDraftDialog
+import importlib
+
+# Dialogs are imported on first use so importing the package stays cheap
+_LAZY_EXPORTS = {
+    "EditDraftDialog": ".edit_draft_dialog",
+    "ViewTaskDialog": ".view_task_dialog",
+    "ViewDraftDialog": ".view_draft_dialog",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,13 +6,16 @@ from tkinter import ttk, messagebox
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 
-from ..utils.helpers import center_window
+from .dialog_manager import ReusableDialog
 
-class AddDraftDialog:
+class AddDraftDialog(ReusableDialog):
     """
     Dialog for creating a new draft task.
     """
     
+    TITLE = "Add Draft Task"
+    SIZE = (650, 450)
+    
     def __init__(self, parent, task_manager):
         """
         Initialize the add draft dialog.
@@ -21,26 +24,18 @@ class AddDraftDialog:
             parent: Parent window
             task_manager: TaskManager instance
         """
-        self.parent = parent
-        self.task_manager = task_manager
-        
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title("Add Draft Task")
-        self.top.geometry("650x450")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
-        
-        # Initialize variables
-        self.title_var = tk.StringVar()
-        self.tags_var = tk.StringVar()
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+        self.title_var = tk.StringVar(parent)
+        self.tags_var = tk.StringVar(parent)
+        
+        super().__init__(parent, task_manager)
+    
+    def _populate(self):
+        """
+        Clear the fields for a new draft.
+        """
+        self.title_var.set("")
+        self.tags_var.set("")
+        self._set_text(self.description_text, "")
     
     def _create_widgets(self):
         """
@@ -97,7 +92,7 @@ class AddDraftDialog:
         ttk.Button(
             button_frame,
             text="Cancel",
-            command=self.top.destroy,
+            command=self.close,
             width=15,
             style="secondary.TButton"
         ).pack(side=RIGHT, padx=5)
@@ -138,4 +133,4 @@ class AddDraftDialog:
             tags=tags
         )
         
-        self.top.destroy()
+        self.close()
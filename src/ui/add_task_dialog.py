@@ -9,13 +9,16 @@ from ttkbootstrap.dialogs import Querybox
 from datetime import datetime
 import re
 
-from ..utils.helpers import center_window, format_date, get_centered_date
+from ..utils.helpers import format_date, get_centered_date
+from .dialog_manager import ReusableDialog
 
-class AddTaskDialog:
+class AddTaskDialog(ReusableDialog):
     """
     Dialog for creating a new task.
     """
     
+    TITLE = "Add New Task"
+    
     def __init__(self, parent, task_manager):
         """
         Initialize the add task dialog.
@@ -24,36 +27,28 @@ class AddTaskDialog:
             parent: Parent window
             task_manager: TaskManager instance
         """
-        self.parent = parent
-        self.task_manager = task_manager
+        self.due_date_var = tk.StringVar(parent)
+        self.title_var = tk.StringVar(parent)
+        self.priority_var = tk.StringVar(parent)
+        self.status_var = tk.StringVar(parent)
+        self.tags_var = tk.StringVar(parent)
         
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title("Add New Task")
-        self.top.geometry("650x500")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
+        super().__init__(parent, task_manager)
         
         # Configure dialog appearance to match theme
         self.top.configure(bg="#1C1C1C")
-        style = ttk.Style(self.top)
-        
-        # Set default due date to today
-        today = datetime.now().isoformat()
-        self.due_date_var = tk.StringVar(value=today)
-        
-        # Initialize other variables
-        self.title_var = tk.StringVar()
-        self.priority_var = tk.StringVar(value="Medium")
-        self.status_var = tk.StringVar(value="To Do")
-        self.tags_var = tk.StringVar()
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+    
+    def _populate(self):
+        """
+        Reset the fields to their defaults for a new task.
+        """
+        # Default due date is today
+        self.due_date_var.set(datetime.now().isoformat())
+        self.title_var.set("")
+        self.priority_var.set("Medium")
+        self.status_var.set("To Do")
+        self.tags_var.set("")
+        self._set_text(self.description_text, "")
     
     def _create_widgets(self):
         """
@@ -149,7 +144,7 @@ class AddTaskDialog:
         ttk.Button(
             button_frame,
             text="Cancel",
-            command=self.top.destroy,
+            command=self.close,
             width=15,
             style="secondary.TButton"
         ).pack(side=RIGHT, padx=5)
@@ -213,4 +208,4 @@ class AddTaskDialog:
             status=status
         )
         
-        self.top.destroy()
+        self.close()
@@ -8,52 +8,51 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Querybox
 from datetime import datetime
 
-from ..utils.helpers import center_window, format_date, get_centered_date
+from ..utils.helpers import format_date, get_centered_date
+from .dialog_manager import ReusableDialog
 
-class AssignDraftDialog:
+class AssignDraftDialog(ReusableDialog):
     """
     Dialog for assigning a draft task.
     """
     
-    def __init__(self, parent, task_manager, draft):
+    TITLE = "Assign Draft Task"
+    
+    def __init__(self, parent, task_manager):
         """
         Initialize the assign draft dialog.
         
         Args:
             parent: Parent window
             task_manager: TaskManager instance
+        """
+        self.draft = None
+        self.title_var = tk.StringVar(parent)
+        self.priority_var = tk.StringVar(parent)
+        self.status_var = tk.StringVar(parent)
+        self.due_date_var = tk.StringVar(parent)
+        self.tags_var = tk.StringVar(parent)
+        
+        super().__init__(parent, task_manager)
+    
+    def _populate(self, draft):
+        """
+        Fill the fields in from the draft being assigned.
+        
+        Args:
             draft: Draft task to assign
         """
-        self.parent = parent
-        self.task_manager = task_manager
         self.draft = draft
+        self.title_var.set(draft["title"])
+        self.priority_var.set("Medium")
+        self.status_var.set("To Do")
         
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title("Assign Draft Task")
-        self.top.geometry("650x500")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
-        
-        # Initialize variables
-        self.title_var = tk.StringVar(value=draft["title"])
-        self.priority_var = tk.StringVar(value="Medium")
-        self.status_var = tk.StringVar(value="To Do")
-        
-        # Set default due date to today
-        today = datetime.now().isoformat()
-        self.due_date_var = tk.StringVar(value=today)
+        # Default due date is today
+        self.due_date_var.set(datetime.now().isoformat())
         
         # Format the tags
-        tags_text = ", ".join(draft["tags"]) if draft["tags"] else ""
-        self.tags_var = tk.StringVar(value=tags_text)
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+        self.tags_var.set(", ".join(draft["tags"]) if draft["tags"] else "")
+        self._set_text(self.description_text, draft["description"])
     
     def _create_widgets(self):
         """
@@ -142,10 +141,6 @@ class AssignDraftDialog:
         self.description_text.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=RIGHT, fill=Y)
         
-        # Set the description text
-        if self.draft["description"]:
-            self.description_text.insert("1.0", self.draft["description"])
-        
         desc_frame.grid(row=5, column=1, columnspan=3, sticky=(N, S, E, W), pady=(10, 10))
         
         # Action buttons
@@ -153,7 +148,7 @@ class AssignDraftDialog:
         ttk.Button(
             button_frame,
             text="Cancel",
-            command=self.top.destroy,
+            command=self.close,
             width=15,
             style="secondary.TButton"
         ).pack(side=RIGHT, padx=5)
@@ -220,4 +215,4 @@ class AssignDraftDialog:
         # Delete the draft
         self.task_manager.delete_draft(self.draft["id"])
         
-        self.top.destroy()
+        self.close()
@@ -0,0 +1,332 @@
+"""
+Task cards drawn as canvas items instead of widget trees.
+"""
+
+from ..utils.card_template import card_font
+from .dialog_manager import dialog_manager_for
+from .view_models import TaskViewModel
+
+# Colors from the custom dark theme
+CARD_BG = "#3D3D3D"
+BORDER = "#5E5E5E"
+SECONDARY_TEXT = "#7F7F7F"
+PRIMARY_TEXT = "#FFFFFF"
+ACCENT_COLORS = {"High": "#FF5252", "Medium": "#FFD740", "Low": "#4FC3F7"}
+SUCCESS = "#66BB6A"
+
+CARD_TAG = "task_card"  # Every item of every canvas card carries this tag
+ACTIONS = ("toggle", "view", "edit", "delete")
+
+
+class CanvasCardRenderer:
+    """
+    Draws task cards as canvas items and dispatches clicks on them.
+
+    A card is a dozen canvas items (rectangles, text and tag chips) sharing
+    the card's own tag, so one card costs no widgets at all. A single click
+    binding on the shared card tag hit-tests the item under the pointer and
+    calls the same on_status_change / on_edit / on_delete callbacks that
+    TaskFrame uses.
+    """
+
+    def __init__(self, canvas, content_frame, on_status_change, on_edit, on_delete, view_models=None):
+        """
+        Initialize the renderer.
+
+        Args:
+            canvas: Canvas to draw on
+            content_frame: Frame inside the canvas window that grid positions are relative to
+            on_status_change (callable): Callback for status change
+            on_edit (callable): Callback for edit action
+            on_delete (callable): Callback for delete action
+            view_models (ViewModelCache): Display-field cache shared with TaskFrame
+        """
+        self.canvas = canvas
+        self.view_models = view_models
+        self.content_frame = content_frame
+        self.on_status_change = on_status_change
+        self.on_edit = on_edit
+        self.on_delete = on_delete
+        self.cards = {}  # card tag -> CanvasTaskCard
+        self._next_id = 0
+        self._widths = {}  # (font name, text) -> measured width
+
+        # Same named fonts as the widget cards
+        self.title_font = card_font("CardTitle")
+        self.text_font = card_font("CardText")
+        self.chip_font = card_font("CardChip")
+        self.icon_font = card_font("CardIcon")
+
+        canvas.tag_bind(CARD_TAG, "<Button-1>", self._on_click)
+        for action in ACTIONS:
+            canvas.tag_bind(action, "<Enter>", lambda e: self.canvas.configure(cursor="hand2"))
+            canvas.tag_bind(action, "<Leave>", lambda e: self.canvas.configure(cursor=""))
+
+    def create_card(self, task):
+        """
+        Draw a new card for a task.
+
+        Args:
+            task (dict): Task data
+
+        Returns:
+            CanvasTaskCard: The new card, hidden until placed
+        """
+        self._next_id += 1
+        card = CanvasTaskCard(self, f"card{self._next_id}", task)
+        self.cards[card.tag] = card
+        return card
+
+    def view_model(self, task):
+        """
+        Get the display fields of a task.
+
+        Args:
+            task (dict): Task data
+
+        Returns:
+            TaskViewModel: Cached if the renderer has a cache, else fresh
+        """
+        if self.view_models is not None:
+            return self.view_models.get(task)
+        return TaskViewModel(task)
+
+    def measure(self, font, text):
+        """
+        Get the pixel width of a text, cached for badge and chip labels.
+
+        Args:
+            font: tkinter Font
+            text (str): Text to measure
+
+        Returns:
+            int: Width in pixels
+        """
+        key = (font.name, text)
+        width = self._widths.get(key)
+        if width is None:
+            width = font.measure(text)
+            self._widths[key] = width
+        return width
+
+    def item_count(self):
+        """
+        Count the canvas items used by all cards, for diagnostics.
+
+        Returns:
+            int: Number of canvas items
+        """
+        return len(self.canvas.find_withtag(CARD_TAG))
+
+    def _on_click(self, event):
+        """
+        Hit-test a click and dispatch it to the card's action.
+        """
+        current = self.canvas.find_withtag("current")
+        if not current:
+            return
+        tags = self.canvas.gettags(current[0])
+        card = next((self.cards[tag] for tag in tags if tag in self.cards), None)
+        if card is None:
+            return
+
+        task = card.task
+        if "toggle" in tags:
+            new_status = "To Do" if task["status"] == "Completed" else "Completed"
+            self.on_status_change(task["id"], new_status)
+        elif "view" in tags:
+            dialog_manager_for(self.canvas).show("view_task", task)
+        elif "edit" in tags:
+            self.on_edit(task["id"])
+        elif "delete" in tags:
+            self.on_delete(task["id"])
+
+
+class CanvasTaskCard:
+    """
+    One task card drawn on the renderer's canvas.
+
+    Offers the parts of the card widget interface that the grid layout and
+    the widget pool use (place, place_forget, update_task, destroy), so it
+    can stand in for a TaskFrame.
+    """
+
+    def __init__(self, renderer, tag, task):
+        """
+        Create the card's canvas items.
+
+        Args:
+            renderer (CanvasCardRenderer): Owning renderer
+            tag (str): Canvas tag unique to this card
+            task (dict): Task data
+        """
+        self.renderer = renderer
+        self.canvas = renderer.canvas
+        self.tag = tag
+        self.task = task
+        self.view_model = renderer.view_model(task)
+        self.geometry = None  # (x, y, width, height) in canvas coordinates
+        self.visible = False
+        self.chip_items = []  # (rectangle, text, tag name) per tag chip
+        self.overflow = []  # chip items that did not fit and stay hidden
+
+        canvas = self.canvas
+        tags = (CARD_TAG, tag)
+        self.bg = canvas.create_rectangle(0, 0, 0, 0, fill=CARD_BG, width=1, tags=tags)
+        self.accent = canvas.create_rectangle(0, 0, 0, 0, width=0, tags=tags)
+        self.toggle_box = canvas.create_rectangle(0, 0, 0, 0, outline=SECONDARY_TEXT, width=2, tags=tags + ("toggle",))
+        self.toggle_mark = canvas.create_text(0, 0, text="✓", fill=PRIMARY_TEXT, font=renderer.title_font, tags=tags + ("toggle",))
+        self.title = canvas.create_text(0, 0, anchor="nw", font=renderer.title_font, tags=tags)
+        self.view_icon = canvas.create_text(0, 0, anchor="n", text="👁", fill=PRIMARY_TEXT, font=renderer.icon_font, tags=tags + ("view",))
+        self.edit_icon = canvas.create_text(0, 0, anchor="n", text="✍", fill=ACCENT_COLORS["Low"], font=renderer.icon_font, tags=tags + ("edit",))
+        self.delete_icon = canvas.create_text(0, 0, anchor="n", text="🗑", fill=ACCENT_COLORS["High"], font=renderer.icon_font, tags=tags + ("delete",))
+        self.badge_bg = canvas.create_rectangle(0, 0, 0, 0, width=0, tags=tags)
+        self.badge_text = canvas.create_text(0, 0, anchor="nw", fill=PRIMARY_TEXT, font=renderer.text_font, tags=tags)
+        self.status_text = canvas.create_text(0, 0, anchor="nw", fill=PRIMARY_TEXT, font=renderer.text_font, tags=tags)
+        self.due_text = canvas.create_text(0, 0, anchor="nw", fill=PRIMARY_TEXT, font=renderer.text_font, tags=tags)
+        self.desc_text = canvas.create_text(0, 0, anchor="nw", fill=SECONDARY_TEXT, font=renderer.text_font, tags=tags)
+        canvas.itemconfigure(tag, state="hidden")
+
+        self._populate()
+
+    def update_task(self, task):
+        """
+        Show a (possibly different) task on this card.
+
+        Args:
+            task (dict): Task data
+        """
+        self.task = task
+        view_model = self.renderer.view_model(task)
+        if view_model is self.view_model:
+            # Same task version as already drawn
+            return
+        self.view_model = view_model
+        self._populate()
+        if self.geometry:
+            self._layout()
+
+    def place(self, x=0, y=0, width=300, height=180, **kwargs):
+        """
+        Move the card to a cell of its content frame and show it.
+
+        Args:
+            x, y (int): Position within the content frame
+            width, height (int): Card size
+        """
+        frame = self.renderer.content_frame
+        geometry = (x + frame.winfo_x(), y + frame.winfo_y(), width, height)
+        if geometry != self.geometry:
+            old = self.geometry
+            self.geometry = geometry
+            if old is not None and old[2:] == geometry[2:]:
+                # Same size: shift every item in one call
+                self.canvas.move(self.tag, geometry[0] - old[0], geometry[1] - old[1])
+            else:
+                self._layout()
+        if not self.visible:
+            self.visible = True
+            self.canvas.itemconfigure(self.tag, state="normal")
+            # Showing the card tag also showed items that should stay hidden
+            if not self.view_model.completed:
+                self.canvas.itemconfigure(self.toggle_mark, state="hidden")
+            for item in self.overflow:
+                self.canvas.itemconfigure(item, state="hidden")
+
+    def place_forget(self):
+        """
+        Hide the card.
+        """
+        if self.visible:
+            self.canvas.itemconfigure(self.tag, state="hidden")
+            self.visible = False
+
+    def destroy(self):
+        """
+        Delete the card's canvas items.
+        """
+        self.canvas.delete(self.tag)
+        self.renderer.cards.pop(self.tag, None)
+
+    def _populate(self):
+        """
+        Set colors and texts from the current view model.
+        """
+        canvas = self.canvas
+        view_model = self.view_model
+        completed = view_model.completed
+        accent = SUCCESS if completed else ACCENT_COLORS.get(view_model.priority, BORDER)
+
+        canvas.itemconfigure(self.bg, outline=accent)
+        canvas.itemconfigure(self.accent, fill=accent)
+        canvas.itemconfigure(self.toggle_box, fill=SUCCESS if completed else "")
+        canvas.itemconfigure(self.toggle_mark, state="normal" if completed and self.visible else "hidden")
+
+        title_color = SUCCESS if completed else (ACCENT_COLORS["High"] if view_model.priority == "High" else PRIMARY_TEXT)
+        canvas.itemconfigure(self.title, text=view_model.short_title, fill=title_color)
+
+        canvas.itemconfigure(self.badge_bg, fill=ACCENT_COLORS.get(view_model.priority, BORDER))
+        canvas.itemconfigure(self.badge_text, text=view_model.priority)
+        canvas.itemconfigure(self.status_text, text=view_model.status_text)
+        canvas.itemconfigure(self.due_text, text=view_model.due_text)
+        canvas.itemconfigure(self.desc_text, text=view_model.description)
+
+        # Tag chips are few and vary per task, so they are simply redrawn
+        for rect, text, _ in self.chip_items:
+            canvas.delete(rect, text)
+        self.chip_items = []
+        self.overflow = []
+        tags = (CARD_TAG, self.tag)
+        for tag in view_model.tags:
+            self.chip_items.append((
+                canvas.create_rectangle(0, 0, 0, 0, fill=BORDER, width=0, state="hidden", tags=tags),
+                canvas.create_text(0, 0, anchor="nw", text=tag, fill=PRIMARY_TEXT, font=self.renderer.chip_font, state="hidden", tags=tags),
+                tag
+            ))
+
+    def _layout(self):
+        """
+        Position every item for the card's current geometry.
+        """
+        canvas = self.canvas
+        renderer = self.renderer
+        x, y, width, height = self.geometry
+        right = x + width
+
+        canvas.coords(self.bg, x, y, right, y + height)
+        canvas.coords(self.accent, x, y, x + 4, y + height)
+        canvas.coords(self.toggle_box, x + 14, y + 14, x + 32, y + 32)
+        canvas.coords(self.toggle_mark, x + 23, y + 23)
+        canvas.coords(self.title, x + 42, y + 12)
+        canvas.itemconfigure(self.title, width=max(50, width - 42 - 110))
+        canvas.coords(self.view_icon, right - 84, y + 12)
+        canvas.coords(self.edit_icon, right - 56, y + 12)
+        canvas.coords(self.delete_icon, right - 26, y + 12)
+
+        # Priority badge, status and due date row
+        row_y = y + 66
+        badge_width = renderer.measure(renderer.text_font, self.view_model.priority) + 12
+        canvas.coords(self.badge_bg, x + 16, row_y - 2, x + 16 + badge_width, row_y + 16)
+        canvas.coords(self.badge_text, x + 22, row_y)
+        canvas.coords(self.status_text, x + 28 + badge_width, row_y)
+        canvas.coords(self.due_text, x + max(width // 2 + 20, 140 + badge_width), row_y)
+
+        canvas.coords(self.desc_text, x + 16, y + 98)
+
+        # One row of chips; those that do not fit stay hidden
+        chip_x = x + 16
+        chip_y = y + 128
+        chip_state = "normal" if self.visible else "hidden"
+        self.overflow = []
+        for rect, text, tag in self.chip_items:
+            chip_width = renderer.measure(renderer.chip_font, tag) + 10
+            if chip_x + chip_width > right - 8:
+                self.overflow.extend((rect, text))
+                canvas.itemconfigure(rect, state="hidden")
+                canvas.itemconfigure(text, state="hidden")
+                continue
+            canvas.coords(rect, chip_x, chip_y, chip_x + chip_width, chip_y + 16)
+            canvas.coords(text, chip_x + 5, chip_y + 2)
+            canvas.itemconfigure(rect, state=chip_state)
+            canvas.itemconfigure(text, state=chip_state)
+            chip_x += chip_width + 5
@@ -0,0 +1,232 @@
+"""
+Dialogs that are built once and reused.
+"""
+import importlib
+import time
+import tkinter as tk
+
+from ..utils.helpers import center_window
+from ..utils.idle_scheduler import PRIORITY_LOW
+
+# Dialog name -> (module, class); modules are imported when first needed
+DIALOGS = {
+    "add_task": (".add_task_dialog", "AddTaskDialog"),
+    "edit_task": (".edit_task_dialog", "EditTaskDialog"),
+    "view_task": (".view_task_dialog", "ViewTaskDialog"),
+    "add_draft": (".add_draft_dialog", "AddDraftDialog"),
+    "edit_draft": (".edit_draft_dialog", "EditDraftDialog"),
+    "assign_draft": (".assign_draft_dialog", "AssignDraftDialog"),
+    "view_draft": (".view_draft_dialog", "ViewDraftDialog"),
+}
+
+TASK_DIALOGS = ["add_task", "edit_task", "view_task"]
+DRAFT_DIALOGS = ["add_draft", "edit_draft", "assign_draft", "view_draft"]
+
+# Tk root -> DialogManager
+_managers = {}
+
+
+class ReusableDialog:
+    """
+    Base class for a dialog whose widgets are built once.
+
+    The Toplevel is created withdrawn. show() fills in the fields for the
+    item at hand and maps the window centered on its parent; close()
+    withdraws it again instead of destroying it. The size is fixed
+    (SIZE), so centering needs no update_idletasks() round trip.
+
+    Subclasses must override _create_widgets() to build their widgets,
+    and fill them in per use by overriding _populate().
+    """
+
+    TITLE = ""
+    SIZE = (650, 500)
+
+    def __init__(self, parent, task_manager):
+        """
+        Build the dialog, hidden.
+
+        Args:
+            parent: Parent window
+            task_manager: TaskManager instance
+        """
+        self.parent = parent
+        self.task_manager = task_manager
+
+        self.top = tk.Toplevel(parent)
+        self.top.withdraw()
+        self.top.title(self.TITLE)
+        self.top.geometry("{}x{}".format(*self.SIZE))
+        self.top.resizable(False, False)
+        self.top.transient(parent)
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+        self._create_widgets()
+
+    @property
+    def visible(self):
+        """True while the dialog is shown."""
+        return self.top.winfo_exists() and self.top.state() != "withdrawn"
+
+    def show(self, *args):
+        """
+        Fill in the dialog and show it.
+
+        Args:
+            *args: Passed to _populate, e.g. the task to edit
+        """
+        self._populate(*args)
+        center_window(self.top, self.parent, size=self.SIZE)
+        self.top.deiconify()
+        self.top.lift()
+        self.top.grab_set()
+        self.top.focus_set()
+
+    def close(self):
+        """
+        Hide the dialog so it can be shown again.
+        """
+        self.top.grab_release()
+        self.top.withdraw()
+
+    def _create_widgets(self):
+        """
+        Create the dialog widgets. Every subclass must override this.
+
+        Raises:
+            NotImplementedError: If the subclass does not
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement _create_widgets")
+
+    def _populate(self, *args):
+        """
+        Fill the widgets in for the next use.
+        """
+
+    def _set_text(self, text_widget, value):
+        """
+        Replace the contents of a Text widget, keeping its state.
+
+        Args:
+            text_widget: tk.Text to fill
+            value (str): New contents
+        """
+        state = text_widget.cget("state")
+        text_widget.configure(state="normal")
+        text_widget.delete("1.0", tk.END)
+        if value:
+            text_widget.insert("1.0", value)
+        text_widget.configure(state=state)
+        text_widget.yview_moveto(0)
+
+
+class DialogManager:
+    """
+    Builds each dialog type once and hands out the same instance after.
+
+    Dialogs are looked up by name (see DIALOGS). prewarm() builds them
+    ahead of time in idle slots so even the first open is instant.
+    """
+
+    def __init__(self, root, task_manager, idle_scheduler=None):
+        """
+        Initialize the manager.
+
+        Args:
+            root: Tk root window; parent of every dialog
+            task_manager: TaskManager instance
+            idle_scheduler: IdleScheduler used by prewarm
+        """
+        self.root = root
+        self.task_manager = task_manager
+        self.idle_scheduler = idle_scheduler
+        self.dialogs = {}
+        self.build_times = {}  # name -> ms
+        _managers[root] = self
+
+    def get(self, name):
+        """
+        Get a dialog, building it on first use.
+
+        Args:
+            name (str): Key in DIALOGS
+
+        Returns:
+            ReusableDialog: The dialog
+        """
+        dialog = self.dialogs.get(name)
+        if dialog is None or not dialog.top.winfo_exists():
+            started = time.perf_counter()
+            module_name, class_name = DIALOGS[name]
+            module = importlib.import_module(module_name, __package__)
+            dialog = getattr(module, class_name)(self.root, self.task_manager)
+            self.dialogs[name] = dialog
+            self.build_times[name] = (time.perf_counter() - started) * 1000
+        return dialog
+
+    def show(self, name, *args):
+        """
+        Show a dialog.
+
+        Args:
+            name (str): Key in DIALOGS
+            *args: Passed to the dialog's show, e.g. the task to view
+
+        Returns:
+            ReusableDialog: The dialog
+        """
+        dialog = self.get(name)
+        dialog.show(*args)
+        return dialog
+
+    def prewarm(self, names):
+        """
+        Build dialogs ahead of time in low-priority idle slots.
+
+        Args:
+            names (list): Keys in DIALOGS
+        """
+        for name in names:
+            if name in self.dialogs:
+                continue
+            if self.idle_scheduler is None:
+                self.get(name)
+            else:
+                self.idle_scheduler.schedule(
+                    lambda name=name: self.get(name),
+                    priority=PRIORITY_LOW,
+                    name="prewarm dialog",
+                    key=f"dialog:{name}"
+                )
+
+    def destroy(self):
+        """
+        Destroy every dialog built so far.
+        """
+        for dialog in self.dialogs.values():
+            if dialog.top.winfo_exists():
+                dialog.top.destroy()
+        self.dialogs.clear()
+        if _managers.get(self.root) is self:
+            del _managers[self.root]
+
+
+def dialog_manager_for(widget):
+    """
+    Get the dialog manager of the window a widget belongs to.
+
+    Args:
+        widget: Any widget, e.g. a task card
+
+    Returns:
+        DialogManager: The manager registered for the widget's root window
+
+    Raises:
+        RuntimeError: If no DialogManager was created for that window
+    """
+    root = widget.nametowidget(".")
+    manager = _managers.get(root)
+    if manager is None:
+        raise RuntimeError("No DialogManager was created for this window; "
+                           "create one with the TaskManager before opening dialogs")
+    return manager
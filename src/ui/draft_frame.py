@@ -3,18 +3,16 @@ Frame for displaying and managing draft tasks.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-from datetime import datetime
-from dateutil import parser
 
-from .assign_draft_dialog import AssignDraftDialog
-from .add_draft_dialog import AddDraftDialog
-from .edit_draft_dialog import EditDraftDialog
-from .view_draft_dialog import ViewDraftDialog  # Import the new dialog
+from ..data.event_bus import DRAFT_EVENTS, DRAFT_UPDATED, DRAFT_DELETED
 from ..utils.helpers import format_date
-from ..utils.card_styles import apply_card_styles
-from ..utils.grid_layout import SimpleGridLayout
+from ..utils.card_template import CARD_WIDTH, CARD_HEIGHT
+from ..utils.grid_layout import VirtualizedGridLayout
+from ..utils.widget_pool import WidgetPool
+from ..utils.progressive_renderer import ProgressiveRenderer
+from ..utils.resize_coalescer import ResizeCoalescer
+from .dialog_manager import dialog_manager_for
 
 class DraftTaskFrame(ttk.Frame):
     """
@@ -32,18 +30,31 @@ class DraftTaskFrame(ttk.Frame):
             on_delete (callable): Callback for delete action
             on_edit (callable): Callback for edit action
         """
-        super().__init__(parent, padding=5)
+        # Fixed card size; styles and fonts come from the card template
+        super().__init__(parent, padding=5, width=CARD_WIDTH, height=CARD_HEIGHT, style="info.TFrame")
         
         self.draft = draft
         self.on_assign = on_assign
         self.on_delete = on_delete
         self.on_edit = on_edit  # Store the edit callback
         
-        # Configure the frame to properly expand in the grid
-        self.configure(style="info.TFrame", width=300, height=180)
         self.pack_propagate(False)  # Prevent the frame from shrinking to fit its contents
+        self.grid_propagate(False)
         
+        # Widgets are built once and filled from the draft, so pooled cards
+        # can be rebound to another draft
         self._create_widgets()
+        self.update_draft(draft)
+    
+    def update_draft(self, draft):
+        """
+        Show a (possibly different) draft on this card without rebuilding it.
+        
+        Args:
+            draft (dict): Draft task data
+        """
+        self.draft = draft
+        self._populate()
     
     def _format_date(self, date_str):
         """
@@ -62,33 +73,23 @@ class DraftTaskFrame(ttk.Frame):
         Create the widgets for the draft task frame.
         """
         # Container with border and padding - enhanced style
-        container = ttk.Frame(self, padding=8, relief="raised", borderwidth=1)
+        container = ttk.Frame(self, style="Card.TFrame")
         container.pack(fill=BOTH, expand=True)
         
         # Header row (title, buttons) - improved layout
-        header_frame = ttk.Frame(container)
+        header_frame = ttk.Frame(container, style="TFrame")
         header_frame.pack(fill=X, pady=(0, 5))
         
         # Draft icon with better styling
-        draft_icon = ttk.Label(
-            header_frame,
-            text="📝",
-            font=("Helvetica", 14)
-        )
+        draft_icon = ttk.Label(header_frame, text="📝", style="CardEmblem.TLabel")
         draft_icon.pack(side=LEFT, padx=(0, 5))
         
         # Title with enhanced styling
-        title_label = ttk.Label(
-            header_frame,
-            text=self.draft["title"],
-            font=("Helvetica", 12, "bold"),
-            style="info.TLabel",
-            foreground="#FFFFFF"
-        )
-        title_label.pack(side=LEFT, padx=5, fill=X, expand=True)
+        self.title_label = ttk.Label(header_frame, style="CardTitle.info.TLabel")
+        self.title_label.pack(side=LEFT, padx=5, fill=X, expand=True)
         
         # Button frame with improved button styling
-        button_frame = ttk.Frame(header_frame)
+        button_frame = ttk.Frame(header_frame, style="TFrame")
         button_frame.pack(side=RIGHT)
         
         assign_button = ttk.Button(
@@ -134,86 +135,84 @@ class DraftTaskFrame(ttk.Frame):
         separator.pack(fill=X, pady=5)
         
         # Details section - improved layout
-        details_frame = ttk.Frame(container)
+        details_frame = ttk.Frame(container, style="TFrame")
         details_frame.pack(fill=BOTH, expand=True, padx=5)
         
         # Created date with icon
-        date_frame = ttk.Frame(details_frame)
+        date_frame = ttk.Frame(details_frame, style="TFrame")
         date_frame.pack(fill=X, anchor=W, pady=(0, 5))
         
-        ttk.Label(
-            date_frame,
-            text="🕒",
-            font=("Helvetica", 10)
-        ).pack(side=LEFT, padx=(0, 5), pady=(0, 8))
-        
-        created_date_text = self._format_date(self.draft["created_at"])
-        created_label = ttk.Label(
-            date_frame,
-            text=f"Created: {created_date_text}",
-            font=("Helvetica", 9)
+        ttk.Label(date_frame, text="🕒", style="CardSymbol.TLabel").pack(side=LEFT, padx=(0, 5), pady=(0, 8))
+        
+        self.created_label = ttk.Label(date_frame, style="CardBody.TLabel")
+        self.created_label.pack(side=LEFT)
+        
+        # Description with better styling - packed only when the draft has one
+        self.desc_frame = ttk.Frame(details_frame, style="TFrame")
+        
+        # Description icon
+        ttk.Label(self.desc_frame, text="📋", style="CardSymbol.TLabel").pack(side=LEFT, anchor=N, padx=(0, 5), pady=(5, 0))
+        
+        # Description text with better wrapping and styling
+        self.desc_label = ttk.Label(
+            self.desc_frame,
+            wraplength=240,
+            justify=LEFT,
+            style="CardNote.TLabel"
         )
-        created_label.pack(side=LEFT)
+        self.desc_label.pack(side=LEFT, fill=BOTH, expand=True, anchor=W)
         
-        # Description with better styling
-        if self.draft["description"]:
-            desc_frame = ttk.Frame(details_frame)
-            desc_frame.pack(fill=BOTH, expand=True, pady=(0, 5))
-            
-            # Description icon
-            ttk.Label(
-                desc_frame,
-                text="📋",
-                font=("Helvetica", 10)
-            ).pack(side=LEFT, anchor=N, padx=(0, 5), pady=(5, 0))
-            
-            # Description text with better wrapping and styling
-            desc_text = self.draft["description"]
+        # Tags with improved styling - packed only when the draft has some
+        self.tags_frame = ttk.Frame(container, style="TFrame")
+        
+        # Tags icon
+        ttk.Label(self.tags_frame, text="🏷️", style="CardSymbol.TLabel").pack(side=LEFT, padx=(5, 5))
+        
+        # Tags with better styling
+        self.tags_container = ttk.Frame(self.tags_frame, style="TFrame")
+        self.tags_container.pack(side=LEFT, fill=X)
+        self.tag_labels = []
+    
+    def _populate(self):
+        """
+        Fill the card widgets from the current draft.
+        """
+        draft = self.draft
+        
+        self.title_label.configure(text=draft["title"])
+        self.created_label.configure(text=f"Created: {self._format_date(draft['created_at'])}")
+        
+        if draft["description"]:
+            desc_text = draft["description"]
             if len(desc_text) > 25:
                 desc_text = desc_text[:25] + "..."
-                
-            desc_label = ttk.Label(
-                desc_frame,
-                text=desc_text,
-                wraplength=240,
-                justify=LEFT,
-                font=("Helvetica", 9),
-                foreground="#E0E0E0"
-            )
-            desc_label.pack(side=LEFT, fill=BOTH, expand=True, anchor=W)
-        
-        # Tags with improved styling
-        if self.draft["tags"]:
-            tags_frame = ttk.Frame(container)
-            tags_frame.pack(fill=X, pady=(5, 0), anchor=W)
-            
-            # Tags icon
-            ttk.Label(
-                tags_frame,
-                text="🏷️",
-                font=("Helvetica", 10)
-            ).pack(side=LEFT, padx=(5, 5))
-            
-            # Tags with better styling
-            tags_container = ttk.Frame(tags_frame)
-            tags_container.pack(side=LEFT, fill=X)
-            
-            for tag in self.draft["tags"]:
-                tag_label = ttk.Label(
-                    tags_container,
-                    text=tag,
-                    style="info.Inverse.TLabel",
-                    font=("Helvetica", 8),
-                    padding=(5, 2),
-                    foreground="#FFFFFF"
-                )
+            self.desc_label.configure(text=desc_text)
+            self.desc_frame.pack(fill=BOTH, expand=True, pady=(0, 5))
+        else:
+            self.desc_frame.pack_forget()
+        
+        tags = draft["tags"]
+        if not tags:
+            self.tags_frame.pack_forget()
+            return
+        
+        # Create any missing chips, hide surplus ones
+        while len(self.tag_labels) < len(tags):
+            self.tag_labels.append(ttk.Label(self.tags_container, style="DraftChip.info.Inverse.TLabel"))
+        for i, tag_label in enumerate(self.tag_labels):
+            if i < len(tags):
+                tag_label.configure(text=tags[i])
                 tag_label.pack(side=LEFT, padx=(0, 5), pady=2)
+            else:
+                tag_label.pack_forget()
+        
+        self.tags_frame.pack(fill=X, pady=(5, 0), anchor=W)
 
     def _on_view(self):
         """
         Handle view button click.
         """
-        ViewDraftDialog(self.winfo_toplevel(), self.draft)
+        dialog_manager_for(self).show("view_draft", self.draft)
 
     def _on_assign(self):
         """
@@ -239,18 +238,34 @@ class DraftsFrame(ttk.Frame):
     Frame for displaying and managing draft tasks.
     """
     
-    def __init__(self, parent, task_manager):
+    CARD_HEIGHT = CARD_HEIGHT  # from the card template
+    CARD_POOL_HIGH_WATER = 200  # idle cards kept for reuse
+    CARD_POOL_IDLE_MS = 30000  # idle cards older than this are destroyed
+    REFRESH_DEBOUNCE_MS = 150  # search keystrokes within this window coalesce
+    
+    def __init__(self, parent, task_manager, idle_scheduler=None):
         """
         Initialize the drafts frame.
         
         Args:
             parent: Parent widget
             task_manager: TaskManager instance
+            idle_scheduler (IdleScheduler): Runs deferrable work such as pool trimming
         """
         super().__init__(parent, padding=10)
         
         self.task_manager = task_manager
         self.parent = parent
+        self.idle_scheduler = idle_scheduler
+        
+        # Search input reloads the drafts once typing pauses
+        self._refresh_job = None
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self._on_search_changed)
+        
+        # Draft changes made while the tab is hidden are applied on the next visit
+        self.needs_refresh = False
+        self.task_manager.events.subscribe(DRAFT_EVENTS, self._on_draft_event)
         
         self._create_widgets()
         self.load_drafts()
@@ -289,6 +304,11 @@ class DraftsFrame(ttk.Frame):
         )
         add_button.pack(side=RIGHT)
         
+        # Search box for drafts
+        search_entry = ttk.Entry(header_frame, textvariable=self.search_var, width=30)
+        search_entry.pack(side=RIGHT, padx=(5, 10))
+        ttk.Label(header_frame, text="Search:").pack(side=RIGHT)
+        
         # Drafts list with scrollbar
         container_frame = ttk.Frame(self)
         container_frame.pack(fill=BOTH, expand=True)
@@ -303,10 +323,6 @@ class DraftsFrame(ttk.Frame):
         
         # Create the scrollable frame
         self.scrollable_frame = ttk.Frame(self.canvas, style="TFrame")
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
         
         # Create the window in the canvas
         self.canvas_window = self.canvas.create_window(
@@ -316,16 +332,51 @@ class DraftsFrame(ttk.Frame):
             tags="self.scrollable_frame"
         )
         
-        # Setup the grid layout for drafts with simple implementation
-        self.drafts_grid_layout = SimpleGridLayout(
-            parent_frame=self.scrollable_frame,
+        # Draft cards live in their own frame; the empty-state label below it
+        # is packed only when there is nothing to show
+        self.cards_frame = ttk.Frame(self.scrollable_frame)
+        self.cards_frame.pack(fill=BOTH, expand=True)
+        self.empty_label = ttk.Label(
+            self.scrollable_frame,
+            font=("Helvetica", 12),
+            foreground="gray"
+        )
+        
+        # Draft cards are recycled rather than destroyed between loads
+        self.draft_card_pool = WidgetPool(
+            self,
+            self._create_draft_card,
+            lambda card, draft: card.update_draft(draft),
+            high_water=self.CARD_POOL_HIGH_WATER,
+            idle_timeout_ms=self.CARD_POOL_IDLE_MS,
+            scheduler=self.idle_scheduler
+        )
+        
+        # Loads build the visible cards at once and stream the rest in slices;
+        # a newer load (e.g. the next keystroke in the search box) cancels
+        # the one in progress
+        self.renderer = ProgressiveRenderer(self)
+        
+        # Virtualized grid keyed by draft id, like the task list: only rows in
+        # the viewport get cards; it drives the scrollbar through yscrollcommand
+        self.drafts_grid_layout = VirtualizedGridLayout(
+            parent_frame=self.cards_frame,
+            canvas=self.canvas,
+            create_card=self.draft_card_pool.acquire,
+            update_card=lambda card, draft: card.update_draft(draft),
+            release_card=self.draft_card_pool.release,
             min_column_width=320,
-            padding=5
+            card_height=self.CARD_HEIGHT,
+            padding=5,
+            overscan_rows=2,
+            yscrollcommand=scrollbar.set,
+            renderer=self.renderer
         )
         
-        # Update scrollable frame width when canvas changes
-        self.canvas.bind('<Configure>', self._on_canvas_configure)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Update scrollable frame width when canvas changes; a window drag
+        # fires a burst of Configure events, relaid out once per frame
+        self.canvas_resize = ResizeCoalescer(self.canvas, self._on_canvas_resized)
+        self.canvas.bind('<Configure>', self.canvas_resize)
         
         # Add mouse wheel scrolling to the canvas
         self.canvas.bind("<MouseWheel>", lambda event: self.canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
@@ -333,113 +384,154 @@ class DraftsFrame(ttk.Frame):
         self.canvas.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-1, "units"))
         self.canvas.bind("<Button-5>", lambda event: self.canvas.yview_scroll(1, "units"))
     
-    def _on_canvas_configure(self, event):
+    def _on_canvas_resized(self, width, height):
         """
         Update scrollable frame width when canvas is resized.
+        
+        Args:
+            width (int): New canvas width
+            height (int): New canvas height
         """
         # Update the width of the frame to fill the canvas
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
-        
-        # Force update the scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.canvas.itemconfig(self.canvas_window, width=width)
         
-        # When canvas resizes, refresh the layout if needed
-        self.drafts_grid_layout.refresh_on_resize(event)
+        # The grid recomputes its columns and sets the scrollregion from its
+        # own row count; a height change re-renders through yscrollcommand
+        self.drafts_grid_layout.refresh_on_resize()
     
-    def load_drafts(self, force_refresh=False):
+    def load_drafts(self):
         """
         Load and display draft tasks.
         
-        Args:
-            force_refresh (bool): If True, reload data from file before displaying
+        Cards are reconciled by draft id within the visible rows: only newly
+        visible drafts get cards, changed drafts are patched in place and
+        cards that leave the view are recycled. The first screenful is built
+        right away and the rest streams in without blocking input.
         """
-        # Refresh data from file if requested
-        if force_refresh:
-            self.task_manager.refresh_data()
-            
-        # Clear existing drafts
-        self.drafts_grid_layout.clear()
+        # A direct load supersedes a pending debounced one
+        self._cancel_scheduled_refresh()
+        self.needs_refresh = False
         
-        # Get all drafts
-        drafts = self.task_manager.get_all_drafts()
-        print(f"Loading {len(drafts)} drafts")
+        # Get drafts matching the search box
+        search_term = self.search_var.get().strip()
+        drafts = self.task_manager.search_drafts(search_term)
         
-        # Display drafts
+        get_version = self.task_manager.get_version
+        self.drafts_grid_layout.set_data(
+            [(draft["id"], get_version(draft["id"]), draft) for draft in drafts]
+        )
+        
+        # Display the empty state when there is nothing to show
         if not drafts:
-            empty_label = ttk.Label(
-                self.scrollable_frame,
-                text="No draft tasks. Click 'Add Draft' to create one.",
-                font=("Helvetica", 12),
-                foreground="gray"
+            empty_text = (
+                f"No drafts match '{search_term}'." if search_term
+                else "No draft tasks. Click 'Add Draft' to create one."
             )
-            empty_label.grid(row=0, column=0, columnspan=10, pady=50)
+            self.empty_label.configure(text=empty_text)
+            self.empty_label.pack(pady=50)
         else:
-            # Add drafts to the grid layout
-            for draft in drafts:
-                print(f"Adding draft: {draft['title']}")
-                draft_frame = DraftTaskFrame(
-                    self.scrollable_frame, 
-                    draft,
-                    self._on_assign_draft,
-                    self._on_delete_draft,
-                    self._on_edit_draft  # Add the edit callback
-                )
-                # Apply consistent styling
-                apply_card_styles(draft_frame)
-                # Add to grid layout
-                self.drafts_grid_layout.add_item(draft_frame)
-                
-            # Force layout update
-            self.scrollable_frame.update_idletasks()
+            self.empty_label.pack_forget()
     
-    def _open_add_draft_dialog(self):
+    def _on_search_changed(self, *args):
         """
-        Open the add draft dialog.
+        Handle search input changes.
         """
-        dialog = AddDraftDialog(self.parent, self.task_manager)
-        self.parent.wait_window(dialog.top)
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """
+        Request a drafts reload after the debounce window.
         
-        # Access the main app and mark drafts for refresh
-        # This could be in TodoApp or parent of this frame
-        if hasattr(self.parent, 'mark_drafts_for_refresh'):
-            self.parent.mark_drafts_for_refresh()
-        else:
-            # Find TodoApp instance in widget hierarchy
-            parent = self.parent
-            while parent and not hasattr(parent, 'mark_drafts_for_refresh'):
-                if hasattr(parent, 'master'):
-                    parent = parent.master
-                else:
-                    break
-            
-            if parent and hasattr(parent, 'mark_drafts_for_refresh'):
-                parent.mark_drafts_for_refresh()
-                
+        Every request restarts the window, so a burst of keystrokes results
+        in one reload that reads the latest search text.
+        """
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(self.REFRESH_DEBOUNCE_MS, self._run_scheduled_refresh)
+    
+    def _cancel_scheduled_refresh(self):
+        """
+        Drop a pending debounced reload.
+        """
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+    
+    def _run_scheduled_refresh(self):
+        """
+        Run the debounced reload.
+        """
+        self._refresh_job = None
         self.load_drafts()
     
+    def _create_draft_card(self, draft):
+        """
+        Create a card widget for a draft.
+        
+        Args:
+            draft (dict): Draft data
+            
+        Returns:
+            DraftTaskFrame: The new card
+        """
+        draft_frame = DraftTaskFrame(
+            self.cards_frame, 
+            draft,
+            self._on_assign_draft,
+            self._on_delete_draft,
+            self._on_edit_draft  # Add the edit callback
+        )
+        return draft_frame
+    
+    def load_if_stale(self):
+        """
+        Reload the drafts if they changed while the tab was hidden.
+        """
+        if self.needs_refresh:
+            print("Loading drafts data")
+            self.load_drafts()
+        else:
+            print("Using cached drafts data")
+    
+    def _on_draft_event(self, event):
+        """
+        Apply a draft change published by the task manager.
+        
+        An edited draft has its card patched and a deleted one has its card
+        removed; anything else (new drafts, edits that may change the search
+        matches, bulk reloads) re-runs load_drafts, which only touches the
+        cards that differ. While the tab is hidden the view is only marked stale.
+        
+        Args:
+            event (ChangeEvent): The change
+        """
+        if not self.winfo_viewable():
+            self.needs_refresh = True
+            return
+        
+        layout = self.drafts_grid_layout
+        searching = bool(self.search_var.get().strip())
+        if event.type == DRAFT_UPDATED and event.item_id in layout.index_by_key and not searching:
+            layout.update_item(event.item_id, self.task_manager.get_version(event.item_id), event.item)
+        elif event.type == DRAFT_DELETED and event.item_id in layout.index_by_key and len(layout.items) > 1:
+            layout.remove_item(event.item_id)
+        else:
+            self.load_drafts()
+    
+    def _open_add_draft_dialog(self):
+        """
+        Open the add draft dialog.
+        """
+        dialog_manager_for(self).show("add_draft")
+    
     def _refresh_drafts(self):
         """
         Explicitly refresh the drafts data and UI.
         """
         print("Manually refreshing drafts...")
         
-        # Mark drafts for refresh in the parent TodoApp
-        if hasattr(self.parent, 'mark_drafts_for_refresh'):
-            self.parent.mark_drafts_for_refresh()
-        else:
-            # Find TodoApp instance in widget hierarchy
-            parent = self.parent
-            while parent and not hasattr(parent, 'mark_drafts_for_refresh'):
-                if hasattr(parent, 'master'):
-                    parent = parent.master
-                else:
-                    break
-            
-            if parent and hasattr(parent, 'mark_drafts_for_refresh'):
-                parent.mark_drafts_for_refresh()
-        
-        # Reload drafts with a forced refresh from file
-        self.load_drafts(force_refresh=True)
+        # Reload from file; the bulk_reloaded event it publishes reloads the view
+        self.task_manager.refresh_data()
     
     def _on_assign_draft(self, draft_id):
         """
@@ -450,27 +542,7 @@ class DraftsFrame(ttk.Frame):
         """
         draft = self.task_manager.get_draft_by_id(draft_id)
         if draft:
-            dialog = AssignDraftDialog(self.parent, self.task_manager, draft)
-            self.parent.wait_window(dialog.top)
-            
-            # Mark both drafts and tasks for refresh since a task was created
-            if hasattr(self.parent, 'mark_drafts_for_refresh'):
-                self.parent.mark_drafts_for_refresh()
-                self.parent.mark_tasks_for_refresh()
-            else:
-                # Find TodoApp instance in widget hierarchy
-                parent = self.parent
-                while parent and not hasattr(parent, 'mark_drafts_for_refresh'):
-                    if hasattr(parent, 'master'):
-                        parent = parent.master
-                    else:
-                        break
-                
-                if parent and hasattr(parent, 'mark_drafts_for_refresh'):
-                    parent.mark_drafts_for_refresh()
-                    parent.mark_tasks_for_refresh()
-                    
-            self.load_drafts()
+            dialog_manager_for(self).show("assign_draft", draft)
     
     def _on_edit_draft(self, draft_id):
         """
@@ -481,25 +553,7 @@ class DraftsFrame(ttk.Frame):
         """
         draft = self.task_manager.get_draft_by_id(draft_id)
         if draft:
-            dialog = EditDraftDialog(self.parent, self.task_manager, draft)
-            self.parent.wait_window(dialog.top)
-            
-            # Mark drafts for refresh
-            if hasattr(self.parent, 'mark_drafts_for_refresh'):
-                self.parent.mark_drafts_for_refresh()
-            else:
-                # Find TodoApp instance in widget hierarchy
-                parent = self.parent
-                while parent and not hasattr(parent, 'mark_drafts_for_refresh'):
-                    if hasattr(parent, 'master'):
-                        parent = parent.master
-                    else:
-                        break
-                
-                if parent and hasattr(parent, 'mark_drafts_for_refresh'):
-                    parent.mark_drafts_for_refresh()
-                    
-            self.load_drafts()
+            dialog_manager_for(self).show("edit_draft", draft)
     
     def _on_delete_draft(self, draft_id):
         """
@@ -516,20 +570,3 @@ class DraftsFrame(ttk.Frame):
             )
             if confirm:
                 self.task_manager.delete_draft(draft_id)
-                
-                # Mark drafts for refresh
-                if hasattr(self.parent, 'mark_drafts_for_refresh'):
-                    self.parent.mark_drafts_for_refresh()
-                else:
-                    # Find TodoApp instance in widget hierarchy
-                    parent = self.parent
-                    while parent and not hasattr(parent, 'mark_drafts_for_refresh'):
-                        if hasattr(parent, 'master'):
-                            parent = parent.master
-                        else:
-                            break
-                    
-                    if parent and hasattr(parent, 'mark_drafts_for_refresh'):
-                        parent.mark_drafts_for_refresh()
-                        
-                self.load_drafts()
@@ -6,46 +6,43 @@ from tkinter import ttk, messagebox
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 
-from ..utils.helpers import center_window
+from .dialog_manager import ReusableDialog
 
-class EditDraftDialog:
+class EditDraftDialog(ReusableDialog):
     """
     Dialog for editing an existing draft task.
     """
     
-    def __init__(self, parent, task_manager, draft):
+    TITLE = "Edit Draft Task"
+    SIZE = (650, 450)
+    
+    def __init__(self, parent, task_manager):
         """
         Initialize the edit draft dialog.
         
         Args:
             parent: Parent window
             task_manager: TaskManager instance
-            draft: Draft to edit
         """
-        self.parent = parent
-        self.task_manager = task_manager
-        self.draft = draft
+        self.draft = None
+        self.title_var = tk.StringVar(parent)
+        self.tags_var = tk.StringVar(parent)
         
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title("Edit Draft Task")
-        self.top.geometry("650x450")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
+        super().__init__(parent, task_manager)
+    
+    def _populate(self, draft):
+        """
+        Fill the fields in with a draft's current values.
         
-        # Initialize variables with current draft values
-        self.title_var = tk.StringVar(value=draft["title"])
+        Args:
+            draft: Draft to edit
+        """
+        self.draft = draft
+        self.title_var.set(draft["title"])
         
         # Format the tags
-        tags_text = ", ".join(draft["tags"]) if draft["tags"] else ""
-        self.tags_var = tk.StringVar(value=tags_text)
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+        self.tags_var.set(", ".join(draft["tags"]) if draft["tags"] else "")
+        self._set_text(self.description_text, draft["description"])
     
     def _create_widgets(self):
         """
@@ -95,10 +92,6 @@ class EditDraftDialog:
         self.description_text.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=RIGHT, fill=Y)
         
-        # Set the description text to current value
-        if self.draft["description"]:
-            self.description_text.insert("1.0", self.draft["description"])
-        
         desc_frame.grid(row=3, column=1, columnspan=2, sticky=(N, S, E, W), pady=(10, 10))
         
         # Action buttons
@@ -106,7 +99,7 @@ class EditDraftDialog:
         ttk.Button(
             button_frame,
             text="Cancel",
-            command=self.top.destroy,
+            command=self.close,
             width=15,
             style="secondary.TButton"
         ).pack(side=RIGHT, padx=5)
@@ -148,4 +141,4 @@ class EditDraftDialog:
             tags=tags
         )
         
-        self.top.destroy()
+        self.close()
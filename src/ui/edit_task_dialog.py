@@ -7,56 +7,50 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Querybox
 from datetime import datetime
-from dateutil import parser
 
-from ..utils.helpers import center_window, format_date, get_centered_date
+from ..utils.helpers import format_date, get_centered_date
+from .dialog_manager import ReusableDialog
 
-class EditTaskDialog:
+class EditTaskDialog(ReusableDialog):
     """
     Dialog for editing an existing task.
     """
     
-    def __init__(self, parent, task_manager, task):
+    TITLE = "Edit Task"
+    
+    def __init__(self, parent, task_manager):
         """
         Initialize the edit task dialog.
         
         Args:
             parent: Parent window
             task_manager: TaskManager instance
+        """
+        self.task = None
+        self.title_var = tk.StringVar(parent)
+        self.priority_var = tk.StringVar(parent)
+        self.status_var = tk.StringVar(parent)
+        self.due_date_var = tk.StringVar(parent)
+        self.tags_var = tk.StringVar(parent)
+        
+        super().__init__(parent, task_manager)
+    
+    def _populate(self, task):
+        """
+        Fill the fields in with a task's current values.
+        
+        Args:
             task: Task to edit
         """
-        self.parent = parent
-        self.task_manager = task_manager
         self.task = task
-        
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title("Edit Task")
-        self.top.geometry("650x500")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
-        
-        # Initialize variables
-        self.title_var = tk.StringVar(value=task["title"])
-        self.priority_var = tk.StringVar(value=task["priority"])
-        self.status_var = tk.StringVar(value=task["status"])
-        
-        # Format the due date
-        if task["due_date"]:
-            self.due_date_var = tk.StringVar(value=task["due_date"])
-        else:
-            self.due_date_var = tk.StringVar()
+        self.title_var.set(task["title"])
+        self.priority_var.set(task["priority"])
+        self.status_var.set(task["status"])
+        self.due_date_var.set(task["due_date"] or "")
         
         # Format the tags
-        tags_text = ", ".join(task["tags"]) if task["tags"] else ""
-        self.tags_var = tk.StringVar(value=tags_text)
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+        self.tags_var.set(", ".join(task["tags"]) if task["tags"] else "")
+        self._set_text(self.description_text, task["description"])
     
     def _create_widgets(self):
         """
@@ -145,10 +139,6 @@ class EditTaskDialog:
         self.description_text.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=RIGHT, fill=Y)
         
-        # Set the description text
-        if self.task["description"]:
-            self.description_text.insert("1.0", self.task["description"])
-        
         desc_frame.grid(row=5, column=1, columnspan=3, sticky=(N, S, E, W), pady=(10, 10))
         
         # Action buttons
@@ -156,7 +146,7 @@ class EditTaskDialog:
         ttk.Button(
             button_frame,
             text="Cancel",
-            command=self.top.destroy,
+            command=self.close,
             width=15,
             style="secondary.TButton"
         ).pack(side=RIGHT, padx=5)
@@ -221,4 +211,4 @@ class EditTaskDialog:
             status=status
         )
         
-        self.top.destroy()
+        self.close()
@@ -5,32 +5,61 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-from datetime import datetime, timedelta
 import traceback
-from dateutil import parser  # Add the missing import
+import time
 
 from ..data.task_manager import TaskManager
+from ..data.event_bus import TASK_EVENTS, TASK_UPDATED, BULK_RELOADED
 from .task_frame import TaskFrame
-from .add_task_dialog import AddTaskDialog
-from .edit_task_dialog import EditTaskDialog
 from .statistics_frame import StatisticsFrame
-from .draft_frame import DraftsFrame
-from ..utils.helpers import center_window
+from .next_up_frame import NextUpFrame
+from .canvas_task_cards import CanvasCardRenderer
+from ..utils.helpers import center_window, get_centered_date
 from ..utils.custom_theme import create_custom_dark_theme
-from ..utils.grid_layout import SimpleGridLayout
-from ..utils.card_styles import apply_card_styles
+from ..utils.grid_layout import VirtualizedGridLayout
+from ..utils.card_template import CARD_HEIGHT, register_card_template
+from ..utils.widget_pool import WidgetPool
+from ..utils.progressive_renderer import ProgressiveRenderer
+from ..utils.resize_coalescer import ResizeCoalescer
+from ..utils.background import BackgroundExecutor
+from ..utils.async_runner import AsyncTkRunner
+from ..utils.idle_scheduler import IdleScheduler, PRIORITY_NORMAL, PRIORITY_LOW
+from .dialog_manager import DialogManager, TASK_DIALOGS, DRAFT_DIALOGS
+from .view_models import ViewModelCache
 
 class TodoApp:
     """
     Main application window.
     """
     
-    def __init__(self):
+    NEXT_UP_COUNT = 10
+    CARD_HEIGHT = CARD_HEIGHT  # from the card template
+    CARD_POOL_HIGH_WATER = 200  # idle cards kept for reuse
+    CARD_POOL_IDLE_MS = 30000  # idle cards older than this are destroyed
+    REFRESH_DEBOUNCE_MS = 150  # search/filter/sort changes within this window coalesce
+    CARD_RENDERERS = ["Widgets", "Canvas"]  # Canvas draws cards as canvas items, no widgets
+    BACKGROUND_QUERY_MIN = 2000  # task count from which filtering and sorting run on a worker
+    FILTER_OPTIONS = [
+        "Next Up", "All", "To Do", "In Progress", "Completed",
+        "Overdue", "Due Today", "Tomorrow", "This Week", "Next 7 Days", "No Due Date",
+        "High Priority", "Custom Range..."
+    ]
+    
+    def __init__(self, profiler=None):
         """
         Initialize the application window.
+        
+        Args:
+            profiler (StartupProfiler): Receives the startup timeline once
+                the app is interactive (app.py --profile-startup)
         """
+        self._startup_started = time.perf_counter()
+        self.startup_timings = {}  # ms from the start of __init__
+        self.profiler = profiler
+        
         # Create and register our custom theme
         custom_theme = create_custom_dark_theme()
+        self._mark_startup("theme_created")
         
         self.root = tb.Window(
             title="Personal ToDo",
@@ -44,16 +73,38 @@ class TodoApp:
         # Set the window to maximized state
         self.root.state('zoomed')  # For Windows
         # For Linux/Mac, use: self.root.attributes('-zoomed', True)
+        self._mark_startup("window_created")
         
         self.task_manager = TaskManager()
+        self._mark_startup("data_loaded")
+        
+        # Slow queries run on worker threads; results and change events
+        # published off the Tk thread are delivered through a polled queue
+        self.background = BackgroundExecutor(self.root)
+        self.task_manager.events.dispatch = self.background.call_soon
+        
+        # Deferrable work (pool trimming, pre-warming) runs in idle slots
+        self.idle_scheduler = IdleScheduler(self.root)
+        
+        # Dialogs are built once and reused; see _report_startup for pre-warming
+        self.dialogs = DialogManager(self.root, self.task_manager, self.idle_scheduler)
+        
+        # Card display fields are derived once per task version and shared by
+        # widget cards, canvas cards and Next Up; subscribed before the task
+        # list so stale entries are gone when cards are refreshed
+        self.view_models = ViewModelCache(self.task_manager)
         self.current_filter = "All"  # Changed default filter to All
         self.current_sort = "Due Date"
         
-        # Add state tracking for loaded data
-        self.tasks_loaded = False
-        self.drafts_loaded = False
+        # Task changes made while the Tasks tab is hidden are applied on the
+        # next visit; the Drafts tab tracks its own staleness
         self.tasks_need_refresh = True
-        self.drafts_need_refresh = True
+        
+        # Debounced refreshes for search, filter and sort input
+        self._refresh_job = None
+        self._last_render_key = None  # (id, version) list last handed to the grid
+        self.refresh_timings = {}  # ms per stage of the last refresh
+        self.refresh_stats = {"requested": 0, "rendered": 0, "skipped": 0}
         
         # Center the window on screen
         center_window(self.root)
@@ -61,24 +112,64 @@ class TodoApp:
         # Configure custom styles
         self._configure_custom_styles()
         
+        # Card fonts and styles are built once here instead of per card
+        print(f"Card template registered in {register_card_template():.1f}ms")
+        self._mark_startup("card_template")
+        
         self._setup_variables()
         self._create_widgets()
         self._setup_layout()
         
+        # Apply task changes as they happen, whichever view made them
+        self.task_manager.events.subscribe(TASK_EVENTS, self._on_task_event)
+        
         # Schedule the initial refresh after the UI is fully loaded
         self.root.after(100, self._initial_refresh)
+        self._mark_startup("ui_built")
+        
+        # First Expose event: the window has been painted
+        self.root.bind("<Expose>", self._on_first_expose, add="+")
+    
+    def _mark_startup(self, stage):
+        """
+        Record how long after the start of __init__ a startup stage finished.
+        
+        Args:
+            stage (str): Stage name
+        """
+        self.startup_timings[stage] = (time.perf_counter() - self._startup_started) * 1000
+    
+    def _on_first_expose(self, event):
+        """
+        Record the first paint.
+        """
+        if "first_paint" not in self.startup_timings:
+            self._mark_startup("first_paint")
         
     def _initial_refresh(self):
         """
         Perform initial data refresh after UI is fully loaded.
         """
         print("Performing initial refresh on startup...")
-        # Force a data refresh from files
+        # Force a data refresh from files; the bulk_reloaded event it
+        # publishes reloads the task list
         self.task_manager.refresh_data()
-        # Load tasks with fresh data
-        self._load_tasks()
-        self.tasks_loaded = True
-        self.tasks_need_refresh = False
+        
+        # Interactive once the loop is idle again with the first list shown
+        self.root.after_idle(self._report_startup)
+    
+    def _report_startup(self):
+        """
+        Record and print the time to first interactive.
+        """
+        self._mark_startup("interactive")
+        print("Startup: " + ", ".join(f"{stage} {ms:.0f}ms" for stage, ms in self.startup_timings.items()))
+        
+        # Build the task dialogs in idle time so their first open is instant
+        self.dialogs.prewarm(TASK_DIALOGS)
+        if self.profiler is not None:
+            self.profiler.uninstall()
+            self.profiler.report(timeline=self.startup_timings)
     
     def _configure_custom_styles(self):
         """
@@ -119,14 +210,29 @@ class TodoApp:
         self.search_var = tk.StringVar()
         self.search_var.trace_add("write", self._on_search_changed)
         
-        self.filter_var = tk.StringVar(value="Due Today")  # Changed default filter to Due Today
+        self.filter_var = tk.StringVar(value="Next Up")  # Land on the most urgent tasks
         self.filter_var.trace_add("write", self._on_filter_changed)
         
+        # The dropdown shows labels with counts; filter_var holds the plain filter name
+        self.filter_display_var = tk.StringVar(value=self.filter_var.get())
+        self._filter_labels = {}
+        self.custom_due_range = None  # (start, end) dates for "Custom Range"
+        
         self.sort_var = tk.StringVar(value="Priority")  # Changed default sort to Priority
         
+        # Multi-select criteria: group -> {value: BooleanVar}
+        self.criteria_vars = {
+            "status": {status: tk.BooleanVar(value=False) for status in TaskManager.STATUS_OPTIONS},
+            "priority": {priority: tk.BooleanVar(value=False) for priority in TaskManager.PRIORITY_LEVELS},
+            "tag": {}
+        }
+        
         # Add a variable to track completed tasks visibility
         self.show_completed_var = tk.BooleanVar(value=True)
         self.show_completed_var.trace_add("write", self._on_show_completed_changed)
+        
+        # How task cards are drawn in the Tasks view
+        self.card_renderer_var = tk.StringVar(value="Widgets")
     
     def _create_widgets(self):
         """
@@ -158,18 +264,34 @@ class TodoApp:
         # Filters
         filter_frame = ttk.Frame(self.search_frame)
         ttk.Label(filter_frame, text="Filter:").pack(side=LEFT, padx=(10, 5))
-        filter_options = ["All", "To Do", "In Progress", "Completed", "Overdue", "Due Today", "High Priority"]
-        filter_dropdown = ttk.Combobox(
+        self.filter_dropdown = ttk.Combobox(
             filter_frame, 
-            textvariable=self.filter_var,
-            values=filter_options,
-            width=15,
-            state="readonly"
+            textvariable=self.filter_display_var,
+            values=self.FILTER_OPTIONS,
+            width=18,
+            state="readonly",
+            postcommand=self._refresh_filter_counts
         )
-        filter_dropdown.pack(side=LEFT, padx=5)
+        self.filter_dropdown.pack(side=LEFT, padx=5)
+        self.filter_dropdown.bind("<<ComboboxSelected>>", self._on_filter_selected)
+        
+        # Multi-select criteria (status, priority, tags) combined with the filter above
+        self.criteria_button = ttk.Menubutton(
+            filter_frame,
+            text="Criteria",
+            style="info.Outline.TMenubutton",
+            width=12
+        )
+        self.criteria_menu = tk.Menu(
+            self.criteria_button,
+            tearoff=False,
+            postcommand=self._build_criteria_menu
+        )
+        self.criteria_button.configure(menu=self.criteria_menu)
+        self.criteria_button.pack(side=LEFT, padx=5)
         
         ttk.Label(filter_frame, text="Sort by:").pack(side=LEFT, padx=(10, 5))
-        sort_options = ["Due Date", "Priority", "Created Date", "Title"]
+        sort_options = TaskManager.SORT_OPTIONS
         sort_dropdown = ttk.Combobox(
             filter_frame, 
             textvariable=self.sort_var,
@@ -210,6 +332,18 @@ class TodoApp:
         )
         self.completed_toggle_button.pack(side=LEFT)
         
+        # Card renderer: widget cards or lightweight canvas-drawn cards
+        ttk.Label(filter_frame, text="Cards:").pack(side=LEFT, padx=(15, 5))
+        renderer_dropdown = ttk.Combobox(
+            filter_frame,
+            textvariable=self.card_renderer_var,
+            values=self.CARD_RENDERERS,
+            width=9,
+            state="readonly"
+        )
+        renderer_dropdown.pack(side=LEFT, padx=5)
+        renderer_dropdown.bind("<<ComboboxSelected>>", self._on_card_renderer_changed)
+        
         filter_frame.pack(side=LEFT, padx=10, fill=X, expand=True)
         
         # Task list frame with scrollbar
@@ -226,10 +360,6 @@ class TodoApp:
         
         # Create the scrollable frame
         self.scrollable_frame = ttk.Frame(self.canvas, style="TFrame")
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
         
         # Create the window in the canvas
         self.canvas_window = self.canvas.create_window(
@@ -239,18 +369,80 @@ class TodoApp:
             tags="self.scrollable_frame"
         )
         
-        # Setup the grid layout for tasks with simple implementation
-        self.tasks_grid_layout = SimpleGridLayout(
-            parent_frame=self.scrollable_frame,
-            min_column_width=320,
-            padding=5
+        # Persistent task list content: summary line, card grid and empty-state label
+        self.debug_frame = ttk.Frame(self.scrollable_frame)
+        self.debug_frame.pack(fill=X, padx=10, pady=(5, 10), anchor=NW)
+        self.debug_label = ttk.Label(
+            self.debug_frame,
+            text="",
+            foreground="#FFFFFF",
+            font=("Helvetica", 10)
         )
+        self.debug_label.pack(anchor=tk.W)
         
-        # Update the scrollable frame width when canvas changes
-        self.canvas.bind('<Configure>', self._on_canvas_configure)
+        self.tasks_content_frame = ttk.Frame(self.scrollable_frame)
+        self.tasks_content_frame.pack(fill=BOTH, expand=True, padx=5, pady=5)
         
-        # Configure canvas scrolling
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.empty_label = ttk.Label(
+            self.scrollable_frame,
+            text="No tasks found. Click 'Add Task' to create a new one.",
+            font=("Helvetica", 12),
+            foreground="gray"
+        )
+        self.error_frame = None
+        
+        # Task cards are recycled through a pool
+        self.task_card_pool = WidgetPool(
+            self.root,
+            self._create_task_card,
+            lambda card, task: card.update_task(task),
+            high_water=self.CARD_POOL_HIGH_WATER,
+            idle_timeout_ms=self.CARD_POOL_IDLE_MS,
+            scheduler=self.idle_scheduler
+        )
+        
+        # Canvas-drawn cards, an alternative to TaskFrame widgets; also pooled
+        self.canvas_card_renderer = CanvasCardRenderer(
+            self.canvas,
+            self.tasks_content_frame,
+            self._on_status_change,
+            self._on_edit_task,
+            self._on_delete_task,
+            view_models=self.view_models
+        )
+        self.canvas_card_pool = WidgetPool(
+            self.root,
+            self.canvas_card_renderer.create_card,
+            lambda card, task: card.update_task(task),
+            high_water=self.CARD_POOL_HIGH_WATER,
+            idle_timeout_ms=self.CARD_POOL_IDLE_MS,
+            scheduler=self.idle_scheduler
+        )
+        
+        # Loads build the visible cards at once and stream the rest in slices;
+        # a newer load cancels a render still in progress
+        self.task_renderer = ProgressiveRenderer(self.root)
+        
+        # Virtualized grid: only rows in the viewport (plus overscan) get cards,
+        # keyed by task id; it drives the scrollbar through yscrollcommand
+        self.tasks_grid_layout = VirtualizedGridLayout(
+            parent_frame=self.tasks_content_frame,
+            canvas=self.canvas,
+            create_card=self.task_card_pool.acquire,
+            update_card=lambda card, task: card.update_task(task),
+            release_card=self.task_card_pool.release,
+            min_column_width=320,
+            card_height=self.CARD_HEIGHT,
+            padding=5,
+            overscan_rows=2,
+            yscrollcommand=scrollbar.set,
+            renderer=self.task_renderer
+        )
+        
+        # Update the scrollable frame width when canvas changes; a window drag
+        # fires a burst of Configure events, relaid out once per frame
+        self.canvas_resize = ResizeCoalescer(self.canvas, self._on_canvas_resized)
+        self.canvas.bind('<Configure>', self.canvas_resize)
         
         # Add mouse wheel scrolling to the canvas
         self.canvas.bind("<MouseWheel>", lambda event: self.canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
@@ -269,27 +461,43 @@ class TodoApp:
         )
         add_button.pack(side=LEFT, padx=10, pady=10)
         
+        quick_find_button = ttk.Button(
+            self.action_frame,
+            text="🔍 Quick Find (Ctrl+K)",
+            command=self._open_quick_find,
+            style="info.Outline.TButton"
+        )
+        quick_find_button.pack(side=LEFT, padx=(0, 10), pady=10)
+        
         # Statistics frame (for Tasks tab)
         self.stats_frame = StatisticsFrame(self.tasks_tab, self.task_manager)
         
-        # Drafts Frame (for Drafts tab)
-        self.drafts_frame = DraftsFrame(self.drafts_tab, self.task_manager)
+        # Compact list of the most urgent tasks (for Tasks tab)
+        self.next_up_frame = NextUpFrame(self.tasks_tab, self.task_manager, view_models=self.view_models)
+        
+        # The Drafts tab is built on its first visit (_ensure_drafts_frame)
+        self.drafts_frame = None
         
         # Set up tab change event
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Global quick-find across tasks and drafts
+        self.root.bind_all("<Control-k>", lambda event: self._open_quick_find())
     
-    def _on_canvas_configure(self, event):
+    def _on_canvas_resized(self, width, height):
         """
         Update scrollable frame width when canvas is resized.
+        
+        Args:
+            width (int): New canvas width
+            height (int): New canvas height
         """
         # Update the width of the frame to fill the canvas
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
-        
-        # Force update the scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.canvas.itemconfig(self.canvas_window, width=width)
         
-        # When canvas resizes, check if layout needs to be updated
-        self.tasks_grid_layout.refresh_on_resize(event)
+        # The grid recomputes its columns and sets the scrollregion from its
+        # own row count; a height change re-renders through yscrollcommand
+        self.tasks_grid_layout.refresh_on_resize()
     
     def _setup_layout(self):
         """
@@ -303,10 +511,8 @@ class TodoApp:
         self.search_frame.pack(fill=X, pady=(10, 10))
         self.task_container_frame.pack(fill=BOTH, expand=True, pady=10)
         self.action_frame.pack(fill=X, pady=(10, 0))
+        self.next_up_frame.pack(fill=X, pady=(10, 0))
         self.stats_frame.pack(fill=X, pady=10)
-        
-        # Layout for Drafts tab
-        self.drafts_frame.pack(fill=BOTH, expand=True)
     
     def _on_tab_changed(self, event):
         """
@@ -317,254 +523,536 @@ class TodoApp:
         print(f"Tab changed to: {tab_name}")
         
         if tab_name == "Tasks":
-            if not self.tasks_loaded or self.tasks_need_refresh:
+            if self.tasks_need_refresh:
                 print("Loading tasks data")
                 self._load_tasks()
-                self.tasks_loaded = True
-                self.tasks_need_refresh = False
             else:
                 print("Using cached tasks data")
         elif tab_name == "Drafts":
-            if not self.drafts_loaded or self.drafts_need_refresh:
-                print("Loading drafts data")
-                self.drafts_frame.load_drafts()
-                self.drafts_loaded = True
-                self.drafts_need_refresh = False
+            if self.drafts_frame is None:
+                self._ensure_drafts_frame()
             else:
-                print("Using cached drafts data")
+                self.drafts_frame.load_if_stale()
     
-    def _load_tasks(self):
+    def _ensure_drafts_frame(self):
+        """
+        Build the Drafts tab contents if they do not exist yet.
+        
+        Deferred until the tab is first shown so startup does not pay for
+        the drafts module, its dialogs or the draft cards.
+        
+        Returns:
+            DraftsFrame: The drafts frame
+        """
+        if self.drafts_frame is None:
+            from .draft_frame import DraftsFrame
+            
+            started = time.perf_counter()
+            self.drafts_frame = DraftsFrame(self.drafts_tab, self.task_manager, self.idle_scheduler)
+            self.drafts_frame.pack(fill=BOTH, expand=True)
+            print(f"Drafts tab built in {(time.perf_counter() - started) * 1000:.1f}ms")
+            self.dialogs.prewarm(DRAFT_DIALOGS)
+        return self.drafts_frame
+    
+    def _tasks_tab_visible(self):
+        """
+        Check whether the Tasks tab is the selected tab.
+        
+        Returns:
+            bool: True if the task list is on screen
+        """
+        return self.notebook.tab(self.notebook.select(), "text") == "Tasks"
+    
+    def _on_task_event(self, event):
+        """
+        Apply a task change published by the task manager.
+        
+        Added, updated and deleted tasks go through the single-card path;
+        a bulk reload reloads the whole list. While the Tasks tab is hidden
+        the list is only marked stale.
+        
+        Args:
+            event (ChangeEvent): The change
+        """
+        if event.type == BULK_RELOADED:
+            self._schedule_search_indexing()
+        if not self._tasks_tab_visible():
+            self.tasks_need_refresh = True
+            return
+        
+        if event.type == BULK_RELOADED or self.background.pending("task_query"):
+            # A query still running would deliver a list from before the change
+            self._load_tasks()
+            return
+        if event.type == TASK_UPDATED and not event.changed:
+            return  # Saved without changes
+        
+        # Compare the sort key recorded before the update with the current
+        # one to see whether the card has to move
+        moved = False
+        if event.type == TASK_UPDATED and event.item_id in self.task_manager.index.slot_by_id:
+            sort_by = self.sort_var.get()
+            moved = event.sort_keys.get(sort_by) != self.task_manager.index.sort_key_of(event.item_id, sort_by)
+        self._refresh_task_card(event.item_id, moved)
+    
+    def _schedule_search_indexing(self):
+        """
+        Index the reloaded tasks and drafts for search in idle time.
+        
+        Until a document is indexed, searches scan it, so this only makes
+        later searches faster and never has to finish before one runs.
+        """
+        def steps():
+            while self.task_manager.index_search_step():
+                yield
+        
+        self.idle_scheduler.schedule(steps(), priority=PRIORITY_LOW, name="search index", key="search index")
+    
+    def _load_tasks(self, update_panels=True):
         """
         Load tasks from the task manager.
+        
+        Filtering and sorting run on a worker thread once there are
+        BACKGROUND_QUERY_MIN tasks, so the Tk loop stays responsive while a
+        large list is queried; the result is shown when it arrives unless a
+        newer load replaced it. Smaller lists are queried inline.
+        
+        Args:
+            update_panels (bool): Also refresh the Next Up panel; not needed
+                when only the search, filter or sort changed
+        """
+        # A direct load supersedes a pending debounced one
+        self._cancel_scheduled_refresh()
+        self.tasks_need_refresh = False
+        
+        # Tk variables can only be read here, on the Tk thread
+        params = self._get_query_params()
+        if len(self.task_manager.index) >= self.BACKGROUND_QUERY_MIN:
+            self.background.submit(
+                self._query_tasks, params, update_panels,
+                key="task_query",
+                on_done=lambda result: self._show_tasks(result, update_panels),
+                on_error=self._show_load_error
+            )
+            return
+        
+        # An inline load also supersedes a query still running on a worker
+        self.background.discard("task_query")
+        try:
+            result = self._query_tasks(params, update_panels)
+        except Exception as e:
+            self._show_load_error(e)
+            return
+        self._show_tasks(result, update_panels)
+    
+    def _get_query_params(self):
+        """
+        Read the search box, filter, criteria and sort settings.
+        
+        Returns:
+            dict: Query parameters for _query_tasks
+        """
+        return {
+            "search_term": self.search_var.get().lower(),
+            "filter": self.filter_var.get(),
+            "show_completed": self.show_completed_var.get(),
+            "criteria": self._get_selected_criteria(),
+            "custom_due_range": self.custom_due_range,
+            "sort_by": self.sort_var.get()
+        }
+    
+    def _query_tasks(self, params, update_panels=False):
+        """
+        Filter and sort the tasks; safe to run on a worker thread.
+        
+        The most urgent tasks are computed once per load and shared by the
+        Next Up filter, its ordering and the Next Up panel.
+        
+        Args:
+            params (dict): Query parameters from _get_query_params
+            update_panels (bool): The Next Up panel will be refreshed too
+            
+        The grid items are built under the same lock, so their versions
+        match the task snapshot and the Tk thread only has to compare the
+        render key.
+        
+        Returns:
+            tuple: ((id, version, task) grid items, (id, version) render key,
+                {"filter": ms, "sort": ms}, most urgent tasks or None if
+                neither the filter nor the panel needs them)
+        """
+        with self.task_manager.lock:
+            started = time.perf_counter()
+            next_up = None
+            if update_panels or params["filter"] == "Next Up":
+                next_up = self.task_manager.top_tasks(self.NEXT_UP_COUNT)
+            bits = self._get_filtered_bits(params, next_up=next_up)
+            filtered_at = time.perf_counter()
+            tasks = self._sort_tasks(bits, params, next_up=next_up)
+            get_version = self.task_manager.versions.get
+            items = [(task["id"], get_version(task["id"], 0), task) for task in tasks]
+            sorted_at = time.perf_counter()
+        render_key = [(key, version) for key, version, _ in items]
+        return items, render_key, {
+            "filter": (filtered_at - started) * 1000,
+            "sort": (sorted_at - filtered_at) * 1000
+        }, next_up
+    
+    def _show_tasks(self, result, update_panels=True):
+        """
+        Show the result of a task query.
+        
+        Cards are reconciled by task id within the visible rows: only newly
+        visible tasks get cards, changed tasks are patched in place and cards
+        that leave the view are recycled. The first screenful is built right
+        away and the overscan rows stream in without blocking input. If the
+        filtered ids and versions are the same as last time the grid is left
+        alone. Stage timings end up in refresh_timings.
+        
+        Args:
+            result (tuple): (grid items, render key, stage timings, most
+                urgent tasks) from _query_tasks
+            update_panels (bool): Also refresh the Next Up panel
         """
         try:
-            # Clear existing tasks - safely check if the grid layout exists and is valid
-            try:
-                if hasattr(self, 'tasks_grid_layout'):
-                    self.tasks_grid_layout.clear()
-            except (tk.TclError, AttributeError, Exception) as e:
-                print(f"Non-critical error clearing tasks: {e}")
-                # If there's an error, the grid layout might be invalid, so we'll recreate it later
-
-            # Get all tasks for debugging
-            all_tasks = self.task_manager.get_all_tasks()
-            print(f"All tasks count: {len(all_tasks)}")
-
-            # Get tasks based on filters
-            tasks = self._get_filtered_tasks()
-            print(f"Filtered tasks count: {len(tasks)}")
-
-            # Sort tasks
-            tasks = self._sort_tasks(tasks)
-
-            # Start with a clean slate - destroy all frames in the scrollable frame to avoid widget conflicts
-            for child in self.scrollable_frame.winfo_children():
-                try:
-                    child.destroy()
-                except Exception as e:
-                    print(f"Error destroying child widget: {e}")
-
-            # Create a fresh debug frame
-            self.debug_frame = ttk.Frame(self.scrollable_frame)
-            self.debug_frame.pack(fill=X, padx=10, pady=(5, 10), anchor=NW)
-
-            ttk.Label(
-                self.debug_frame,
-                text=f"Total tasks: {len(all_tasks)} | Filtered: {len(tasks)} | Filter: {self.filter_var.get()} | Show Completed: {self.show_completed_var.get()}",
-                foreground="#FFFFFF",
-                font=("Helvetica", 10)
-            ).pack(anchor=tk.W)
+            # Drop the error display left by a previous failed load
+            if self.error_frame is not None:
+                self.error_frame.destroy()
+                self.error_frame = None
+            
+            items, render_key, timings, next_up = result
+            started = time.perf_counter()
 
-            # Create a container frame for the task grid
-            self.tasks_content_frame = ttk.Frame(self.scrollable_frame)
-            self.tasks_content_frame.pack(fill=BOTH, expand=True, padx=5, pady=5)
+            self._update_summary(len(items))
             
-            # Add tasks to the UI
-            if not tasks:
-                empty_label = ttk.Label(
-                    self.tasks_content_frame,
-                    text="No tasks found. Click 'Add Task' to create a new one.",
-                    font=("Helvetica", 12),
-                    foreground="gray"
-                )
-                empty_label.pack(pady=50)
+            # Hand the filtered, sorted tasks to the virtualized grid; only
+            # cards in the viewport are created, patched or recycled, and a
+            # load still streaming in from before is cancelled
+            skipped = render_key == self._last_render_key
+            if skipped:
+                self.refresh_stats["skipped"] += 1
             else:
-                # Create a new grid layout with the new parent frame
-                self.tasks_grid_layout = SimpleGridLayout(
-                    parent_frame=self.tasks_content_frame,
-                    min_column_width=320,
-                    padding=5
-                )
+                self.tasks_grid_layout.set_data(items)
+                self._last_render_key = render_key
+                self.refresh_stats["rendered"] += 1
+                self._prefill_view_models()
                 
-                # Add tasks to the grid layout
-                for task in tasks:
-                    task_frame = TaskFrame(
-                        self.tasks_content_frame,
-                        task,
-                        self._on_status_change,
-                        self._on_edit_task,
-                        self._on_delete_task
-                    )
-                    # Apply consistent card styling
-                    apply_card_styles(task_frame)
-                    # Add to grid layout
-                    self.tasks_grid_layout.add_item(task_frame)
-                    print(f"Added task to UI: {task['title']}")
+                if items:
+                    self.empty_label.pack_forget()
+                else:
+                    self.empty_label.pack(pady=50)
+            rendered_at = time.perf_counter()
 
-            # Update statistics
-            self.stats_frame.update_stats()
+            # Statistics follow task events on their own
+            if update_panels:
+                self.next_up_frame.update_tasks(next_up)
+            
+            self.refresh_timings = dict(
+                timings,
+                render=(rendered_at - started) * 1000,
+                total=timings["filter"] + timings["sort"] + (time.perf_counter() - started) * 1000,
+                skipped=skipped
+            )
 
         except Exception as e:
-            error_msg = f"Error loading tasks: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)  # Print to console
+            self._show_load_error(e)
+    
+    def _prefill_view_models(self):
+        """
+        Build the view models of the tasks around the viewport in idle time.
+        
+        Covers the overscan rows still streaming in and a screenful past
+        either end of the rendered window, so those cards, when built or
+        scrolled into view, only look their view model up.
+        """
+        layout = self.tasks_grid_layout
+        first, last = layout.visible_range()
+        span = max(last - first, layout.current_columns)
+        items = layout.items[first:last + span] + layout.items[max(0, first - span):first]
+        self.idle_scheduler.schedule(
+            self.view_models.prefill([data for _, _, data in items]),
+            priority=PRIORITY_NORMAL,
+            name="view models",
+            key="view models"
+        )
+    
+    def _show_load_error(self, error):
+        """
+        Show a failed task load in place of the task list.
+        
+        Args:
+            error (Exception): The failure, possibly raised on a worker thread
+        """
+        details = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        error_msg = f"Error loading tasks: {str(error)}\n{details}"
+        print(error_msg)  # Print to console
 
-            # Display error in UI - be cautious with widget creation
-            try:
-                error_frame = ttk.Frame(self.scrollable_frame)
-                error_frame.pack(fill=X, pady=10, padx=10)
+        # Display error in UI - be cautious with widget creation
+        try:
+            if self.error_frame is not None:
+                self.error_frame.destroy()
+            self.error_frame = ttk.Frame(self.scrollable_frame)
+            self.error_frame.pack(fill=X, pady=10, padx=10)
 
-                ttk.Label(
-                    error_frame,
-                    text="Error loading tasks:",
-                    foreground="#FF5252",
-                    font=("Helvetica", 12, "bold")
-                ).pack(anchor=W)
+            ttk.Label(
+                self.error_frame,
+                text="Error loading tasks:",
+                foreground="#FF5252",
+                font=("Helvetica", 12, "bold")
+            ).pack(anchor=W)
 
-                error_text = tk.Text(error_frame, height=10, width=80, bg="#3D3D3D", fg="#FFFFFF")
-                error_text.insert("1.0", error_msg)
-                error_text.configure(state="disabled")
-                error_text.pack(fill=X, pady=5)
-            except Exception as e:
-                print(f"Failed to create error display: {e}")
-                # If we can't create an error display, at least we logged the error
+            error_text = tk.Text(self.error_frame, height=10, width=80, bg="#3D3D3D", fg="#FFFFFF")
+            error_text.insert("1.0", error_msg)
+            error_text.configure(state="disabled")
+            error_text.pack(fill=X, pady=5)
+        except Exception as e:
+            print(f"Failed to create error display: {e}")
+            # If we can't create an error display, at least we logged the error
+    
+    def _on_card_renderer_changed(self, event=None):
+        """
+        Switch the Tasks view between widget cards and canvas-drawn cards.
+        """
+        if self.card_renderer_var.get() == "Canvas":
+            pool, in_frame = self.canvas_card_pool, False
+        else:
+            pool, in_frame = self.task_card_pool, True
+        
+        self.tasks_grid_layout.set_card_factory(
+            pool.acquire,
+            lambda card, task: card.update_task(task),
+            pool.release,
+            reserve_frame_height=in_frame
+        )
     
-    def _get_filtered_tasks(self):
+    def _create_task_card(self, task):
         """
-        Get tasks based on current filter and search term.
+        Create a card widget for a task.
         
+        Args:
+            task (dict): Task data
+            
         Returns:
-            list: Filtered tasks
+            TaskFrame: The new card
         """
-        search_term = self.search_var.get().lower()
-        filter_value = self.filter_var.get()
-        show_completed = self.show_completed_var.get()
+        return TaskFrame(
+            self.tasks_content_frame,
+            task,
+            self._on_status_change,
+            self._on_edit_task,
+            self._on_delete_task,
+            view_models=self.view_models
+        )
+    
+    def _get_filtered_bits(self, params=None, slot=None, next_up=None):
+        """
+        Get the index bitset of tasks matching the current filter, criteria and search term.
         
-        all_tasks = self.task_manager.get_all_tasks()
-        print(f"Filter: {filter_value}, Search: '{search_term}', Show Completed: {show_completed}, Total tasks before filtering: {len(all_tasks)}")
+        Args:
+            params (dict): Query parameters from _get_query_params; read from
+                the Tk variables if omitted (Tk thread only)
+            slot (int): Only test the task in this slot; the due-date and
+                search filters then look at that task alone
+            next_up (list): Result of top_tasks(NEXT_UP_COUNT) if already
+                computed for this load
         
-        # Debugging: print the first task if available
-        if all_tasks:
-            print(f"Sample task: {all_tasks[0]['title']} - Status: {all_tasks[0]['status']}")
+        Returns:
+            int: Bitset of task slots on the task index
+        """
+        if params is None:
+            params = self._get_query_params()
+        search_term = params["search_term"]
+        filter_value = params["filter"]
+        show_completed = params["show_completed"]
+        custom_due_range = params["custom_due_range"]
         
-        # First apply regular filters
-        filtered_tasks = all_tasks.copy()
+        index = self.task_manager.index
         
-        # Apply search filter
-        if search_term:
-            filtered_tasks = [
-                task for task in filtered_tasks 
-                if search_term in task["title"].lower() or 
-                   search_term in (task["description"] or "").lower() or
-                   any(search_term in tag.lower() for tag in task["tags"])
-            ]
-            print(f"After search filter: {len(filtered_tasks)} tasks")
+        # Multi-select criteria: OR within a group, AND across groups
+        criteria = params["criteria"]
+        bits = index.query(
+            statuses=criteria["status"],
+            priorities=criteria["priority"],
+            tags=criteria["tag"]
+        )
+        if slot is not None:
+            bits &= 1 << slot
         
         # Apply status/priority filter
         if filter_value == "All":
             # Keep all tasks, no further filtering needed
             pass
         elif filter_value in ["To Do", "In Progress", "Completed"]:
-            filtered_tasks = [task for task in filtered_tasks if task["status"] == filter_value]
-            print(f"After status filter: {len(filtered_tasks)} tasks")
+            bits &= index.status(filter_value)
         elif filter_value == "High Priority":
-            filtered_tasks = [task for task in filtered_tasks if task["priority"] == "High"]
-            print(f"After priority filter: {len(filtered_tasks)} tasks")
-        elif filter_value == "Overdue":
-            today = datetime.now().date()
-            filtered_tasks = [
-                task for task in filtered_tasks 
-                if task["due_date"] and 
-                   parser.parse(task["due_date"]).date() < today
-            ]
-            print(f"Overdue tasks: {len(filtered_tasks)}")
-        elif filter_value == "Due Today":
-            today = datetime.now().date()
-            filtered_tasks = [
-                task for task in filtered_tasks 
-                if task["due_date"] and 
-                   parser.parse(task["due_date"]).date() == today
-            ]
-            print(f"Due today tasks: {len(filtered_tasks)}")
+            bits &= index.priority("High")
+        elif filter_value == "Next Up":
+            if next_up is None:
+                next_up = self.task_manager.top_tasks(self.NEXT_UP_COUNT)
+            bits &= index.bits_for_ids(task["id"] for task in next_up)
+        elif filter_value in TaskManager.DUE_FILTERS:
+            bits &= self.task_manager.get_due_filter_bits(filter_value, slot=slot)
+        elif filter_value == "Custom Range" and custom_due_range:
+            bits &= index.due_between(*custom_due_range, slot=slot)
         
         # Finally apply the completed filter - but only if not specifically showing completed tasks
         if not show_completed and filter_value != "Completed":
-            filtered_tasks = [task for task in filtered_tasks if task["status"] != "Completed"]
-            print(f"After hiding completed: {len(filtered_tasks)} tasks")
+            bits &= ~index.status("Completed")
+        
+        # Apply search filter
+        if search_term and bits:
+            bits &= self.task_manager.search_task_bits(search_term, slot=slot)
         
-        return filtered_tasks
+        return bits
+    
+    def _refresh_filter_counts(self):
+        """
+        Refresh the filter dropdown labels with due-date counts before it opens.
+        """
+        counts = self.task_manager.get_due_filter_counts()
+        self._filter_labels = {}
+        labels = []
+        for name in self.FILTER_OPTIONS:
+            label = f"{name} ({counts[name]})" if name in counts else name
+            self._filter_labels[label] = name
+            labels.append(label)
+        self.filter_dropdown.configure(values=labels)
     
-    def _sort_tasks(self, tasks):
+    def _filter_display_name(self, name):
         """
-        Sort tasks based on the selected sort option.
+        Get the text shown in the filter dropdown for a filter name.
         
         Args:
-            tasks (list): Tasks to sort
+            name (str): Filter name
             
         Returns:
-            list: Sorted tasks
+            str: Display text
         """
-        sort_by = self.sort_var.get()
-        
-        if sort_by == "Due Date":
-            # Sort by due date, with tasks without due dates at the end
-            # Add error handling for invalid date formats
-            def get_sort_date(task):
-                if not task.get("due_date"):
-                    return datetime.max
-                try:
-                    return datetime.fromisoformat(task["due_date"])
-                except (ValueError, TypeError):
-                    print(f"Invalid date format for task {task['title']}: {task['due_date']}")
-                    return datetime.max
-            
-            return sorted(tasks, key=get_sort_date)
-        elif sort_by == "Priority":
-            # Sort by priority: High, Medium, Low
-            priority_order = {"High": 0, "Medium": 1, "Low": 2}
-            return sorted(tasks, key=lambda x: priority_order.get(x["priority"], 3))
-        elif sort_by == "Created Date":
-            # Add error handling for invalid date formats
-            def get_created_date(task):
-                if not task.get("created_at"):
-                    return datetime.min
-                try:
-                    return datetime.fromisoformat(task["created_at"])
-                except (ValueError, TypeError):
-                    return datetime.min
-            
-            return sorted(tasks, key=get_created_date)
-        elif sort_by == "Title":
-            return sorted(tasks, key=lambda x: x["title"].lower())
-            
-        return tasks
+        if name == "Custom Range" and self.custom_due_range:
+            start, end = self.custom_due_range
+            return f"{start:%b %d} - {end:%b %d}"
+        return name
     
-    def mark_tasks_for_refresh(self):
-        """Mark tasks data as needing refresh."""
-        self.tasks_need_refresh = True
+    def _on_filter_selected(self, event=None):
+        """
+        Handle a selection in the filter dropdown.
+        """
+        label = self.filter_display_var.get()
+        name = self._filter_labels.get(label, label)
+        
+        if name == "Custom Range...":
+            start = get_centered_date(self.root, title="Select Start Date")
+            end = get_centered_date(self.root, title="Select End Date") if start else None
+            if not start or not end:
+                # Cancelled - keep the previous filter
+                self.filter_display_var.set(self._filter_display_name(self.filter_var.get()))
+                return
+            self.custom_due_range = (min(start, end), max(start, end))
+            name = "Custom Range"
+        
+        self.filter_display_var.set(self._filter_display_name(name))
+        self.filter_var.set(name)
+    
+    def _get_selected_criteria(self):
+        """
+        Get the values ticked in the criteria menu.
+        
+        Returns:
+            dict: Group name -> list of selected values
+        """
+        return {
+            group: [value for value, var in variables.items() if var.get()]
+            for group, variables in self.criteria_vars.items()
+        }
+    
+    def _build_criteria_menu(self):
+        """
+        Rebuild the criteria menu so the tag section reflects current tags.
+        """
+        tag_vars = self.criteria_vars["tag"]
+        for tag in self.task_manager.get_all_tags():
+            if tag not in tag_vars:
+                tag_vars[tag] = tk.BooleanVar(value=False)
+        
+        menu = self.criteria_menu
+        menu.delete(0, "end")
+        
+        sections = [
+            ("Status", self.criteria_vars["status"]),
+            ("Priority", self.criteria_vars["priority"]),
+            ("Tags", tag_vars)
+        ]
+        for label, variables in sections:
+            if not variables:
+                continue
+            if menu.index("end") is not None:
+                menu.add_separator()
+            menu.add_command(label=label, state="disabled")
+            for value, var in variables.items():
+                menu.add_checkbutton(
+                    label=value,
+                    variable=var,
+                    command=self._on_criteria_changed
+                )
+        
+        menu.add_separator()
+        menu.add_command(label="Clear criteria", command=self._clear_criteria)
+    
+    def _on_criteria_changed(self):
+        """
+        Handle a criteria checkbox toggle.
+        """
+        selected = sum(len(values) for values in self._get_selected_criteria().values())
+        self.criteria_button.configure(
+            text=f"Criteria ({selected})" if selected else "Criteria"
+        )
+        self._schedule_refresh()
+    
+    def _clear_criteria(self):
+        """
+        Untick every criteria value.
+        """
+        for variables in self.criteria_vars.values():
+            for var in variables.values():
+                var.set(False)
+        self._on_criteria_changed()
     
-    def mark_drafts_for_refresh(self):
-        """Mark drafts data as needing refresh."""
-        self.drafts_need_refresh = True
+    def _sort_tasks(self, bits, params=None, next_up=None):
+        """
+        Get the tasks in a bitset in the selected sort order.
+        
+        The task manager keeps every sort order presorted, so this is a single
+        ordered pass rather than a comparison sort.
+        
+        Args:
+            bits (int): Bitset of task slots
+            params (dict): Query parameters from _get_query_params; read from
+                the Tk variables if omitted (Tk thread only)
+            next_up (list): Result of top_tasks(NEXT_UP_COUNT) if already
+                computed for this load
+            
+        Returns:
+            list: Sorted tasks
+        """
+        if params is None:
+            params = self._get_query_params()
+        if params["filter"] == "Next Up":
+            # Keep urgency order; the view is only NEXT_UP_COUNT tasks long
+            if next_up is None:
+                next_up = self.task_manager.top_tasks(self.NEXT_UP_COUNT)
+            index = self.task_manager.index
+            return [task for task in next_up if bits >> index.slot_by_id[task["id"]] & 1]
+        
+        sort_by = params["sort_by"]
+        if sort_by not in TaskManager.SORT_OPTIONS:
+            return self.task_manager.index.tasks_for_bits(bits)
+        return self.task_manager.get_sorted_tasks(bits, sort_by)
     
     def _open_add_dialog(self):
         """
         Open the add task dialog.
         """
-        dialog = AddTaskDialog(self.root, self.task_manager)
-        self.root.wait_window(dialog.top)
-        self.mark_tasks_for_refresh()
-        if self.notebook.tab(self.notebook.select(), "text") == "Tasks":
-            self._load_tasks()
+        self.dialogs.show("add_task")
     
     def _on_edit_task(self, task_id):
         """
@@ -575,11 +1063,7 @@ class TodoApp:
         """
         task = self.task_manager.get_task_by_id(task_id)
         if task:
-            dialog = EditTaskDialog(self.root, self.task_manager, task)
-            self.root.wait_window(dialog.top)
-            self.mark_tasks_for_refresh()
-            if self.notebook.tab(self.notebook.select(), "text") == "Tasks":
-                self._load_tasks()
+            self.dialogs.show("edit_task", task)
     
     def _on_delete_task(self, task_id):
         """
@@ -596,9 +1080,6 @@ class TodoApp:
             )
             if confirm:
                 self.task_manager.delete_task(task_id)
-                self.mark_tasks_for_refresh()
-                if self.notebook.tab(self.notebook.select(), "text") == "Tasks":
-                    self._load_tasks()
     
     def _on_status_change(self, task_id, new_status):
         """
@@ -609,34 +1090,112 @@ class TodoApp:
             new_status (str): New status
         """
         self.task_manager.update_task(task_id, status=new_status)
-        self.mark_tasks_for_refresh()
-        if self.notebook.tab(self.notebook.select(), "text") == "Tasks":
+    
+    def _refresh_task_card(self, task_id, moved=False):
+        """
+        Update the task list after one task changed, touching only its card.
+        
+        A task that still matches the view at the same sort position has its
+        card patched; one that dropped out of the view (or was deleted) has
+        its card removed and the grid closes the gap. Anything else, e.g. a
+        task entering the view or moving in the sort order, falls back to a
+        full _load_tasks.
+        
+        Args:
+            task_id (str): ID of the changed, added or deleted task
+            moved (bool): The change altered the task's sort key
+        """
+        # Next Up membership depends on every other task's urgency too
+        if self.filter_var.get() == "Next Up":
             self._load_tasks()
+            return
+        
+        index = self.task_manager.index
+        layout = self.tasks_grid_layout
+        slot = index.slot_by_id.get(task_id)
+        # Only this task is tested against the filter, not the whole list
+        in_view = slot is not None and bool(self._get_filtered_bits(slot=slot))
+        shown = task_id in layout.index_by_key
+        moved = in_view and moved
+        
+        if (in_view and not shown) or moved:
+            self._load_tasks()
+            return
+        
+        if in_view:
+            layout.update_item(task_id, self.task_manager.get_version(task_id), index.slots[slot])
+        elif shown:
+            layout.remove_item(task_id)
+        self._last_render_key = [(key, version) for key, version, _ in layout.items]
+        
+        self._update_summary(len(layout.items))
+        if not layout.items:
+            self.empty_label.pack(pady=50)
+        
+        self.next_up_frame.update_tasks()
+    
+    def _update_summary(self, filtered_count):
+        """
+        Update the summary line above the task grid.
+        
+        Args:
+            filtered_count (int): Number of tasks in the current view
+        """
+        self.debug_label.configure(
+            text=f"Total tasks: {len(self.task_manager.index)} | Filtered: {filtered_count} | Filter: {self.filter_var.get()} | Show Completed: {self.show_completed_var.get()}"
+        )
+    
+    def _schedule_refresh(self):
+        """
+        Request a task list refresh after the debounce window.
+        
+        Every request restarts the window, so a burst of keystrokes or
+        dropdown changes results in one refresh that reads the latest state.
+        """
+        self.refresh_stats["requested"] += 1
+        if self._refresh_job is not None:
+            self.root.after_cancel(self._refresh_job)
+        self._refresh_job = self.root.after(self.REFRESH_DEBOUNCE_MS, self._run_scheduled_refresh)
+    
+    def _cancel_scheduled_refresh(self):
+        """
+        Drop a pending debounced refresh.
+        """
+        if self._refresh_job is not None:
+            self.root.after_cancel(self._refresh_job)
+            self._refresh_job = None
+    
+    def _run_scheduled_refresh(self):
+        """
+        Run the debounced refresh.
+        """
+        self._refresh_job = None
+        self._load_tasks(update_panels=False)
     
     def _on_search_changed(self, *args):
         """
         Handle search input changes.
         """
-        self._load_tasks()
+        self._schedule_refresh()
     
     def _on_filter_changed(self, *args):
         """
         Handle filter changes.
         """
-        self._load_tasks()
+        self._schedule_refresh()
     
     def _on_sort_changed(self, event):
         """
         Handle sort option changes.
         """
-        self._load_tasks()
+        self._schedule_refresh()
     
     def _on_show_completed_changed(self, *args):
         """
         Handle show/hide completed tasks toggle changes.
         """
         print(f"Show completed changed to: {self.show_completed_var.get()}")
-        self._load_tasks()
+        self._schedule_refresh()
     
     def _toggle_completed_visibility(self):
         """
@@ -659,12 +1218,32 @@ class TodoApp:
                 style="secondary.Outline.TButton"
             )
     
+    def _open_quick_find(self):
+        """
+        Open the quick-find dialog.
+        """
+        from .quick_find_dialog import QuickFindDialog
+        QuickFindDialog(self.root, self.task_manager, self._on_quick_find_result)
+    
+    def _on_quick_find_result(self, result):
+        """
+        Show the task or draft picked in quick-find.
+        
+        Args:
+            result: SearchResult chosen by the user
+        """
+        if result.kind == "task":
+            self.notebook.select(self.tasks_tab)
+            self.dialogs.show("view_task", result.item)
+        else:
+            self.notebook.select(self.drafts_tab)
+            self.dialogs.show("view_draft", result.item)
+    
     def _refresh_tasks(self):
         """
         Explicitly refresh the tasks data and UI.
         """
         print("Manually refreshing tasks...")
-        self.mark_tasks_for_refresh()
         self._load_tasks()
     
     def _toggle_theme(self):
@@ -674,8 +1253,25 @@ class TodoApp:
         """
         pass
             
-    def run(self):
+    def run(self, use_asyncio=False):
         """
         Run the application.
+        
+        Args:
+            use_asyncio (bool): Drive Tk from an asyncio event loop so
+                coroutines can be scheduled with self.async_runner.create_task
         """
-        self.root.mainloop()
+        if use_asyncio:
+            self.async_runner = AsyncTkRunner(self.root)
+            self.async_runner.run()
+            print(f"Frame pacing: {self.async_runner.frame_stats()}")
+        else:
+            self.root.mainloop()
+        
+        print(f"Idle scheduler: {self.idle_scheduler.stats()}")
+        print(f"Dialog build times (ms): {self.dialogs.build_times}")
+        print(f"View model cache: {self.view_models.stats()}")
+        
+        # Let workers finish and make sure every change is on disk
+        self.background.shutdown()
+        self.task_manager.flush_saves()
@@ -0,0 +1,104 @@
+"""
+Compact frame listing the most urgent open tasks.
+"""
+from tkinter import ttk
+from ttkbootstrap.constants import *
+
+from ..utils.helpers import format_relative_date
+from .dialog_manager import dialog_manager_for
+from .view_models import TaskViewModel
+
+class NextUpFrame(ttk.Frame):
+    """
+    Frame showing the top few tasks from TaskManager.top_tasks.
+    """
+
+    def __init__(self, parent, task_manager, count=5, view_models=None):
+        """
+        Initialize the next up frame.
+
+        Args:
+            parent: Parent widget
+            task_manager: TaskManager instance
+            count (int): Number of tasks to list
+            view_models (ViewModelCache): Display-field cache shared with the task cards
+        """
+        super().__init__(parent, padding=(10, 0))
+
+        self.task_manager = task_manager
+        self.count = count
+        self.view_models = view_models
+
+        self._create_widgets()
+        self.update_tasks()
+
+    def _create_widgets(self):
+        """
+        Create the frame widgets.
+        """
+        ttk.Label(
+            self,
+            text="Next Up",
+            font=("Helvetica", 14, "bold")
+        ).pack(anchor=W, pady=(0, 5))
+
+        self.rows_frame = ttk.Frame(self)
+        self.rows_frame.pack(fill=X)
+
+        # One reusable label per row; text is swapped on update
+        self.row_labels = []
+        for i in range(self.count):
+            label = ttk.Label(self.rows_frame, text="", font=("Helvetica", 10), cursor="hand2")
+            label.grid(row=i, column=0, sticky=W, pady=1)
+            label.bind("<Button-1>", lambda event, row=i: self._on_row_click(row))
+            self.row_labels.append(label)
+
+        self.empty_label = ttk.Label(
+            self.rows_frame,
+            text="Nothing urgent. Enjoy the calm.",
+            font=("Helvetica", 10),
+            foreground="gray"
+        )
+        self.tasks = []
+
+    def update_tasks(self, top_tasks=None):
+        """
+        Refresh the listed tasks.
+
+        Args:
+            top_tasks (list): Most urgent tasks, most urgent first, at least
+                count long if there are that many (e.g. computed for the task
+                list's Next Up filter); fetched from the task manager if omitted
+        """
+        if top_tasks is None:
+            top_tasks = self.task_manager.top_tasks(self.count)
+        self.tasks = top_tasks[:self.count]
+
+        for i, label in enumerate(self.row_labels):
+            if i < len(self.tasks):
+                task = self.tasks[i]
+                view_model = self.view_models.get(task) if self.view_models else TaskViewModel(task)
+                # Relative labels ("Today", "Tomorrow") change with the day, so
+                # they are not part of the per-version view model
+                due = format_relative_date(task["due_date"]) if task.get("due_date") else "No due date"
+                label.configure(
+                    text=f"{view_model.priority:<6}  {view_model.title}  ·  {due}",
+                    style=view_model.priority_label_style
+                )
+            else:
+                label.configure(text="")
+
+        if self.tasks:
+            self.empty_label.grid_forget()
+        else:
+            self.empty_label.grid(row=0, column=0, sticky=W)
+
+    def _on_row_click(self, row):
+        """
+        Open the task shown in a row.
+
+        Args:
+            row (int): Row index
+        """
+        if row < len(self.tasks):
+            dialog_manager_for(self).show("view_task", self.tasks[row])
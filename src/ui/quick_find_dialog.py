@@ -0,0 +1,154 @@
+"""
+Quick-find dialog searching tasks and drafts together.
+"""
+import tkinter as tk
+from tkinter import ttk
+from ttkbootstrap.constants import *
+
+from ..utils.helpers import center_window
+
+class QuickFindDialog:
+    """
+    Dialog listing search hits across tasks and drafts as you type.
+    """
+
+    MAX_RESULTS = 50
+
+    def __init__(self, parent, task_manager, on_open):
+        """
+        Initialize the quick-find dialog.
+
+        Args:
+            parent: Parent window
+            task_manager: TaskManager instance
+            on_open (callable): Called with a SearchResult when one is chosen
+        """
+        self.parent = parent
+        self.task_manager = task_manager
+        self.on_open = on_open
+        self.results = []
+        self.selected = 0
+
+        # Create the dialog
+        self.top = tk.Toplevel(parent)
+        self.top.title("Quick Find")
+        self.top.geometry("650x400")
+        self.top.resizable(False, False)
+        self.top.transient(parent)
+        self.top.grab_set()
+        self.top.configure(bg="#1C1C1C")
+
+        self.query_var = tk.StringVar()
+        self.query_var.trace_add("write", lambda *args: self._update_results())
+
+        # Create widgets
+        self._create_widgets()
+
+        # Center the dialog on the parent window
+        center_window(self.top, parent)
+        self.entry.focus_set()
+
+    def _create_widgets(self):
+        """
+        Create the dialog widgets.
+        """
+        frame = ttk.Frame(self.top, padding=15)
+        frame.pack(fill=BOTH, expand=True)
+
+        self.entry = ttk.Entry(frame, textvariable=self.query_var, font=("Helvetica", 12))
+        self.entry.pack(fill=X, pady=(0, 10))
+        self.entry.bind("<Down>", lambda e: self._move_selection(1))
+        self.entry.bind("<Up>", lambda e: self._move_selection(-1))
+        self.entry.bind("<Return>", lambda e: self._open_selected())
+        self.top.bind("<Escape>", lambda e: self.top.destroy())
+
+        # Results are drawn into a read-only Text so match spans can be highlighted
+        self.results_text = tk.Text(
+            frame,
+            wrap=tk.NONE,
+            font=("Helvetica", 11),
+            background="#3D3D3D",
+            foreground="#FFFFFF",
+            cursor="hand2",
+            borderwidth=0,
+            highlightthickness=0
+        )
+        self.results_text.pack(fill=BOTH, expand=True)
+        self.results_text.tag_configure("match", background="#5E5E5E", foreground="#FFD54F")
+        self.results_text.tag_configure("kind", foreground="#7F7F7F")
+        self.results_text.tag_configure("selected", background="#1C1C1C")
+        self.results_text.tag_raise("match")
+        self.results_text.bind("<Button-1>", self._on_click)
+        self.results_text.configure(state="disabled")
+
+    def _update_results(self):
+        """
+        Re-run the search and redraw the result list.
+        """
+        query = self.query_var.get().strip()
+        self.results = self.task_manager.search(query, limit=self.MAX_RESULTS) if query else []
+        self.selected = 0
+
+        text = self.results_text
+        text.configure(state="normal")
+        text.delete("1.0", tk.END)
+        for line, result in enumerate(self.results, start=1):
+            prefix = "Task   " if result.kind == "task" else "Draft  "
+            text.insert(tk.END, prefix, "kind")
+            text.insert(tk.END, result.item["title"])
+            for start, end in result.spans.get("title", []):
+                text.tag_add(
+                    "match",
+                    f"{line}.{len(prefix) + start}",
+                    f"{line}.{len(prefix) + end}"
+                )
+            if "title" not in result.spans:
+                # Say where the match is when it is not in the title
+                where = ", ".join(field for field in result.spans)
+                text.insert(tk.END, f"   (in {where})", "kind")
+            text.insert(tk.END, "\n")
+        if query and not self.results:
+            text.insert(tk.END, "No matches", "kind")
+        text.configure(state="disabled")
+        self._highlight_selection()
+
+    def _highlight_selection(self):
+        """
+        Mark the selected result line.
+        """
+        self.results_text.tag_remove("selected", "1.0", tk.END)
+        if self.results:
+            line = self.selected + 1
+            self.results_text.tag_add("selected", f"{line}.0", f"{line}.end")
+            self.results_text.see(f"{line}.0")
+
+    def _move_selection(self, step):
+        """
+        Move the selection up or down.
+
+        Args:
+            step (int): Lines to move
+        """
+        if self.results:
+            self.selected = (self.selected + step) % len(self.results)
+            self._highlight_selection()
+        return "break"
+
+    def _on_click(self, event):
+        """
+        Open the clicked result.
+        """
+        line = int(self.results_text.index(f"@{event.x},{event.y}").split(".")[0])
+        if 1 <= line <= len(self.results):
+            self.selected = line - 1
+            self._open_selected()
+
+    def _open_selected(self):
+        """
+        Close the dialog and hand the selected result to the callback.
+        """
+        if not self.results:
+            return
+        result = self.results[self.selected]
+        self.top.destroy()
+        self.on_open(result)
@@ -5,13 +5,13 @@ import tkinter as tk
 from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from ..data.event_bus import TASK_EVENTS, TASK_UPDATED
 
 class StatisticsFrame(ttk.Frame):
     """
     Frame for displaying task statistics.
     """
+    STAT_FIELDS = frozenset(["status", "priority", "due_date"])  # task fields the counts depend on
     
     def __init__(self, parent, task_manager):
         """
@@ -25,6 +25,10 @@ class StatisticsFrame(ttk.Frame):
         
         self.task_manager = task_manager
         
+        # Recount once per burst of task changes rather than once per change
+        self._update_job = None
+        self.task_manager.events.subscribe(TASK_EVENTS, self._on_task_event)
+        
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=1)
         
@@ -115,3 +119,25 @@ class StatisticsFrame(ttk.Frame):
             self.completion_rate_label.config(text=f"{completion_rate:.1f}%")
         else:
             self.completion_rate_label.config(text="0.0%")
+    
+    def _on_task_event(self, event):
+        """
+        Schedule a statistics update after a task change.
+        
+        Updates that leave status, priority and due date alone (e.g. a new
+        title) do not affect any count and are ignored.
+        
+        Args:
+            event (ChangeEvent): The change
+        """
+        if event.type == TASK_UPDATED and not event.changed & self.STAT_FIELDS:
+            return
+        if self._update_job is None:
+            self._update_job = self.after_idle(self._run_scheduled_update)
+    
+    def _run_scheduled_update(self):
+        """
+        Run the update scheduled by _on_task_event.
+        """
+        self._update_job = None
+        self.update_stats()
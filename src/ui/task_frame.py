@@ -6,17 +6,17 @@ from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from datetime import datetime
-from dateutil import parser
 
-from ..utils.helpers import format_date
-from .view_task_dialog import ViewTaskDialog  # Import the new dialog
+from ..utils.card_template import CARD_WIDTH, CARD_HEIGHT
+from .dialog_manager import dialog_manager_for
+from .view_models import TaskViewModel
 
 class TaskFrame(ttk.Frame):
     """
     Frame for displaying an individual task.
     """
     
-    def __init__(self, parent, task, on_status_change, on_edit, on_delete):
+    def __init__(self, parent, task, on_status_change, on_edit, on_delete, view_models=None):
         """
         Initialize the task frame.
         
@@ -26,75 +26,75 @@ class TaskFrame(ttk.Frame):
             on_status_change (callable): Callback for status change
             on_edit (callable): Callback for edit action
             on_delete (callable): Callback for delete action
+            view_models (ViewModelCache): Shared display-field cache; without
+                one the fields are derived on every update
         """
-        super().__init__(parent, padding=5)
-        
         self.task = task
+        self.view_models = view_models
+        self.view_model = self._get_view_model(task)
         self.on_status_change = on_status_change
         self.on_edit = on_edit
         self.on_delete = on_delete
         
-        # Configure the frame to properly expand in the grid
-        self.configure(width=300, height=200)
+        # Fixed card size; styles and fonts come from the card template
+        super().__init__(
+            parent,
+            padding=5,
+            width=CARD_WIDTH,
+            height=CARD_HEIGHT,
+            style=self.view_model.frame_style
+        )
         self.pack_propagate(False)  # Prevent the frame from shrinking to fit its contents
+        self.grid_propagate(False)
         
-        # Apply appropriate styling based on task status
-        self._apply_styling()
+        # Widgets are built once and then populated from the task, so the
+        # card can be patched in place when the task changes
         self._create_widgets()
+        self._populate()
     
-    def _apply_styling(self):
+    def update_task(self, task):
         """
-        Apply styling based on task status and priority.
-        """
-        # Create a style name based on the task's status and priority
-        if self.task["status"] == "Completed":
-            self.configure(style="success.TFrame")
-        elif self.task["priority"] == "High":
-            self.configure(style="danger.TFrame")
-        elif self.task["priority"] == "Medium":
-            self.configure(style="warning.TFrame")
-        else:
-            self.configure(style="info.TFrame")
+        Show a (possibly different) task on this card without rebuilding it.
         
-        # Custom colors for the task container
-        # For completed tasks, use a slightly lighter background
-        if self.task["status"] == "Completed":
-            self.container_bg = "#3D3D3D"
-            self.text_color = "#FFFFFF"
-        # For high priority tasks, use a slightly reddish background
-        elif self.task["priority"] == "High":
-            self.container_bg = "#3D3D3D"
-            self.text_color = "#FFFFFF"
-        else:
-            self.container_bg = "#3D3D3D"
-            self.text_color = "#FFFFFF"
+        Args:
+            task (dict): Task data
+        """
+        self.task = task
+        view_model = self._get_view_model(task)
+        if view_model is self.view_model:
+            # Same task version as already shown
+            return
+        self.view_model = view_model
+        self.configure(style=view_model.frame_style)
+        self._populate()
     
-    def _format_date(self, date_str):
+    def _get_view_model(self, task):
         """
-        Format date string for display.
+        Get the display fields of a task, from the shared cache if there is one.
         
         Args:
-            date_str: ISO format date string
+            task (dict): Task data
             
         Returns:
-            str: Formatted date string or empty string if None
+            TaskViewModel: Display fields
         """
-        return format_date(date_str)
+        return self.view_models.get(task) if self.view_models else TaskViewModel(task)
     
     def _create_widgets(self):
         """
         Create the widgets for the task frame.
         """
         # Container with border and padding
-        container = ttk.Frame(self, padding=8, relief="raised", borderwidth=1)
+        container = ttk.Frame(self, style="Card.TFrame")
         container.pack(fill=BOTH, expand=True)
+        self.container = container
         
         # Header row (title, status, buttons)
-        header_frame = ttk.Frame(container)
+        header_frame = ttk.Frame(container, style="TFrame")
         header_frame.pack(fill=X)
         
         # Status checkbox - left side
-        self.toggle_var = tk.BooleanVar(value=self.task["status"] == "Completed")
+        self.toggle_var = tk.BooleanVar(value=False)
         toggle_button = ttk.Checkbutton(
             header_frame,
             variable=self.toggle_var,
@@ -103,42 +103,20 @@ class TaskFrame(ttk.Frame):
         )
         toggle_button.pack(side=LEFT, padx=(0, 5))
         
-        # Title with appropriate styling - using white text
-        title_style = "TLabel"
-        if self.task["status"] == "Completed":
-            title_style = "success.TLabel"
-        elif self.task["priority"] == "High":
-            title_style = "danger.TLabel"
-            
-        title_label = ttk.Label(
+        # Title - white text from the card template; restyled in _populate
+        self.title_label = ttk.Label(
             header_frame,
-            text=self.task["title"],
-            font=("Helvetica", 12, "bold"),
-            style=title_style,
-            foreground="#FFFFFF",  # Ensuring white text
+            style=self.view_model.title_style,
             wraplength=250  # Add wrapping for long titles
         )
-        title_label.pack(side=LEFT, padx=5, fill=X, expand=True)
+        self.title_label.pack(side=LEFT, padx=5, fill=X, expand=True)
         
         # Priority badge with white text
-        priority_colors = {
-            "High": "danger", 
-            "Medium": "warning", 
-            "Low": "info"
-        }
-        priority_style = priority_colors.get(self.task["priority"], "secondary")
-        priority_badge = ttk.Label(
-            header_frame,
-            text=self.task["priority"],
-            style=f"{priority_style}.Inverse.TLabel",
-            font=("Helvetica", 9),
-            padding=(5, 2),
-            foreground="#FFFFFF"
-        )
-        priority_badge.pack(side=LEFT, padx=5)
+        self.priority_badge = ttk.Label(header_frame, style=self.view_model.priority_style)
+        self.priority_badge.pack(side=LEFT, padx=5)
         
         # Button frame - right side
-        button_frame = ttk.Frame(header_frame)
+        button_frame = ttk.Frame(header_frame, style="TFrame")
         button_frame.pack(side=RIGHT, anchor=CENTER)  # Ensure the frame is centered vertically
         
         # Add View button
@@ -173,68 +151,83 @@ class TaskFrame(ttk.Frame):
         delete_button.pack(side=LEFT, padx=2, pady=(2, 3))  # Added pady for top and bottom
         
         # Details section - use grid for better alignment
-        details_frame = ttk.Frame(container, padding=(10, 5, 0, 0))
-        details_frame.pack(fill=X, expand=True)
+        self.details_frame = ttk.Frame(container, padding=(10, 5, 0, 0), style="TFrame")
+        self.details_frame.pack(fill=X, expand=True)
         
-        details_frame.columnconfigure(0, weight=1)
-        details_frame.columnconfigure(1, weight=1)
-        details_frame.columnconfigure(2, weight=1)
+        self.details_frame.columnconfigure(0, weight=1)
+        self.details_frame.columnconfigure(1, weight=1)
+        self.details_frame.columnconfigure(2, weight=1)
         
         # Status indicator
-        status_label = ttk.Label(
-            details_frame,
-            text=f"Status: {self.task['status']}",
-            font=("Helvetica", 9)
-        )
-        status_label.grid(row=0, column=0, sticky=W)
+        self.status_label = ttk.Label(self.details_frame, style="CardBody.TLabel")
+        self.status_label.grid(row=0, column=0, sticky=W)
         
         # Due date with formatting
-        due_date_text = self._format_date(self.task["due_date"])
-        due_date_label = ttk.Label(
-            details_frame,
-            text=f"Due: {due_date_text}",
-            font=("Helvetica", 9)
+        self.due_date_label = ttk.Label(self.details_frame, style="CardBody.TLabel")
+        self.due_date_label.grid(row=0, column=1, sticky=W)
+        
+        # Description - packed only when the task has one
+        self.desc_label = ttk.Label(
+            container,
+            wraplength=300,  # Adjusted wraplength for better display
+            justify=LEFT,
+            style="CardMuted.TLabel"
         )
-        due_date_label.grid(row=0, column=1, sticky=W)
         
-        # Description (if exists)
-        if self.task["description"]:
-            # Limit description length for display
-            desc_text = self.task["description"]
-            if len(desc_text) > 25:
-                desc_text = desc_text[:25] + "..."
-                
-            desc_label = ttk.Label(
-                container,
-                text=desc_text,
-                wraplength=300,  # Adjusted wraplength for better display
-                justify=LEFT,
-                font=("Helvetica", 9),
-                foreground="gray"
-            )
-            desc_label.pack(fill=X, padx=10, pady=(5, 0), anchor=W)
+        # Tags - packed only when the task has some
+        self.tags_frame = ttk.Frame(container, style="TFrame")
+        self.tag_labels = []
+    
+    def _populate(self):
+        """
+        Fill the card widgets from the current view model.
+        """
+        view_model = self.view_model
+        
+        self.toggle_var.set(view_model.completed)
+        self.title_label.configure(text=view_model.title, style=view_model.title_style)
+        self.priority_badge.configure(text=view_model.priority, style=view_model.priority_style)
+        self.status_label.configure(text=view_model.status_text)
+        self.due_date_label.configure(text=view_model.due_text)
+        
+        # Description preview (if exists)
+        if view_model.description:
+            self.desc_label.configure(text=view_model.description)
+            self.desc_label.pack(fill=X, padx=10, pady=(5, 0), anchor=W, after=self.details_frame)
+        else:
+            self.desc_label.pack_forget()
         
         # Tags (if exist) with white text
-        if self.task["tags"]:
-            tags_frame = ttk.Frame(container)
-            tags_frame.pack(fill=X, padx=10, pady=(5, 0), anchor=W)
-            
-            for tag in self.task["tags"]:
-                tag_label = ttk.Label(
-                    tags_frame,
-                    text=tag,
-                    style="secondary.Inverse.TLabel",
-                    font=("Helvetica", 8),
-                    padding=(5, 0),
-                    foreground="#FFFFFF"  # Ensuring white text for tags
-                )
+        self._populate_tags(view_model.tags)
+    
+    def _populate_tags(self, tags):
+        """
+        Show the tag chips for a list of tags, reusing existing chip labels.
+        
+        Args:
+            tags (tuple): Tag names
+        """
+        if not tags:
+            self.tags_frame.pack_forget()
+            return
+        
+        # Create any missing chips, hide surplus ones
+        while len(self.tag_labels) < len(tags):
+            self.tag_labels.append(ttk.Label(self.tags_frame, style="CardChip.secondary.Inverse.TLabel"))
+        for i, tag_label in enumerate(self.tag_labels):
+            if i < len(tags):
+                tag_label.configure(text=tags[i])
                 tag_label.pack(side=LEFT, padx=(0, 5))
+            else:
+                tag_label.pack_forget()
+        
+        self.tags_frame.pack(fill=X, padx=10, pady=(5, 0), anchor=W)
 
     def _on_view(self):
         """
         Handle view button click.
         """
-        ViewTaskDialog(self.winfo_toplevel(), self.task)
+        dialog_manager_for(self).show("view_task", self.task)
 
     def _on_status_toggled(self):
         """
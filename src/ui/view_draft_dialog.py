@@ -6,37 +6,27 @@ from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 
-from ..utils.helpers import center_window, format_date
+from ..utils.helpers import format_date
+from .dialog_manager import ReusableDialog
 
-class ViewDraftDialog:
+class ViewDraftDialog(ReusableDialog):
     """
     Dialog for viewing draft details in read-only mode.
     """
     
-    def __init__(self, parent, draft):
+    TITLE = "View Draft"
+    SIZE = (650, 450)
+    
+    def __init__(self, parent, task_manager):
         """
         Initialize the view draft dialog.
         
         Args:
             parent: Parent window
-            draft: Draft to view
+            task_manager: TaskManager instance
         """
-        self.parent = parent
-        self.draft = draft
-        
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title(f"View Draft: {draft['title']}")
-        self.top.geometry("650x450")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+        self.draft = None
+        super().__init__(parent, task_manager)
     
     def _create_widgets(self):
         """
@@ -49,12 +39,12 @@ class ViewDraftDialog:
         title_frame = ttk.Frame(frame)
         title_frame.pack(fill=X, pady=(0, 15))
         
-        ttk.Label(
+        self.title_label = ttk.Label(
             title_frame, 
-            text=self.draft["title"],
             font=("Helvetica", 16, "bold"),
             foreground="#FFFFFF"
-        ).pack(anchor=W)
+        )
+        self.title_label.pack(anchor=W)
         
         # Draft indicator badge
         draft_badge = ttk.Label(
@@ -71,75 +61,85 @@ class ViewDraftDialog:
         ttk.Separator(frame, orient='horizontal').pack(fill=X, pady=10)
         
         # Created date
-        created_date = format_date(self.draft["created_at"])
+        self.created_label = ttk.Label(frame, font=("Helvetica", 11))
+        self.created_label.pack(anchor=W, pady=(0, 15))
+        
+        # Tags section, packed only when the draft has tags
+        self.tags_section = ttk.Frame(frame)
         ttk.Label(
-            frame,
-            text=f"Created on: {created_date}",
-            font=("Helvetica", 11)
-        ).pack(anchor=W, pady=(0, 15))
+            self.tags_section,
+            text="Tags:",
+            font=("Helvetica", 12, "bold")
+        ).pack(anchor=W, pady=(0, 5))
         
-        # Tags section
-        if self.draft.get("tags") and len(self.draft["tags"]) > 0:
-            ttk.Label(
-                frame,
-                text="Tags:",
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor=W, pady=(0, 5))
-            
-            tags_frame = ttk.Frame(frame)
-            tags_frame.pack(fill=X, pady=(0, 15), anchor=W)
-            
-            for tag in self.draft["tags"]:
-                tag_label = ttk.Label(
-                    tags_frame,
-                    text=tag,
-                    style="info.Inverse.TLabel",
-                    font=("Helvetica", 9),
-                    padding=(5, 2),
-                    foreground="#FFFFFF"
-                )
-                tag_label.pack(side=LEFT, padx=(0, 5), pady=2)
+        self.tags_frame = ttk.Frame(self.tags_section)
+        self.tags_frame.pack(fill=X, pady=(0, 15), anchor=W)
         
         # Description section
-        ttk.Label(
+        self.description_header = ttk.Label(
             frame,
             text="Description:",
             font=("Helvetica", 12, "bold")
-        ).pack(anchor=W, pady=(0, 5))
+        )
+        self.description_header.pack(anchor=W, pady=(0, 5))
         
         # Description text in a scrollable frame
         desc_frame = ttk.Frame(frame)
         desc_frame.pack(fill=BOTH, expand=True, pady=(0, 15))
         
         # Read-only text widget for description
-        desc_text = tk.Text(
+        self.desc_text = tk.Text(
             desc_frame,
             wrap=tk.WORD,
             width=40,
             height=10,
             font=("Helvetica", 11),
             background="#3D3D3D",  # Slightly lighter than background
-            foreground="#FFFFFF"
+            foreground="#FFFFFF",
+            state="disabled"
         )
-        scrollbar = ttk.Scrollbar(desc_frame, orient=VERTICAL, command=desc_text.yview)
-        desc_text.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(desc_frame, orient=VERTICAL, command=self.desc_text.yview)
+        self.desc_text.configure(yscrollcommand=scrollbar.set)
         
-        desc_text.pack(side=LEFT, fill=BOTH, expand=True)
+        self.desc_text.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=RIGHT, fill=Y)
         
-        # Insert the description text and make it read-only
-        if self.draft.get("description"):
-            desc_text.insert("1.0", self.draft["description"])
-        else:
-            desc_text.insert("1.0", "No description provided.")
-        
-        desc_text.configure(state="disabled")  # Make it read-only
-        
         # Close button at the bottom
         ttk.Button(
             frame,
             text="Close",
-            command=self.top.destroy,
+            command=self.close,
             style="secondary.TButton",
             width=15
         ).pack(side=RIGHT, pady=(10, 0))
+    
+    def _populate(self, draft):
+        """
+        Fill the dialog in with a draft's details.
+        
+        Args:
+            draft: Draft to view
+        """
+        self.draft = draft
+        self.top.title(f"View Draft: {draft['title']}")
+        self.title_label.configure(text=draft["title"])
+        self.created_label.configure(text=f"Created on: {format_date(draft['created_at'])}")
+        
+        # Tags section
+        for chip in self.tags_frame.winfo_children():
+            chip.destroy()
+        if draft.get("tags"):
+            for tag in draft["tags"]:
+                ttk.Label(
+                    self.tags_frame,
+                    text=tag,
+                    style="info.Inverse.TLabel",
+                    font=("Helvetica", 9),
+                    padding=(5, 2),
+                    foreground="#FFFFFF"
+                ).pack(side=LEFT, padx=(0, 5), pady=2)
+            self.tags_section.pack(fill=X, anchor=W, before=self.description_header)
+        else:
+            self.tags_section.pack_forget()
+        
+        self._set_text(self.desc_text, draft.get("description") or "No description provided.")
@@ -0,0 +1,188 @@
+"""
+Display-ready task fields shared by every kind of task card.
+"""
+from collections import OrderedDict
+
+from ..data.event_bus import TASK_EVENTS, TASK_UPDATED, TASK_DELETED, BULK_RELOADED
+from ..utils.helpers import format_date
+from ..utils.card_template import badge_style, title_style
+
+PRIORITY_STYLES = {
+    "High": "danger",
+    "Medium": "warning",
+    "Low": "info"
+}
+
+DESCRIPTION_PREVIEW = 25
+TITLE_PREVIEW = 60
+
+
+class TaskViewModel:
+    """
+    The strings and style names a task card shows for one task version.
+
+    Attributes:
+        completed (bool): Task status is Completed
+        priority (str): Priority level
+        title (str): Full title
+        short_title (str): Title cut to TITLE_PREVIEW characters
+        frame_style (str): ttk style of the card frame
+        title_style (str): ttk style of the title label
+        priority_style (str): ttk style of the priority badge
+        priority_label_style (str): ttk style of text in the priority color
+        status_text (str): "Status: ..." line
+        due_date (str): Formatted due date, "Not set" if there is none
+        due_text (str): "Due: ..." line
+        description (str): Description cut to DESCRIPTION_PREVIEW characters
+        tags (tuple): Tag names
+    """
+
+    __slots__ = (
+        "completed", "priority", "title", "short_title", "frame_style",
+        "title_style", "priority_style", "priority_label_style", "status_text",
+        "due_date", "due_text", "description", "tags"
+    )
+
+    def __init__(self, task):
+        """
+        Derive the display fields of a task.
+
+        Args:
+            task (dict): Task data
+        """
+        self.completed = task["status"] == "Completed"
+        self.priority = task["priority"]
+        priority_color = PRIORITY_STYLES.get(self.priority, "secondary")
+
+        self.title = task["title"]
+        self.short_title = self.title if len(self.title) <= TITLE_PREVIEW else self.title[:TITLE_PREVIEW] + "..."
+
+        if self.completed:
+            self.frame_style = "success.TFrame"
+            self.title_style = title_style("success")
+        elif self.priority == "High":
+            self.frame_style = "danger.TFrame"
+            self.title_style = title_style("danger")
+        else:
+            self.frame_style = f"{PRIORITY_STYLES.get(self.priority, 'info')}.TFrame"
+            self.title_style = title_style()
+        self.priority_style = badge_style(priority_color)
+        self.priority_label_style = f"{priority_color}.TLabel"
+
+        self.status_text = f"Status: {task['status']}"
+        self.due_date = format_date(task["due_date"])
+        self.due_text = f"Due: {self.due_date}"
+
+        description = task["description"] or ""
+        if len(description) > DESCRIPTION_PREVIEW:
+            description = description[:DESCRIPTION_PREVIEW] + "..."
+        self.description = description
+        self.tags = tuple(task["tags"] or ())
+
+
+class ViewModelCache:
+    """
+    Bounded LRU of TaskViewModels, one per task, valid for one task version.
+
+    A task's entry is reused as long as TaskManager reports the version it
+    was built for, so re-renders, recycled cards and canvas cards share one
+    derivation per change. Change events drop entries for updated, deleted
+    or reloaded tasks so the cache does not hold on to dead versions.
+    """
+
+    def __init__(self, task_manager, max_size=4096):
+        """
+        Initialize the cache.
+
+        Args:
+            task_manager: TaskManager instance, for versions and change events
+            max_size (int): Maximum number of cached view models
+        """
+        self.task_manager = task_manager
+        self.max_size = max_size
+        self._entries = OrderedDict()  # task id -> (version, TaskViewModel)
+        self.hits = 0
+        self.misses = 0
+        self.unsubscribe = task_manager.events.subscribe(TASK_EVENTS, self._on_task_event)
+
+    def get(self, task):
+        """
+        Get the view model of a task, building it if the task changed.
+
+        Args:
+            task (dict): Task data
+
+        Returns:
+            TaskViewModel: Display fields of the task
+        """
+        task_id = task["id"]
+        version = self.task_manager.get_version(task_id)
+        entry = self._entries.get(task_id)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self._entries.move_to_end(task_id)
+            return entry[1]
+
+        self.misses += 1
+        view_model = TaskViewModel(task)
+        # Version 0 means the task is not (or no longer) stored; do not cache it
+        if version:
+            self._entries[task_id] = (version, view_model)
+            self._entries.move_to_end(task_id)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return view_model
+
+    def prefill(self, tasks, batch=20):
+        """
+        Build the view models of tasks that are not cached yet, in batches.
+
+        Meant to run as an IdleScheduler job ahead of rendering, so cards
+        scrolled into view find their view model ready. Tasks that are
+        already cached are skipped without counting as hits.
+
+        Args:
+            tasks (list): Tasks to prepare
+            batch (int): Tasks handled per step
+
+        Yields:
+            None: After every batch
+        """
+        entries = self._entries
+        get_version = self.task_manager.get_version
+        for start in range(0, len(tasks), batch):
+            for task in tasks[start:start + batch]:
+                entry = entries.get(task["id"])
+                if entry is None or entry[0] != get_version(task["id"]):
+                    self.get(task)
+            yield
+
+    def clear(self):
+        """
+        Drop every cached view model.
+        """
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Get cache figures for diagnostics.
+
+        Returns:
+            dict: Entries, hits and misses
+        """
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _on_task_event(self, event):
+        """
+        Drop entries the change made stale.
+
+        Args:
+            event (ChangeEvent): The change
+        """
+        if event.type == BULK_RELOADED:
+            self._entries.clear()
+        elif event.type in (TASK_UPDATED, TASK_DELETED):
+            # A card refreshed by an earlier handler may already have cached the new version
+            entry = self._entries.get(event.item_id)
+            if entry is not None and entry[0] != self.task_manager.get_version(event.item_id):
+                del self._entries[event.item_id]
@@ -6,37 +6,38 @@ from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 
-from ..utils.helpers import center_window, format_date
+from ..utils.helpers import format_date
+from .dialog_manager import ReusableDialog
 
-class ViewTaskDialog:
+STATUS_STYLES = {
+    "To Do": "info",
+    "In Progress": "warning",
+    "Completed": "success"
+}
+
+PRIORITY_STYLES = {
+    "High": "danger",
+    "Medium": "warning",
+    "Low": "info"
+}
+
+class ViewTaskDialog(ReusableDialog):
     """
     Dialog for viewing task details in read-only mode.
     """
     
-    def __init__(self, parent, task):
+    TITLE = "View Task"
+    
+    def __init__(self, parent, task_manager):
         """
         Initialize the view task dialog.
         
         Args:
             parent: Parent window
-            task: Task to view
+            task_manager: TaskManager instance
         """
-        self.parent = parent
-        self.task = task
-        
-        # Create the dialog
-        self.top = tk.Toplevel(parent)
-        self.top.title(f"View Task: {task['title']}")
-        self.top.geometry("650x500")
-        self.top.resizable(False, False)
-        self.top.transient(parent)
-        self.top.grab_set()
-        
-        # Create widgets
-        self._create_widgets()
-        
-        # Center the dialog on the parent window
-        center_window(self.top, parent)
+        self.task = None
+        super().__init__(parent, task_manager)
     
     def _create_widgets(self):
         """
@@ -49,46 +50,30 @@ class ViewTaskDialog:
         title_frame = ttk.Frame(frame)
         title_frame.pack(fill=X, pady=(0, 15))
         
-        ttk.Label(
+        self.title_label = ttk.Label(
             title_frame, 
-            text=self.task["title"],
             font=("Helvetica", 16, "bold"),
             foreground="#FFFFFF"
-        ).pack(anchor=W)
+        )
+        self.title_label.pack(anchor=W)
         
         # Status badge
-        status_style = {
-            "To Do": "info",
-            "In Progress": "warning",
-            "Completed": "success"
-        }.get(self.task["status"], "secondary")
-        
-        status_badge = ttk.Label(
+        self.status_badge = ttk.Label(
             title_frame,
-            text=self.task["status"],
-            style=f"{status_style}.Inverse.TLabel",
             font=("Helvetica", 10),
             padding=(5, 2),
             foreground="#FFFFFF"
         )
-        status_badge.pack(anchor=W, pady=(5, 0))
+        self.status_badge.pack(anchor=W, pady=(5, 0))
         
         # Priority badge
-        priority_style = {
-            "High": "danger",
-            "Medium": "warning",
-            "Low": "info"
-        }.get(self.task["priority"], "secondary")
-        
-        priority_badge = ttk.Label(
+        self.priority_badge = ttk.Label(
             title_frame,
-            text=f"Priority: {self.task['priority']}",
-            style=f"{priority_style}.Inverse.TLabel",
             font=("Helvetica", 10),
             padding=(5, 2),
             foreground="#FFFFFF"
         )
-        priority_badge.pack(anchor=W, pady=(5, 0))
+        self.priority_badge.pack(anchor=W, pady=(5, 0))
         
         # Separator
         ttk.Separator(frame, orient='horizontal').pack(fill=X, pady=10)
@@ -98,93 +83,115 @@ class ViewTaskDialog:
         dates_frame.pack(fill=X, pady=(0, 15))
         
         # Created date
-        created_date = format_date(self.task["created_at"])
-        ttk.Label(
-            dates_frame,
-            text=f"Created on: {created_date}",
-            font=("Helvetica", 11)
-        ).pack(anchor=W, pady=(0, 5))
+        self.created_label = ttk.Label(dates_frame, font=("Helvetica", 11))
+        self.created_label.pack(anchor=W, pady=(0, 5))
         
         # Due date
-        due_date = format_date(self.task["due_date"]) if self.task.get("due_date") else "Not set"
-        ttk.Label(
+        self.due_label = ttk.Label(dates_frame, font=("Helvetica", 11))
+        self.due_label.pack(anchor=W, pady=(0, 5))
+        
+        # Completed date, packed only when the task has one
+        self.completed_label = ttk.Label(
             dates_frame,
-            text=f"Due date: {due_date}",
-            font=("Helvetica", 11)
+            font=("Helvetica", 11),
+            foreground="#66BB6A"  # Green for completion
+        )
+        
+        # Tags section, packed only when the task has tags
+        self.tags_section = ttk.Frame(frame)
+        ttk.Label(
+            self.tags_section,
+            text="Tags:",
+            font=("Helvetica", 12, "bold")
         ).pack(anchor=W, pady=(0, 5))
         
-        # Completed date (if applicable)
-        if self.task.get("completed_at"):
-            completed_date = format_date(self.task["completed_at"])
-            ttk.Label(
-                dates_frame,
-                text=f"Completed on: {completed_date}",
-                font=("Helvetica", 11),
-                foreground="#66BB6A"  # Green for completion
-            ).pack(anchor=W, pady=(0, 5))
-            
-        # Tags section
-        if self.task.get("tags") and len(self.task["tags"]) > 0:
-            ttk.Label(
-                frame,
-                text="Tags:",
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor=W, pady=(0, 5))
-            
-            tags_frame = ttk.Frame(frame)
-            tags_frame.pack(fill=X, pady=(0, 15), anchor=W)
-            
-            for tag in self.task["tags"]:
-                tag_label = ttk.Label(
-                    tags_frame,
-                    text=tag,
-                    style="secondary.Inverse.TLabel",
-                    font=("Helvetica", 9),
-                    padding=(5, 2),
-                    foreground="#FFFFFF"
-                )
-                tag_label.pack(side=LEFT, padx=(0, 5), pady=2)
+        self.tags_frame = ttk.Frame(self.tags_section)
+        self.tags_frame.pack(fill=X, pady=(0, 15), anchor=W)
         
         # Description section
-        ttk.Label(
+        self.description_header = ttk.Label(
             frame,
             text="Description:",
             font=("Helvetica", 12, "bold")
-        ).pack(anchor=W, pady=(0, 5))
+        )
+        self.description_header.pack(anchor=W, pady=(0, 5))
         
         # Description text in a scrollable frame
         desc_frame = ttk.Frame(frame)
         desc_frame.pack(fill=BOTH, expand=True, pady=(0, 15))
         
         # Read-only text widget for description
-        desc_text = tk.Text(
+        self.desc_text = tk.Text(
             desc_frame,
             wrap=tk.WORD,
             width=40,
             height=10,
             font=("Helvetica", 11),
             background="#3D3D3D",  # Slightly lighter than background
-            foreground="#FFFFFF"
+            foreground="#FFFFFF",
+            state="disabled"
         )
-        scrollbar = ttk.Scrollbar(desc_frame, orient=VERTICAL, command=desc_text.yview)
-        desc_text.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(desc_frame, orient=VERTICAL, command=self.desc_text.yview)
+        self.desc_text.configure(yscrollcommand=scrollbar.set)
         
-        desc_text.pack(side=LEFT, fill=BOTH, expand=True)
+        self.desc_text.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=RIGHT, fill=Y)
         
-        # Insert the description text and make it read-only
-        if self.task.get("description"):
-            desc_text.insert("1.0", self.task["description"])
-        else:
-            desc_text.insert("1.0", "No description provided.")
-        
-        desc_text.configure(state="disabled")  # Make it read-only
-        
         # Close button at the bottom
         ttk.Button(
             frame,
             text="Close",
-            command=self.top.destroy,
+            command=self.close,
             style="secondary.TButton",
             width=15
         ).pack(side=RIGHT, pady=(10, 0))
+    
+    def _populate(self, task):
+        """
+        Fill the dialog in with a task's details.
+        
+        Args:
+            task: Task to view
+        """
+        self.task = task
+        self.top.title(f"View Task: {task['title']}")
+        self.title_label.configure(text=task["title"])
+        
+        status_style = STATUS_STYLES.get(task["status"], "secondary")
+        self.status_badge.configure(text=task["status"], style=f"{status_style}.Inverse.TLabel")
+        
+        priority_style = PRIORITY_STYLES.get(task["priority"], "secondary")
+        self.priority_badge.configure(
+            text=f"Priority: {task['priority']}",
+            style=f"{priority_style}.Inverse.TLabel"
+        )
+        
+        self.created_label.configure(text=f"Created on: {format_date(task['created_at'])}")
+        due_date = format_date(task["due_date"]) if task.get("due_date") else "Not set"
+        self.due_label.configure(text=f"Due date: {due_date}")
+        
+        # Completed date (if applicable)
+        if task.get("completed_at"):
+            self.completed_label.configure(text=f"Completed on: {format_date(task['completed_at'])}")
+            self.completed_label.pack(anchor=W, pady=(0, 5))
+        else:
+            self.completed_label.pack_forget()
+        
+        # Tags section
+        for chip in self.tags_frame.winfo_children():
+            chip.destroy()
+        if task.get("tags"):
+            for tag in task["tags"]:
+                ttk.Label(
+                    self.tags_frame,
+                    text=tag,
+                    style="secondary.Inverse.TLabel",
+                    font=("Helvetica", 9),
+                    padding=(5, 2),
+                    foreground="#FFFFFF"
+                ).pack(side=LEFT, padx=(0, 5), pady=2)
+            self.tags_section.pack(fill=X, anchor=W, before=self.description_header)
+        else:
+            self.tags_section.pack_forget()
+        
+        self._set_text(self.desc_text, task.get("description") or "No description provided.")
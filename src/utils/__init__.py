@@ -1,8 +1,25 @@
 """
 Utility functions for the ToDo application.
 """
-from .grid_layout import SimpleGridLayout, VirtualizedGridLayout
-from .enhanced_grid_layout import EnhancedGridLayout
-from .card_styles import apply_card_styles
-from .helpers import center_window, format_date, get_centered_date
-from .custom_theme import create_custom_dark_theme
+import importlib
+
+# Resolved on first access so importing one utility module does not pull in
+# ttkbootstrap and the layouts
+_LAZY_EXPORTS = {
+    "SimpleGridLayout": ".grid_layout",
+    "VirtualizedGridLayout": ".grid_layout",
+    "EnhancedGridLayout": ".enhanced_grid_layout",
+    "apply_card_styles": ".card_styles",
+    "register_card_template": ".card_template",
+    "center_window": ".helpers",
+    "format_date": ".helpers",
+    "format_relative_date": ".helpers",
+    "get_centered_date": ".helpers",
+    "create_custom_dark_theme": ".custom_theme",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
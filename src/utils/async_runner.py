@@ -0,0 +1,139 @@
+"""
+Running the Tk main loop and an asyncio event loop together.
+"""
+import _tkinter
+import asyncio
+import time
+import tkinter as tk
+
+class AsyncTkRunner:
+    """
+    Drives Tk from an asyncio event loop on the main thread.
+
+    Instead of root.mainloop(), a coroutine processes every pending Tk event
+    and then sleeps for poll_ms, so coroutines (file watchers, timers,
+    network I/O) run between Tk events on the same thread and may touch
+    widgets directly. Each pump is a frame; frame_stats() reports how
+    evenly they are paced, which bounds the input latency the loop adds.
+    """
+
+    def __init__(self, root, poll_ms=5, max_events=500):
+        """
+        Initialize the runner.
+
+        Args:
+            root: Tk root window
+            poll_ms (int): Sleep between pumps; the worst-case delay before
+                Tk sees an input event
+            max_events (int): Tk events processed per pump at most, so a
+                flood of events cannot starve the coroutines
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self.max_events = max_events
+        self.loop = None
+        self._closed = False
+        self._pending = []  # coroutines added before the loop started
+        self._frame_intervals = []
+        self._pump_times = []
+        self.max_samples = 2000
+
+        root.bind("<Destroy>", self._on_destroy, add="+")
+
+    def create_task(self, coro):
+        """
+        Run a coroutine alongside the Tk loop.
+
+        May be called before run(); the coroutine then starts with the loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            asyncio.Task or None: The task, None if the loop has not started
+        """
+        if self.loop is None:
+            self._pending.append(coro)
+            return None
+        return self.loop.create_task(coro)
+
+    def run(self):
+        """
+        Run until the root window is destroyed.
+        """
+        asyncio.run(self._main())
+
+    def stop(self):
+        """
+        Stop the loop at the end of the current frame.
+        """
+        self._closed = True
+
+    def frame_stats(self):
+        """
+        Summarize frame pacing since the runner started.
+
+        Returns:
+            dict: frames, mean and worst interval between pumps (ms), worst
+                pump duration (ms) and number of late frames (interval more
+                than twice poll_ms)
+        """
+        intervals = self._frame_intervals
+        if not intervals:
+            return {"frames": 0, "mean_interval_ms": 0.0, "max_interval_ms": 0.0, "max_pump_ms": 0.0, "late_frames": 0}
+        return {
+            "frames": len(intervals),
+            "mean_interval_ms": sum(intervals) / len(intervals),
+            "max_interval_ms": max(intervals),
+            "max_pump_ms": max(self._pump_times),
+            "late_frames": sum(1 for interval in intervals if interval > 2 * self.poll_ms)
+        }
+
+    def _on_destroy(self, event):
+        """
+        Stop once the root window goes away.
+        """
+        if event.widget is self.root:
+            self._closed = True
+
+    async def _main(self):
+        """
+        Start the queued coroutines and pump Tk until the window closes.
+        """
+        self.loop = asyncio.get_running_loop()
+        for coro in self._pending:
+            self.loop.create_task(coro)
+        self._pending = []
+        try:
+            await self._pump()
+        finally:
+            # The window is gone; stop whatever is still running
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.loop = None
+
+    async def _pump(self):
+        """
+        Process pending Tk events, then yield to asyncio for poll_ms.
+        """
+        last = time.perf_counter()
+        while not self._closed:
+            started = time.perf_counter()
+            try:
+                for _ in range(self.max_events):
+                    if not self.root.tk.dooneevent(_tkinter.DONT_WAIT):
+                        break
+            except tk.TclError:
+                break
+            finished = time.perf_counter()
+
+            if len(self._frame_intervals) >= self.max_samples:
+                del self._frame_intervals[:self.max_samples // 2]
+                del self._pump_times[:self.max_samples // 2]
+            self._frame_intervals.append((started - last) * 1000)
+            self._pump_times.append((finished - started) * 1000)
+            last = started
+
+            await asyncio.sleep(self.poll_ms / 1000)
@@ -0,0 +1,208 @@
+"""
+Background work for the Tk application.
+"""
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class BackgroundExecutor:
+    """
+    Runs slow functions on worker threads and hands results back to Tk.
+
+    Tk may only be touched from the thread running the main loop, so workers
+    never call back directly: they put their result on a queue that the main
+    loop drains with root.after, spending at most budget_ms per poll. Jobs
+    submitted under the same key supersede each other; only the newest job's
+    result is delivered, so e.g. a query for an outdated filter is dropped.
+    """
+
+    def __init__(self, root, max_workers=2, poll_ms=10, idle_poll_ms=100, budget_ms=8):
+        """
+        Initialize the executor.
+
+        Args:
+            root: Tk root, used to poll for results
+            max_workers (int): Worker threads
+            poll_ms (int): Poll interval while jobs are in flight
+            idle_poll_ms (int): Poll interval otherwise, for call_soon from other threads
+            budget_ms (int): Maximum time spent delivering results per poll
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self.idle_poll_ms = idle_poll_ms
+        self.budget_ms = budget_ms
+        self.main_thread = threading.current_thread()
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="todo-worker")
+        self._results = queue.Queue()
+        self._ids = itertools.count(1)
+        self._latest = {}  # key -> id of the newest job submitted under it
+        self._in_flight = {}  # job id -> key
+        self._discarded = set()  # ids of jobs whose result is dropped on arrival
+        self._poll_job = None
+        self._closed = False
+        self.stats = {
+            "submitted": 0, "completed": 0, "failed": 0, "dropped": 0,
+            "max_job_ms": 0.0, "max_poll_ms": 0.0
+        }
+
+        self._schedule_poll(self.idle_poll_ms)
+
+    def submit(self, fn, *args, key=None, on_done=None, on_error=None):
+        """
+        Run fn(*args) on a worker thread.
+
+        Args:
+            fn (callable): The work; must not touch Tk widgets or variables
+            *args: Arguments for fn
+            key (str): Jobs with the same key supersede each other
+            on_done (callable): on_done(result), called on the Tk thread
+            on_error (callable): on_error(exception), called on the Tk thread
+
+        Returns:
+            int: Job id
+        """
+        job_id = next(self._ids)
+        if key is not None:
+            self._latest[key] = job_id
+        self._in_flight[job_id] = key
+        self.stats["submitted"] += 1
+        self._pool.submit(self._run, job_id, fn, args, on_done, on_error)
+
+        # Poll quickly while there is something to wait for
+        self._schedule_poll(self.poll_ms)
+        return job_id
+
+    def call_soon(self, fn, *args):
+        """
+        Run fn(*args) on the Tk thread.
+
+        Runs it right away when called from the Tk thread, otherwise queues it
+        for the next poll. Safe to call from any thread.
+
+        Args:
+            fn (callable): Function to call
+            *args: Arguments for fn
+        """
+        if threading.current_thread() is self.main_thread:
+            fn(*args)
+        else:
+            self._results.put((None, lambda result: fn(*args), None, None, None, 0.0))
+
+    def pending(self, key=None):
+        """
+        Check whether jobs are still running.
+
+        Args:
+            key (str): Only consider jobs submitted under this key
+
+        Returns:
+            bool: True if a matching job has not been delivered yet
+        """
+        if key is None:
+            return bool(self._in_flight)
+        return key in self._in_flight.values()
+
+    def discard(self, key):
+        """
+        Drop the results of the jobs running under a key, if any.
+
+        The jobs no longer count as pending, even though their workers may
+        still be running.
+
+        Args:
+            key (str): Job key
+        """
+        self._latest.pop(key, None)
+        for job_id in [job_id for job_id, job_key in self._in_flight.items() if job_key == key]:
+            del self._in_flight[job_id]
+            self._discarded.add(job_id)
+
+    def shutdown(self, wait=True):
+        """
+        Stop polling and shut the worker threads down.
+
+        Args:
+            wait (bool): Wait for running jobs to finish
+        """
+        self._closed = True
+        if self._poll_job is not None:
+            try:
+                self.root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+            self._poll_job = None
+        self._pool.shutdown(wait=wait)
+
+    def _run(self, job_id, fn, args, on_done, on_error):
+        """
+        Run a job on a worker thread and queue its outcome.
+        """
+        started = time.perf_counter()
+        try:
+            result, error = fn(*args), None
+        except Exception as e:
+            result, error = None, e
+        elapsed = (time.perf_counter() - started) * 1000
+        self._results.put((job_id, on_done, on_error, result, error, elapsed))
+
+    def _schedule_poll(self, delay_ms):
+        """
+        (Re)schedule the next poll to run within delay_ms.
+        """
+        if self._closed:
+            return
+        if self._poll_job is not None:
+            if delay_ms >= self.idle_poll_ms:
+                return  # Already polling at least this often
+            self.root.after_cancel(self._poll_job)
+        self._poll_job = self.root.after(delay_ms, self._poll)
+
+    def _poll(self):
+        """
+        Deliver queued results on the Tk thread, within the time budget.
+        """
+        self._poll_job = None
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                job_id, on_done, on_error, result, error, elapsed = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(job_id, on_done, on_error, result, error, elapsed)
+
+        self.stats["max_poll_ms"] = max(self.stats["max_poll_ms"], (time.perf_counter() - started) * 1000)
+        busy = self._in_flight or not self._results.empty()
+        self._schedule_poll(self.poll_ms if busy else self.idle_poll_ms)
+
+    def _deliver(self, job_id, on_done, on_error, result, error, elapsed):
+        """
+        Call a job's callback unless a newer job with the same key replaced it.
+        """
+        if job_id in self._discarded:
+            self._discarded.discard(job_id)
+            self.stats["dropped"] += 1
+            return
+        if job_id is not None:
+            key = self._in_flight.pop(job_id, None)
+            self.stats["max_job_ms"] = max(self.stats["max_job_ms"], elapsed)
+            if key is not None and self._latest.get(key) != job_id:
+                self.stats["dropped"] += 1
+                return
+            if key is not None:
+                del self._latest[key]
+            self.stats["failed" if error else "completed"] += 1
+
+        try:
+            if error is None:
+                if on_done:
+                    on_done(result)
+            elif on_error:
+                on_error(error)
+            else:
+                print(f"Background job failed: {error}")
+        except Exception as e:
+            print(f"Error in background callback: {e}")
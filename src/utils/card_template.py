@@ -0,0 +1,133 @@
+"""
+Fonts, ttk styles and size shared by the task and draft cards.
+"""
+import time
+import tkinter as tk
+import tkinter.font as tkfont
+from .lazy_import import lazy_import
+
+# Only needed once the template is registered
+tb = lazy_import("ttkbootstrap")
+
+CARD_WIDTH = 300
+CARD_HEIGHT = 180
+
+TEXT_COLOR = "#FFFFFF"
+
+# Named Tk fonts; cards refer to them by name instead of passing font tuples
+FONTS = {
+    "CardTitle": {"family": "Helvetica", "size": 12, "weight": "bold"},
+    "CardText": {"family": "Helvetica", "size": 9},
+    "CardChip": {"family": "Helvetica", "size": 8},
+    "CardIcon": {"family": "Helvetica", "size": 12},
+    "CardSymbol": {"family": "Helvetica", "size": 10},
+    "CardEmblem": {"family": "Helvetica", "size": 14},
+}
+
+# Bootstyle colors of the priority badges
+BADGE_COLORS = ["danger", "warning", "info", "secondary"]
+
+# ttkbootstrap styles cards use as they are, built before the first card
+WARM_STYLES = [
+    "TFrame", "TLabel", "TButton", "Switch.TCheckbutton",
+    "success.TFrame", "danger.TFrame", "warning.TFrame", "info.TFrame",
+    "primary.Link.TButton", "info.Link.TButton", "danger.Link.TButton",
+    "success.Outline.TButton",
+]
+
+# Card styles: name -> options. Each one extends the ttkbootstrap style
+# named by the rest of its name, e.g. CardTitle.danger.TLabel -> danger.TLabel.
+# The prefixes must not contain bootstyle keywords such as "info" or "date".
+CARD_STYLES = {
+    "Card.TFrame": {"padding": 8, "relief": "raised", "borderwidth": 1},
+    "CardTitle.TLabel": {"font": "CardTitle", "foreground": TEXT_COLOR},
+    "CardTitle.success.TLabel": {"font": "CardTitle", "foreground": TEXT_COLOR},
+    "CardTitle.danger.TLabel": {"font": "CardTitle", "foreground": TEXT_COLOR},
+    "CardTitle.info.TLabel": {"font": "CardTitle", "foreground": TEXT_COLOR},
+    "CardBody.TLabel": {"font": "CardText"},
+    "CardMuted.TLabel": {"font": "CardText", "foreground": "gray"},
+    "CardNote.TLabel": {"font": "CardText", "foreground": "#E0E0E0"},
+    "CardSymbol.TLabel": {"font": "CardSymbol"},
+    "CardEmblem.TLabel": {"font": "CardEmblem"},
+    "CardChip.secondary.Inverse.TLabel": {"font": "CardChip", "padding": (5, 0), "foreground": TEXT_COLOR},
+    "DraftChip.info.Inverse.TLabel": {"font": "CardChip", "padding": (5, 2), "foreground": TEXT_COLOR},
+}
+for _color in BADGE_COLORS:
+    CARD_STYLES[f"CardBadge.{_color}.Inverse.TLabel"] = {"font": "CardText", "padding": (5, 2), "foreground": TEXT_COLOR}
+
+_fonts = {}  # name -> tkfont.Font, kept so Tk does not delete them
+
+
+def badge_style(color):
+    """
+    Get the style of a priority badge.
+
+    Args:
+        color (str): One of BADGE_COLORS
+
+    Returns:
+        str: ttk style name
+    """
+    return f"CardBadge.{color}.Inverse.TLabel"
+
+
+def title_style(color=None):
+    """
+    Get the style of a card title.
+
+    Args:
+        color (str): Bootstyle color, None for the plain title
+
+    Returns:
+        str: ttk style name
+    """
+    return f"CardTitle.{color}.TLabel" if color else "CardTitle.TLabel"
+
+
+def register_card_template():
+    """
+    Create the card fonts and build the card styles, once per app.
+
+    Call after the theme is loaded and before the first card is built.
+    ttkbootstrap parses a style name and runs its style builder the first
+    time a widget uses an unknown style; for registered styles it does
+    neither, so every card built afterwards takes the fast path.
+
+    Returns:
+        float: Milliseconds spent, 0 if already registered
+    """
+    if _fonts:
+        return 0.0
+
+    started = time.perf_counter()
+
+    for name, options in FONTS.items():
+        try:
+            _fonts[name] = tkfont.Font(name=name, exists=False, **options)
+        except tk.TclError:
+            # Created by an earlier root in this process
+            _fonts[name] = tkfont.Font(name=name, exists=True)
+            _fonts[name].configure(**options)
+
+    style = tb.Style()
+    for name in WARM_STYLES:
+        style.configure(name)
+    for name, options in CARD_STYLES.items():
+        style.configure(name, **options)
+
+    return (time.perf_counter() - started) * 1000
+
+
+def card_font(name):
+    """
+    Get a registered card font, e.g. to measure text on a canvas.
+
+    Args:
+        name (str): Key in FONTS
+
+    Returns:
+        tkfont.Font: The font
+    """
+    if name not in _fonts:
+        register_card_template()
+    return _fonts[name]
@@ -26,7 +26,12 @@ class EnhancedGridLayout:
         self.animation_speed = animation_speed
         self.items = []  # List of (widget, rowspan, colspan) tuples
         self.current_columns = 1
+        self.available_width = None  # width given by set_available_width
         self.grid_map = {}  # Maps (row, col) to item index
+        self._placed = 0  # Number of items (from the front) already gridded
+        self._open_row = 0  # Lowest row that may still have a free cell
+        self._suspended = 0  # suspend() nesting depth
+        self._pending_layout = False  # a layout was requested while suspended
         
         # Configure the parent frame for grid layout
         parent_frame.columnconfigure(0, weight=1)
@@ -38,21 +43,11 @@ class EnhancedGridLayout:
         Returns:
             int: Number of columns to display
         """
-        # Get parent width - try different approaches depending on widget hierarchy
-        parent_width = self.parent_frame.winfo_width()
-        
+        # Prefer the width handed over by the resize handler; querying the
+        # frame only works once it has been laid out
+        parent_width = self.available_width or self.parent_frame.winfo_width()
         if parent_width < 50:  # Not yet properly laid out
-            # Try to get width from master
-            if hasattr(self.parent_frame, 'master') and self.parent_frame.master:
-                parent_width = self.parent_frame.master.winfo_width()
-            
-            # If still not available, try the parent's parent
-            if parent_width < 50 and hasattr(self.parent_frame.master, 'master'):
-                parent_width = self.parent_frame.master.master.winfo_width()
-                
-            # If all else fails, use a default width
-            if parent_width < 50:
-                parent_width = 800  # Reasonable default
+            parent_width = 800  # Reasonable default
         
         # Calculate columns with padding consideration
         available_width = parent_width - (2 * self.padding)  # Account for outer padding
@@ -69,6 +64,8 @@ class EnhancedGridLayout:
             widget.destroy()
         self.items = []
         self.grid_map = {}
+        self._placed = 0
+        self._open_row = 0
     
     def add_item(self, item_widget, rowspan=1, colspan=1):
         """
@@ -79,25 +76,74 @@ class EnhancedGridLayout:
             rowspan: Number of rows this item spans (default: 1)
             colspan: Number of columns this item spans (default: 1)
         """
-        self.items.append((item_widget, rowspan, colspan))
+        self.add_items([(item_widget, rowspan, colspan)])
+    
+    def add_items(self, items):
+        """
+        Add several items to the grid in one layout pass.
+        
+        Args:
+            items (iterable): Widgets, or (widget, rowspan, colspan) tuples
+        """
+        for item in items:
+            if isinstance(item, tuple):
+                self.items.append(item)
+            else:
+                self.items.append((item, 1, 1))
         self.update_layout()
     
-    def _find_available_position(self, colspan):
+    def suspend(self):
+        """
+        Defer layout work until resume() is called.
+        
+        Calls nest, and the layout also works as a context manager:
+        ``with layout.suspend(): ...`` lays everything out once on exit.
+        
+        Returns:
+            EnhancedGridLayout: self
+        """
+        self._suspended += 1
+        return self
+    
+    def resume(self):
+        """
+        End a suspend() block, laying out once if anything changed.
+        """
+        if self._suspended == 0:
+            return
+        self._suspended -= 1
+        if self._suspended == 0 and self._pending_layout:
+            self._pending_layout = False
+            self.update_layout()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.resume()
+        return False
+    
+    def _find_available_position(self, colspan, columns=None):
         """
         Find the next available position in the grid for an item with the specified colspan.
         
         Args:
             colspan: Number of columns the item spans
+            columns: Current column count (calculated if not given)
             
         Returns:
             tuple: (row, column) for the item
         """
-        columns = self.calculate_columns()
+        if columns is None:
+            columns = self.calculate_columns()
         
         # If colspan is greater than available columns, reduce it
         colspan = min(colspan, columns)
         
-        for row in range(100):  # Limit search to 100 rows to prevent infinite loop
+        # Rows above _open_row are full, so start there; every item fits within
+        # one row past the items placed so far
+        last_row = self._open_row + len(self.items) + 1
+        for row in range(self._open_row, last_row):
             for col in range(columns - colspan + 1):
                 # Check if all cells in the span are available
                 available = True
@@ -112,10 +158,46 @@ class EnhancedGridLayout:
         # If we get here, something went wrong - use a default position
         return 0, 0
     
+    def _place_item(self, index, columns):
+        """
+        Grid one item at the next free position.
+        
+        Args:
+            index: Index of the item in self.items
+            columns: Number of columns to use
+        """
+        item_widget, rowspan, colspan = self.items[index]
+        
+        # If colspan is greater than available columns, reduce it
+        actual_colspan = min(colspan, columns)
+        row, col = self._find_available_position(actual_colspan, columns)
+        
+        # Update the grid map
+        for r in range(row, row + rowspan):
+            for c in range(col, col + actual_colspan):
+                self.grid_map[(r, c)] = index
+        
+        # Skip past rows that are now full
+        while all((self._open_row, c) in self.grid_map for c in range(columns)):
+            self._open_row += 1
+        
+        # Grid the item with proper padding
+        item_widget.grid(
+            row=row, column=col, 
+            rowspan=rowspan, columnspan=actual_colspan,
+            sticky="nsew", 
+            padx=self.padding, 
+            pady=self.padding
+        )
+    
     def update_layout(self):
         """
         Update the layout of all items in the grid.
         """
+        if self._suspended:
+            self._pending_layout = True
+            return
+        
         # Calculate columns based on current width
         columns = self.calculate_columns()
         
@@ -123,24 +205,10 @@ class EnhancedGridLayout:
         if columns != self.current_columns:
             self._perform_full_layout_update(columns)
         else:
-            # Just update the most recently added item
-            if self.items:
-                item_widget, rowspan, colspan = self.items[-1]
-                row, col = self._find_available_position(colspan)
-                
-                # Update the grid map
-                for r in range(row, row + rowspan):
-                    for c in range(col, col + colspan):
-                        self.grid_map[(r, c)] = len(self.items) - 1
-                
-                # Place the widget
-                item_widget.grid(
-                    row=row, column=col, 
-                    rowspan=rowspan, columnspan=colspan,
-                    sticky="nsew", 
-                    padx=self.padding, 
-                    pady=self.padding
-                )
+            # Just place the items added since the last layout
+            for index in range(self._placed, len(self.items)):
+                self._place_item(index, columns)
+            self._placed = len(self.items)
         
         # Update column configuration
         for i in range(columns):
@@ -163,28 +231,12 @@ class EnhancedGridLayout:
         
         # Clear the grid map
         self.grid_map = {}
+        self._open_row = 0
         
         # Place items in grid
-        for i, (item_widget, rowspan, colspan) in enumerate(self.items):
-            # If colspan is greater than available columns, reduce it
-            actual_colspan = min(colspan, columns)
-            
-            # Find an available position
-            row, col = self._find_available_position(actual_colspan)
-            
-            # Update the grid map
-            for r in range(row, row + rowspan):
-                for c in range(col, col + actual_colspan):
-                    self.grid_map[(r, c)] = i
-            
-            # Grid the item with proper padding
-            item_widget.grid(
-                row=row, column=col, 
-                rowspan=rowspan, columnspan=actual_colspan,
-                sticky="nsew", 
-                padx=self.padding, 
-                pady=self.padding
-            )
+        for i in range(len(self.items)):
+            self._place_item(i, columns)
+        self._placed = len(self.items)
     
     def animate_layout_change(self, new_columns):
         """
@@ -221,13 +273,24 @@ class EnhancedGridLayout:
             self.current_columns = new_columns
             self._animating = False
     
+    def set_available_width(self, width):
+        """
+        Set the width the grid lays out into, e.g. the canvas width after a resize.
+        
+        Args:
+            width (int): Width in pixels
+        """
+        self.available_width = width
+    
     def refresh_on_resize(self, event=None):
         """
         Refresh the layout if the number of columns would change.
         
         Args:
-            event: The resize event (optional)
+            event: The resize event (optional); its width becomes the available width
         """
+        if event is not None and getattr(event, "width", None):
+            self.available_width = event.width
         new_columns = self.calculate_columns()
         if new_columns != self.current_columns:
             # Option 1: Immediate update
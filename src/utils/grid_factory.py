@@ -12,6 +12,7 @@ def create_grid_layout(parent_frame, layout_type="simple", **kwargs):
         parent_frame: The frame where items will be placed
         layout_type: Type of layout to create ("simple", "virtualized", "enhanced")
         **kwargs: Additional arguments to pass to the layout constructor
+            (the virtualized layout needs create_card and update_card)
     
     Returns:
         A grid layout instance of the requested type
@@ -29,11 +30,14 @@ def create_grid_layout(parent_frame, layout_type="simple", **kwargs):
     elif layout_type == "virtualized":
         if canvas is None:
             raise ValueError("canvas parameter is required for virtualized layout")
+        if "create_card" not in kwargs or "update_card" not in kwargs:
+            raise ValueError("create_card and update_card are required for virtualized layout")
         return VirtualizedGridLayout(
             parent_frame=parent_frame,
             canvas=canvas,
             min_column_width=min_column_width,
-            padding=padding
+            padding=padding,
+            **kwargs
         )
     elif layout_type == "enhanced":
         animation_speed = kwargs.pop("animation_speed", 10)
@@ -5,6 +5,8 @@ import tkinter as tk
 from tkinter import ttk
 import math
 
+from .reconciler import KeyedReconciler
+
 class SimpleGridLayout:
     """
     A simplified and more efficient grid layout manager.
@@ -23,7 +25,11 @@ class SimpleGridLayout:
         self.min_column_width = min_column_width
         self.padding = padding
         self.items = []
+        self.positions = {}  # widget -> (row, column) it is currently gridded at
         self.current_columns = 1
+        self.available_width = None  # width given by set_available_width
+        self._suspended = 0  # suspend() nesting depth
+        self._pending_layout = False  # a layout was requested while suspended
         
         # Configure the parent frame for grid layout
         parent_frame.columnconfigure(0, weight=1)
@@ -35,21 +41,11 @@ class SimpleGridLayout:
         Returns:
             int: Number of columns to display
         """
-        # Get parent width - try different approaches depending on widget hierarchy
-        parent_width = self.parent_frame.winfo_width()
-        
+        # Prefer the width handed over by the resize handler; querying the
+        # frame only works once it has been laid out
+        parent_width = self.available_width or self.parent_frame.winfo_width()
         if parent_width < 50:  # Not yet properly laid out
-            # Try to get width from master
-            if hasattr(self.parent_frame, 'master') and self.parent_frame.master:
-                parent_width = self.parent_frame.master.winfo_width()
-            
-            # If still not available, try the parent's parent
-            if parent_width < 50 and hasattr(self.parent_frame.master, 'master'):
-                parent_width = self.parent_frame.master.master.winfo_width()
-                
-            # If all else fails, use a default width
-            if parent_width < 50:
-                parent_width = 800  # Reasonable default
+            parent_width = 800  # Reasonable default
         
         # Calculate columns with padding consideration
         available_width = parent_width - (2 * self.padding)  # Account for outer padding
@@ -65,6 +61,7 @@ class SimpleGridLayout:
         for widget in self.parent_frame.winfo_children():
             widget.destroy()
         self.items = []
+        self.positions = {}
     
     def add_item(self, item_widget):
         """
@@ -73,17 +70,93 @@ class SimpleGridLayout:
         Args:
             item_widget: Widget to add to the grid
         """
-        self.items.append(item_widget)
-        self.update_layout()
+        self.add_items([item_widget])
+    
+    def add_items(self, item_widgets):
+        """
+        Add several items to the grid in one layout pass.
+        
+        Only the new items are gridded; items already in the grid keep their
+        cells unless the column count changed.
+        
+        Args:
+            item_widgets (iterable): Widgets to append, in display order
+        """
+        start = len(self.items)
+        self.items.extend(item_widgets)
+        if self._suspended:
+            self._pending_layout = True
+            return
+        
+        columns = self.calculate_columns()
+        if columns != self.current_columns:
+            self.update_layout()
+            return
+        
+        for i in range(start, len(self.items)):
+            self._grid_at(self.items[i], i, columns)
+    
+    def suspend(self):
+        """
+        Defer layout work until resume() is called.
+        
+        Calls nest, and the layout also works as a context manager:
+        ``with layout.suspend(): ...`` lays everything out once on exit.
+        
+        Returns:
+            SimpleGridLayout: self
+        """
+        self._suspended += 1
+        return self
+    
+    def resume(self):
+        """
+        End a suspend() block, laying out once if anything changed.
+        """
+        if self._suspended == 0:
+            return
+        self._suspended -= 1
+        if self._suspended == 0 and self._pending_layout:
+            self._pending_layout = False
+            self._apply_items()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.resume()
+        return False
+    
+    def _grid_at(self, widget, index, columns):
+        """
+        Grid a widget at the cell for its index, unless it is already there.
+        
+        Args:
+            widget: Widget to place
+            index (int): Position of the widget in display order
+            columns (int): Current column count
+        """
+        cell = (index // columns, index % columns)
+        if self.positions.get(widget) != cell:
+            widget.grid(
+                row=cell[0], column=cell[1],
+                sticky="nsew", padx=self.padding, pady=self.padding
+            )
+            self.positions[widget] = cell
     
     def update_layout(self):
         """
         Update the layout of all items in the grid.
         """
+        if self._suspended:
+            self._pending_layout = True
+            return
+        
         # Remove all items from the grid
         for item in self.items:
             if hasattr(item, 'grid_forget'):
                 item.grid_forget()
+        self.positions = {}
         
         # Calculate columns based on current width
         columns = self.calculate_columns()
@@ -94,158 +167,413 @@ class SimpleGridLayout:
         
         # Place items in grid
         for i, item in enumerate(self.items):
+            if item is None:
+                continue  # Placeholder for a card that is still being built
             row = i // columns
             col = i % columns
             
             # Grid the item with proper padding
             item.grid(row=row, column=col, sticky="nsew", padx=self.padding, pady=self.padding)
+            self.positions[item] = (row, col)
         
         # Store current column count
         self.current_columns = columns
     
+    def set_items(self, widgets):
+        """
+        Replace the item list, moving only widgets whose cell changed.
+        
+        Widgets already gridded at the right row and column are left alone, so
+        reordering or patching a few cards costs a few grid calls, not n.
+        
+        Args:
+            widgets (list): Widgets in display order; a None entry keeps its
+                cell empty (a card a progressive render has not built yet)
+        """
+        self.items = list(widgets)
+        if self._suspended:
+            self._pending_layout = True
+            return
+        self._apply_items()
+    
+    def _apply_items(self):
+        """
+        Grid self.items in order, forgetting widgets that are no longer listed.
+        """
+        columns = self.calculate_columns()
+        if columns != self.current_columns:
+            for i in range(columns):
+                self.parent_frame.columnconfigure(i, weight=1)
+            self.current_columns = columns
+        
+        wanted = set(self.items)
+        for widget in [widget for widget in self.positions if widget not in wanted]:
+            del self.positions[widget]
+            widget.grid_forget()
+        
+        for i, widget in enumerate(self.items):
+            if widget is not None:
+                self._grid_at(widget, i, columns)
+    
+    def forget_items(self, widgets):
+        """
+        Take several widgets out of the grid without destroying them.
+        
+        Args:
+            widgets (iterable): Widgets to remove
+        """
+        gone = set(widgets)
+        for widget in gone:
+            if self.positions.pop(widget, None) is not None:
+                widget.grid_forget()
+        self.items = [item for item in self.items if item not in gone]
+    
+    def forget_item(self, widget):
+        """
+        Take a widget out of the grid without destroying it.
+        
+        Args:
+            widget: Widget to remove
+        """
+        if self.positions.pop(widget, None) is not None:
+            try:
+                widget.grid_forget()
+            except Exception:
+                pass
+        if widget in self.items:
+            self.items.remove(widget)
+    
+    def set_available_width(self, width):
+        """
+        Set the width the grid lays out into, e.g. the canvas width after a resize.
+        
+        Args:
+            width (int): Width in pixels
+        """
+        self.available_width = width
+    
     def refresh_on_resize(self, event=None):
         """
         Refresh the layout if the number of columns would change.
         
         Args:
-            event: The resize event (optional)
+            event: The resize event (optional); its width becomes the available width
         """
+        if event is not None and getattr(event, "width", None):
+            self.available_width = event.width
         new_columns = self.calculate_columns()
         if new_columns != self.current_columns:
-            self.update_layout()
+            if self._suspended:
+                self._pending_layout = True
+            else:
+                self._apply_items()
 
 class VirtualizedGridLayout:
     """
-    A virtualized grid layout that only renders visible items for better performance.
-    Useful for very large collections of items.
+    A virtualized grid layout that only renders the rows in the viewport.
+    
+    The layout is driven by the canvas yscrollcommand: whenever the view
+    moves, the visible row range is computed arithmetically from the scroll
+    offset and the row height, and only those rows (plus an overscan margin)
+    get card widgets. Cards are keyed by item key and recycled through the
+    create/update/release callbacks, so scrolling costs O(visible) no matter
+    how many items there are.
     """
     
-    def __init__(self, parent_frame, canvas, min_column_width=300, padding=5):
+    def __init__(self, parent_frame, canvas, create_card, update_card, release_card=None,
+                 min_column_width=300, card_height=180, padding=5, overscan_rows=2,
+                 yscrollcommand=None, renderer=None):
         """
         Initialize the virtualized grid layout manager.
         
         Args:
-            parent_frame: The frame inside the canvas where items will be placed
-            canvas: The canvas for scrolling and visibility detection
+            parent_frame: The frame inside the scrolled canvas window where cards are placed
+            canvas: The scrolling canvas
+            create_card (callable): create_card(data) -> widget
+            update_card (callable): update_card(widget, data), rebinds a card
+            release_card (callable): release_card(widget) for cards scrolled out of view
             min_column_width: Minimum width for each column
-            padding: Padding between grid items
+            card_height: Height of one card, without padding
+            padding: Padding around each card
+            overscan_rows: Extra rows rendered above and below the viewport
+            yscrollcommand (callable): Scrollbar update to chain, e.g. scrollbar.set
+            renderer: Optional ProgressiveRenderer; set_data then builds the
+                visible rows first and streams the overscan rows in afterwards
         """
         self.parent_frame = parent_frame
         self.canvas = canvas
         self.min_column_width = min_column_width
+        self.card_height = card_height
         self.padding = padding
-        self.all_items = []  # All item data
-        self.visible_items = {}  # Currently visible widgets
-        self.current_columns = 1
+        self.overscan_rows = overscan_rows
+        self.yscrollcommand = yscrollcommand
+        self.renderer = renderer
+        self.reserve_frame_height = True  # False when cards are not child widgets of parent_frame
         
-        # Configure scroll region updates
-        self.parent_frame.bind("<Configure>", self._update_scroll_region)
+        self.items = []  # (key, version, data) for every item, in display order
+        self.index_by_key = {}  # key -> position in items
+        self.current_columns = 1
+        self.column_width = min_column_width + 2 * padding
+        self.row_height = card_height + 2 * padding
+        self.window = (0, 0)  # [first, last) item indices currently rendered
+        self.positions = {}  # widget -> (x, y, width) it is currently placed at
+        self._window_start = 0
         
-        # Configure visibility checks on scroll
-        self.canvas.bind("<Configure>", self._on_canvas_resize)
-        self.canvas.bind("<Motion>", lambda e: self.check_visibility())
+        # Cards in the window are reconciled by key like a regular grid
+        self.reconciler = KeyedReconciler(self, create_card, update_card, release_card)
         
-        # Also check visibility when scrolled
-        # This handles both mouse wheel and scrollbar interactions
-        self.canvas.bind("<MouseWheel>", lambda e: self.parent_frame.after(10, self.check_visibility))
-        self.canvas.bind("<Button-4>", lambda e: self.parent_frame.after(10, self.check_visibility))
-        self.canvas.bind("<Button-5>", lambda e: self.parent_frame.after(10, self.check_visibility))
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
     
-    def _update_scroll_region(self, event=None):
-        """Update the canvas scroll region to include all items."""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    @property
+    def row_count(self):
+        """Number of grid rows needed for all items."""
+        return math.ceil(len(self.items) / self.current_columns)
     
-    def _on_canvas_resize(self, event):
-        """Handle canvas resize events."""
-        new_columns = self.calculate_columns()
-        if new_columns != self.current_columns:
-            self.current_columns = new_columns
-            self.update_layout()
-            self.check_visibility()
+    @property
+    def total_height(self):
+        """Height of the whole grid in pixels."""
+        return self.row_count * self.row_height
     
     def calculate_columns(self):
-        """Calculate the number of columns based on canvas width."""
+        """
+        Calculate the number of columns based on canvas width.
+        
+        Returns:
+            int: Number of columns to display
+        """
         canvas_width = self.canvas.winfo_width()
         if canvas_width < 50:  # Not yet properly sized
             return 1
-            
+        
         width_with_padding = self.min_column_width + (2 * self.padding)
-        columns = max(1, int(canvas_width / width_with_padding))
-        return columns
+        return max(1, int(canvas_width / width_with_padding))
     
-    def clear(self):
-        """Clear all items from the grid."""
-        for widget in self.visible_items.values():
-            widget.destroy()
-        self.all_items = []
-        self.visible_items = {}
+    def _update_geometry(self):
+        """
+        Recompute columns, the grid size and the canvas scrollregion.
+        """
+        canvas_width = max(self.canvas.winfo_width(), self.min_column_width + 2 * self.padding)
+        self.current_columns = self.calculate_columns()
+        self.column_width = canvas_width // self.current_columns
+        
+        # The frame only holds placed children, so its size is exactly what we set;
+        # cards drawn on the canvas itself need it flat so it does not cover them
+        frame_height = self.total_height if self.reserve_frame_height else 0
+        self.parent_frame.configure(height=max(frame_height, 1), width=canvas_width)
+        
+        # Scrollregion from the known grid size: header above the grid plus the rows
+        content_top = self.parent_frame.winfo_y()
+        self.canvas.configure(scrollregion=(0, 0, canvas_width, content_top + self.total_height))
     
-    def add_item(self, item_factory, item_data):
+    def set_data(self, items):
         """
-        Add an item to the grid using a factory function.
+        Replace the items shown by the grid.
         
         Args:
-            item_factory: Function that creates a widget given data and parent
-            item_data: Data for the item
+            items (list): (key, version, data) tuples in display order
         """
-        self.all_items.append((item_factory, item_data))
-        self.update_layout()
-        self.check_visibility()
+        self.items = list(items)
+        self.index_by_key = {key: i for i, (key, _, _) in enumerate(self.items)}
+        self._update_geometry()
+        
+        # Clamp the view if the list got shorter than the current scroll offset
+        if self.canvas.canvasy(0) > self.total_height:
+            self.canvas.yview_moveto(0)
+        self.render(progressive=self.renderer is not None)
     
-    def update_layout(self):
-        """Update the layout based on the current column count."""
-        # Remove all visible items
-        for widget in self.visible_items.values():
-            widget.destroy()
-        self.visible_items = {}
+    def visible_range(self):
+        """
+        Compute the item indices that should be rendered.
         
-        # Calculate the total rows needed and configure the parent frame height
-        total_items = len(self.all_items)
-        total_rows = math.ceil(total_items / self.current_columns)
-        total_height = total_rows * (self.min_column_width + (2 * self.padding))
+        Returns:
+            tuple: (first, last) item indices, last exclusive
+        """
+        if not self.items:
+            return 0, 0
         
-        # Update parent frame size to accommodate all items
-        self.parent_frame.configure(height=total_height, width=self.canvas.winfo_width())
+        view_height = self.canvas.winfo_height()
+        if view_height <= 1:  # Not yet mapped, assume a typical window
+            view_height = 800
+        view_top = self.canvas.canvasy(0) - self.parent_frame.winfo_y()
         
-        # Check which items are visible and create them
-        self.check_visibility()
+        first_row = max(0, int(view_top // self.row_height) - self.overscan_rows)
+        last_row = min(
+            self.row_count,
+            int((view_top + view_height) // self.row_height) + 1 + self.overscan_rows
+        )
+        columns = self.current_columns
+        return first_row * columns, min(len(self.items), max(first_row, last_row) * columns)
     
-    def check_visibility(self):
+    def render(self, progressive=False):
         """
-        Check which items are visible in the viewport and create/destroy widgets accordingly.
+        Render the cards for the current viewport.
+        
+        Args:
+            progressive (bool): Build the rows up to the bottom of the viewport
+                now and stream the overscan rows below through the renderer
         """
-        if not self.all_items:
+        first, last = self.visible_range()
+        self.window = (first, last)
+        self._window_start = first
+        window_items = self.items[first:last]
+        
+        if not progressive:
+            if self.renderer is not None:
+                self.renderer.cancel()  # A synchronous render supersedes a streaming one
+            self.reconciler.reconcile(window_items)
             return
-            
-        # Get the visible region of the canvas
-        canvas_top = self.canvas.canvasy(0)
-        canvas_bottom = canvas_top + self.canvas.winfo_height()
-        canvas_width = self.canvas.winfo_width()
         
-        # Calculate item positions
-        for i, (item_factory, item_data) in enumerate(self.all_items):
-            row = i // self.current_columns
-            col = i % self.current_columns  # Fixed: use self.current_columns instead of undefined 'columns'
+        screenful = len(window_items) - self.overscan_rows * self.current_columns
+        self.renderer.start(self.reconciler.reconcile_steps(
+            window_items,
+            first_chunk=max(self.current_columns, screenful),
+            chunk_size=self.current_columns
+        ))
+    
+    def _on_yscroll(self, first, last):
+        """
+        Canvas yscrollcommand: forward to the scrollbar and render the new viewport.
+        """
+        if self.yscrollcommand:
+            self.yscrollcommand(first, last)
+        if self.visible_range() != self.window:
+            self.render()
+    
+    def refresh_on_resize(self, event=None):
+        """
+        Re-layout after the canvas changed size.
+        
+        Args:
+            event: The resize event (optional)
+        """
+        old_columns, old_width = self.current_columns, self.column_width
+        self._update_geometry()
+        if (self.current_columns, self.column_width) != (old_columns, old_width):
+            self.render()
+    
+    def update_item(self, key, version, data):
+        """
+        Replace one item in place; its card is patched if it is in the viewport.
+        
+        Args:
+            key: Item key
+            version: New item version
+            data: New item data
             
-            # Calculate the position of this item
-            item_top = row * (self.min_column_width + (2 * self.padding))
-            item_bottom = item_top + self.min_column_width + (2 * self.padding)
+        Returns:
+            bool: False if the key is not in the grid
+        """
+        index = self.index_by_key.get(key)
+        if index is None:
+            return False
+        self.items[index] = (key, version, data)
+        self.reconciler.patch(key, version, data)
+        return True
+    
+    def remove_item(self, key):
+        """
+        Remove one item and close the gap it leaves.
+        
+        Only the cards after it in the viewport move; no other card is rebuilt.
+        
+        Args:
+            key: Item key
             
-            # Check if this item is visible
-            is_visible = (item_bottom >= canvas_top and item_top <= canvas_bottom)
+        Returns:
+            bool: False if the key is not in the grid
+        """
+        index = self.index_by_key.pop(key, None)
+        if index is None:
+            return False
+        del self.items[index]
+        for i in range(index, len(self.items)):
+            self.index_by_key[self.items[i][0]] = i
+        self._update_geometry()
+        self.render()
+        return True
+    
+    def set_card_factory(self, create_card, update_card, release_card=None, reserve_frame_height=True):
+        """
+        Switch to another kind of card, e.g. widget cards or canvas-drawn cards.
+        
+        The current cards are released through the old callbacks and the
+        viewport is rendered again with the new ones.
+        
+        Args:
+            create_card (callable): create_card(data) -> card
+            update_card (callable): update_card(card, data), rebinds a card
+            release_card (callable): release_card(card) for cards scrolled out of view
+            reserve_frame_height (bool): Size parent_frame to the grid; pass False
+                for cards that are not child widgets of it
+        """
+        if self.renderer is not None:
+            self.renderer.cancel()
+        self.reconciler.clear()
+        self.positions = {}
+        self.reconciler = KeyedReconciler(self, create_card, update_card, release_card)
+        self.reserve_frame_height = reserve_frame_height
+        self._update_geometry()
+        self.render()
+    
+    def get_card(self, key):
+        """
+        Get the card rendered for a key, if it is in the viewport.
+        
+        Args:
+            key: Item key
             
-            if is_visible and i not in self.visible_items:
-                # Create the widget if it's visible but not created yet
-                widget = item_factory(self.parent_frame, item_data)
-                widget.grid(
-                    row=row, column=col, 
-                    sticky="nsew", 
-                    padx=self.padding, 
-                    pady=self.padding
-                )
-                self.visible_items[i] = widget
-                
-            elif not is_visible and i in self.visible_items:
-                # Destroy the widget if it's not visible but created
-                self.visible_items[i].destroy()
-                del self.visible_items[i]
+        Returns:
+            Widget or None
+        """
+        return self.reconciler.get_card(key)
+    
+    def clear(self):
+        """
+        Remove every item.
+        """
+        self.set_data([])
+    
+    # Layout interface used by the window reconciler
+    
+    def set_items(self, widgets):
+        """
+        Place the rendered window's widgets, moving only those whose cell changed.
+        
+        Args:
+            widgets (list): Widgets for items [first, last) in display order,
+                None for cards not built yet
+        """
+        columns = self.current_columns
+        width = self.column_width - 2 * self.padding
+        for offset, widget in enumerate(widgets):
+            if widget is None:
+                continue
+            index = self._window_start + offset
+            cell = (
+                (index % columns) * self.column_width + self.padding,
+                (index // columns) * self.row_height + self.padding,
+                width
+            )
+            if self.positions.get(widget) != cell:
+                widget.place(x=cell[0], y=cell[1], width=cell[2], height=self.card_height)
+                self.positions[widget] = cell
+    
+    def forget_items(self, widgets):
+        """
+        Unplace several widgets without destroying them.
+        
+        Args:
+            widgets (iterable): Widgets to remove
+        """
+        for widget in widgets:
+            self.forget_item(widget)
+    
+    def forget_item(self, widget):
+        """
+        Unplace a widget without destroying it.
+        
+        Args:
+            widget: Widget to remove
+        """
+        if self.positions.pop(widget, None) is not None:
+            widget.place_forget()
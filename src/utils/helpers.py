@@ -2,14 +2,35 @@
 Helper utilities for the ToDo application.
 """
 import tkinter as tk
-from datetime import datetime
-from dateutil import parser
-from ttkbootstrap.dialogs import Querybox
+from datetime import date, timedelta
+from functools import lru_cache
+from .lazy_import import lazy_import
+from ..data.task_index import parse_stored_datetime
+
+# Only needed once a date is picked
+dialogs = lazy_import("ttkbootstrap.dialogs")
+
+# Distinct (date string, format) pairs remembered by format_date
+DATE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _format_date_cached(date_str, format_str):
+    # Same parser as the task index, so card text and due filters agree
+    parsed = parse_stored_datetime(date_str)
+    if parsed is None:
+        return date_str
+    try:
+        return parsed.strftime(format_str)
+    except ValueError:
+        return date_str
 
 def format_date(date_str, format_str="%b %d, %Y"):
     """
     Format date string for consistent display across the application.
     
+    Results are memoized per (date string, format), so a date shown on
+    many cards and dialogs is parsed once.
+    
     Args:
         date_str: ISO format date string
         format_str: Output date format string
@@ -19,22 +40,56 @@ def format_date(date_str, format_str="%b %d, %Y"):
     """
     if not date_str:
         return "Not set"
-    
-    try:
-        date_obj = parser.parse(date_str)
-        return date_obj.strftime(format_str)
-    except Exception:
+    return _format_date_cached(date_str, format_str)
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _relative_label_cached(date_str, format_str, today):
+    parsed = parse_stored_datetime(date_str)
+    if parsed is None:
         return date_str
+    day = parsed.date()
+    if day == today:
+        return "Today"
+    if day == today + timedelta(days=1):
+        return "Tomorrow"
+    if day == today - timedelta(days=1):
+        return "Yesterday"
+    return _format_date_cached(date_str, format_str)
+
+def format_relative_date(date_str, format_str="%b %d, %Y"):
+    """
+    Format a date as "Today", "Tomorrow" or "Yesterday" when it is one.
+    
+    Labels depend on the current day, which is part of the memo key, so
+    they roll over at midnight; other dates format as in format_date.
+    
+    Args:
+        date_str: ISO format date string
+        format_str: Output format for dates further away
+        
+    Returns:
+        str: Relative label, formatted date or "Not set" if None
+    """
+    if not date_str:
+        return "Not set"
+    return _relative_label_cached(date_str, format_str, date.today())
 
-def center_window(window, parent=None):
+def center_window(window, parent=None, size=None):
     """
     Center a window on the screen or parent window.
     
     Args:
         window: Window to center
         parent: Parent window (if None, center on screen)
+        size (tuple): Known (width, height) of the window; skips the
+            update_idletasks() needed to measure it
     """
-    window.update_idletasks()
+    if size:
+        width, height = size
+    else:
+        window.update_idletasks()
+        width = window.winfo_width()
+        height = window.winfo_height()
     
     if parent:
         # Center on parent
@@ -43,16 +98,10 @@ def center_window(window, parent=None):
         parent_width = parent.winfo_width()
         parent_height = parent.winfo_height()
         
-        width = window.winfo_width()
-        height = window.winfo_height()
-        
         x = parent_x + (parent_width // 2) - (width // 2)
         y = parent_y + (parent_height // 2) - (height // 2)
     else:
         # Center on screen
-        width = window.winfo_width()
-        height = window.winfo_height()
-        
         screen_width = window.winfo_screenwidth()
         screen_height = window.winfo_screenheight()
         
@@ -73,7 +122,7 @@ def get_centered_date(parent, title="Select Date"):
         date object or None if canceled
     """
     # Get the date using ttkbootstrap's Querybox
-    date_result = Querybox.get_date(parent=parent, title=title)
+    date_result = dialogs.Querybox.get_date(parent=parent, title=title)
     
     # Find the date picker dialog (it's usually the last toplevel created)
     for widget in parent.winfo_children():
@@ -0,0 +1,181 @@
+"""
+Prioritized background work run while the Tk loop is idle.
+"""
+import heapq
+import itertools
+import time
+
+# Lower runs first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+
+class IdleJob:
+    """
+    A queued unit of idle work.
+
+    Attributes:
+        name (str): Label used in the statistics
+        priority (int): Lower runs first
+        key (str): Scheduling another job under the same key replaces this one
+        cancelled (bool): Set by IdleScheduler.cancel
+    """
+
+    def __init__(self, work, priority, name, key):
+        self.work = work
+        self.priority = priority
+        self.name = name
+        self.key = key
+        self.cancelled = False
+
+
+class IdleScheduler:
+    """
+    Runs deferrable work in after_idle slots, most important first.
+
+    A job is either a callable, run once, or an iterator, whose next() calls
+    are steps run one after another until it is exhausted (so long jobs can
+    be split up). Each idle slot runs jobs until budget_ms is used up and
+    then yields back to Tk, so input is never held up by more than one step.
+    Slots are spaced at least delay_ms apart to leave the loop room for
+    input and timers while there is a backlog.
+    """
+
+    def __init__(self, owner, budget_ms=8, delay_ms=20):
+        """
+        Initialize the scheduler.
+
+        Args:
+            owner: Any Tk widget, used to schedule slots
+            budget_ms (int): Maximum time spent per slot
+            delay_ms (int): Minimum time between slots
+        """
+        self.owner = owner
+        self.budget_ms = budget_ms
+        self.delay_ms = delay_ms
+        self._queue = []  # (priority, seq, job)
+        self._seq = itertools.count()
+        self._by_key = {}
+        self._job = None
+        self.slots = 0
+        self.job_stats = {}  # name -> {"runs", "steps", "total_ms", "max_ms"}
+
+    @property
+    def depth(self):
+        """Number of jobs waiting to run."""
+        return sum(1 for _, _, job in self._queue if not job.cancelled)
+
+    def schedule(self, work, priority=PRIORITY_NORMAL, name=None, key=None):
+        """
+        Queue a job to run when the loop is idle.
+
+        Args:
+            work (callable or iterator): The job
+            priority (int): Lower runs first; equal priorities run in order
+            name (str): Label for the statistics, defaults to the function name
+            key (str): Replaces a queued job with the same key
+
+        Returns:
+            IdleJob: Handle that can be passed to cancel
+        """
+        if key is not None:
+            self.cancel(key)
+        if name is None:
+            name = getattr(work, "__name__", type(work).__name__)
+        job = IdleJob(work, priority, name, key)
+        if key is not None:
+            self._by_key[key] = job
+        heapq.heappush(self._queue, (priority, next(self._seq), job))
+        self._kick()
+        return job
+
+    def cancel(self, job_or_key):
+        """
+        Drop a queued job. A job already part-way through stops before its next step.
+
+        Args:
+            job_or_key (IdleJob or str): The job, or the key it was scheduled under
+        """
+        job = self._by_key.get(job_or_key) if isinstance(job_or_key, str) else job_or_key
+        if job is None:
+            return
+        job.cancelled = True
+        if job.key is not None and self._by_key.get(job.key) is job:
+            del self._by_key[job.key]
+
+    def run_pending(self):
+        """
+        Run every queued job to completion now, e.g. before shutting down.
+        """
+        while self._run_next():
+            pass
+
+    def stats(self):
+        """
+        Get queue and runtime figures for diagnostics.
+
+        Returns:
+            dict: Queue depth, slots run and per-job-name runs, steps and timings (ms)
+        """
+        return {"depth": self.depth, "slots": self.slots, "jobs": self.job_stats}
+
+    def _kick(self):
+        """
+        Make sure a slot is scheduled while jobs are waiting.
+        """
+        if self._job is None and self._queue:
+            self._job = self.owner.after(self.delay_ms, lambda: self.owner.after_idle(self._run_slot))
+
+    def _run_slot(self):
+        """
+        Run jobs until the slot budget is used up.
+        """
+        self._job = None
+        self.slots += 1
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while time.perf_counter() < deadline and self._run_next():
+            pass
+        self._kick()
+
+    def _run_next(self):
+        """
+        Run the next step of the most important job.
+
+        Returns:
+            bool: False if the queue is empty
+        """
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
+        if not self._queue:
+            return False
+
+        priority, seq, job = self._queue[0]
+        started = time.perf_counter()
+        finished = True
+        try:
+            if callable(job.work):
+                job.work()
+            else:
+                next(job.work)
+                finished = False
+        except StopIteration:
+            pass
+        except Exception as e:
+            print(f"Idle job {job.name} failed: {e}")
+        elapsed = (time.perf_counter() - started) * 1000
+
+        stats = self.job_stats.setdefault(job.name, {"runs": 0, "steps": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["steps"] += 1
+        stats["total_ms"] += elapsed
+        stats["max_ms"] = max(stats["max_ms"], elapsed)
+
+        # The step may have scheduled or cancelled jobs; find this one again
+        if not finished and not job.cancelled:
+            return True
+        self._queue.remove((priority, seq, job))
+        heapq.heapify(self._queue)
+        stats["runs"] += 1
+        if job.key is not None and self._by_key.get(job.key) is job:
+            del self._by_key[job.key]
+        return True
@@ -0,0 +1,63 @@
+"""
+Deferred imports for heavy modules.
+"""
+import importlib
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    ``parser = lazy_import("dateutil.parser")`` costs nothing at startup;
+    the real import happens the first time e.g. ``parser.parse`` is looked up.
+    """
+
+    def __init__(self, name, package=None):
+        """
+        Initialize the stand-in.
+
+        Args:
+            name (str): Module name, relative if it starts with a dot
+            package (str): Package the relative name is resolved against
+        """
+        self._name = name
+        self._package = package
+        self._module = None
+
+    @property
+    def loaded(self):
+        """True once the real module has been imported."""
+        return self._module is not None
+
+    def load(self):
+        """
+        Import the module now.
+
+        Returns:
+            module: The real module
+        """
+        if self._module is None:
+            self._module = importlib.import_module(self._name, self._package)
+        return self._module
+
+    def __getattr__(self, attr):
+        # Only called for attributes not found on the stand-in itself
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name, package=None):
+    """
+    Get a stand-in that imports a module on first use.
+
+    Args:
+        name (str): Module name
+        package (str): Package for relative names
+
+    Returns:
+        LazyModule: The stand-in
+    """
+    return LazyModule(name, package)
+
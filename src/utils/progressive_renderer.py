@@ -0,0 +1,127 @@
+"""
+Time-sliced rendering that keeps the Tk event loop responsive.
+"""
+import time
+
+class ProgressiveRenderer:
+    """
+    Runs a render job in small time slices between Tk events.
+
+    A job is any iterator; each next() call does one chunk of work (e.g.
+    builds a few cards). The first chunk runs immediately so the first
+    screenful shows up at once, the rest run in slices of at most budget_ms
+    scheduled with after_idle, so keystrokes and clicks are handled between
+    slices. Starting a new job cancels the one in progress: every job carries
+    a generation number and a slice belonging to an older generation stops.
+    """
+
+    def __init__(self, owner, budget_ms=12):
+        """
+        Initialize the renderer.
+
+        Args:
+            owner: Any Tk widget, used to schedule slices
+            budget_ms (int): Maximum time spent per slice
+        """
+        self.owner = owner
+        self.budget_ms = budget_ms
+        self.generation = 0
+        self._job = None
+        self.last_stats = {"chunks": 0, "slices": 0, "elapsed_ms": 0.0}
+
+    @property
+    def busy(self):
+        """True while a job still has chunks left."""
+        return self._job is not None
+
+    def start(self, steps, on_done=None):
+        """
+        Start a render job, cancelling any job still in progress.
+
+        Args:
+            steps (iterator): The job; each next() renders one chunk
+            on_done (callable): Called once the job has finished
+
+        Returns:
+            int: Generation number of the new job
+        """
+        self.cancel()
+        generation = self.generation
+        self.last_stats = {"chunks": 0, "slices": 0, "elapsed_ms": 0.0}
+
+        # First chunk right away: the first screenful should not wait for idle
+        started = time.perf_counter()
+        if self._advance(steps):
+            self._finish(on_done, started)
+            return generation
+        self.last_stats["elapsed_ms"] += (time.perf_counter() - started) * 1000
+
+        self._job = self.owner.after_idle(lambda: self._run_slice(generation, steps, on_done))
+        return generation
+
+    def cancel(self):
+        """
+        Stop the job in progress, if any. Work already done stays on screen.
+        """
+        self.generation += 1
+        if self._job is not None:
+            try:
+                self.owner.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    def run_now(self, steps):
+        """
+        Run a job to completion synchronously, cancelling any job in progress.
+
+        Args:
+            steps (iterator): The job
+        """
+        self.cancel()
+        for _ in steps:
+            pass
+
+    def _advance(self, steps):
+        """
+        Run one chunk.
+
+        Returns:
+            bool: True if the job is finished
+        """
+        try:
+            next(steps)
+        except StopIteration:
+            return True
+        self.last_stats["chunks"] += 1
+        return False
+
+    def _run_slice(self, generation, steps, on_done):
+        """
+        Run chunks until the slice budget is used up, then yield to Tk.
+        """
+        if generation != self.generation:
+            return  # A newer job replaced this one
+
+        self._job = None
+        self.last_stats["slices"] += 1
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000
+        while True:
+            if self._advance(steps):
+                self._finish(on_done, started)
+                return
+            if time.perf_counter() >= deadline:
+                break
+
+        self.last_stats["elapsed_ms"] += (time.perf_counter() - started) * 1000
+        self._job = self.owner.after_idle(lambda: self._run_slice(generation, steps, on_done))
+
+    def _finish(self, on_done, started):
+        """
+        Record the last slice and report completion.
+        """
+        self.last_stats["elapsed_ms"] += (time.perf_counter() - started) * 1000
+        self._job = None
+        if on_done:
+            on_done()
@@ -0,0 +1,163 @@
+"""
+Keyed reconciliation of card widgets against an ordered list of items.
+"""
+
+class KeyedReconciler:
+    """
+    Keeps one card widget per item key and patches it instead of rebuilding.
+
+    Each render is given the full ordered list of (key, version, data) for
+    the items that should be visible. Cards for new keys are created, cards
+    whose version changed are updated in place, cards for keys that went away
+    are destroyed, and the layout only moves cards whose position changed.
+    """
+
+    def __init__(self, layout, create_card, update_card, release_card=None):
+        """
+        Initialize the reconciler.
+
+        Args:
+            layout: Grid layout exposing set_items, forget_items and forget_item;
+                set_items must leave the cell of a None entry empty
+            create_card (callable): create_card(data) -> widget
+            update_card (callable): update_card(widget, data), rebinds a card
+            release_card (callable): release_card(widget) for cards that left
+                the view, e.g. WidgetPool.release; destroys them by default
+        """
+        self.layout = layout
+        self.create_card = create_card
+        self.update_card = update_card
+        self.release_card = release_card or (lambda widget: widget.destroy())
+        self.cards = {}  # key -> widget
+        self.versions = {}  # key -> version the card was last rendered at
+        self.order = []  # keys in display order
+        self.last_stats = {"created": 0, "updated": 0, "removed": 0, "kept": 0}
+
+    def reconcile(self, items):
+        """
+        Bring the cards in line with an ordered list of items.
+        
+        Args:
+            items (list): (key, version, data) tuples in display order
+            
+        Returns:
+            dict: Counts of created, updated, removed and untouched cards
+        """
+        for _ in self.reconcile_steps(items, first_chunk=len(items)):
+            pass
+        return self.last_stats
+    
+    def reconcile_steps(self, items, first_chunk=12, chunk_size=8):
+        """
+        Reconcile in chunks, yielding after each one (for ProgressiveRenderer).
+        
+        Cards that left the view are released up front. Every chunk then
+        creates or patches the cards of its items and re-places the layout;
+        items not reached yet leave their cell empty, so cards fill in at
+        their final position. Stopping early leaves a consistent state for
+        the next reconcile.
+        
+        Args:
+            items (list): (key, version, data) tuples in display order
+            first_chunk (int): Items handled by the first chunk (one screenful)
+            chunk_size (int): Items handled by each later chunk
+        
+        Yields:
+            None, after each chunk
+        """
+        stats = {"created": 0, "updated": 0, "removed": 0, "kept": 0}
+        self.last_stats = stats
+        wanted = {key for key, _, _ in items}
+        removed = [key for key in self.cards if key not in wanted]
+        
+        # Release cards that left the view first, so a pool can hand them
+        # straight back out for the new keys below
+        if removed:
+            self.layout.forget_items([self.cards[key] for key in removed])
+        for key in removed:
+            self.versions.pop(key, None)
+            self.release_card(self.cards.pop(key))
+            stats["removed"] += 1
+        
+        self.order = [key for key, _, _ in items]
+        
+        # Existing cards keep showing (possibly stale) until their chunk comes up
+        widgets = [self.cards.get(key) for key, _, _ in items]
+        start = 0
+        end = max(1, first_chunk)
+        while True:
+            for i in range(start, min(end, len(items))):
+                key, version, data = items[i]
+                widget = widgets[i]
+                if widget is None:
+                    widget = self.create_card(data)
+                    self.cards[key] = widget
+                    widgets[i] = widget
+                    stats["created"] += 1
+                elif self.versions.get(key) != version:
+                    self.update_card(widget, data)
+                    stats["updated"] += 1
+                else:
+                    stats["kept"] += 1
+                self.versions[key] = version
+            
+            self.layout.set_items(widgets)
+            if end >= len(items):
+                break
+            start, end = end, end + chunk_size
+            yield
+    
+    def patch(self, key, version, data):
+        """
+        Update the card for one key in place, if it has one and its version changed.
+        
+        Args:
+            key: Item key
+            version: New item version
+            data: New item data
+            
+        Returns:
+            bool: True if the card was updated
+        """
+        widget = self.cards.get(key)
+        if widget is None or self.versions.get(key) == version:
+            return False
+        self.update_card(widget, data)
+        self.versions[key] = version
+        return True
+    
+    def remove(self, key):
+        """
+        Remove and release the card for one key.
+
+        Args:
+            key: Item key
+
+        Returns:
+            bool: True if a card existed
+        """
+        widget = self.cards.pop(key, None)
+        self.versions.pop(key, None)
+        if widget is None:
+            return False
+        self.layout.forget_item(widget)
+        self.release_card(widget)
+        return True
+
+    def get_card(self, key):
+        """
+        Get the card currently shown for a key.
+
+        Args:
+            key: Item key
+
+        Returns:
+            Widget or None
+        """
+        return self.cards.get(key)
+
+    def clear(self):
+        """
+        Release every card.
+        """
+        self.reconcile([])
@@ -0,0 +1,60 @@
+"""
+Coalescing of bursts of <Configure> events into one relayout per frame.
+"""
+
+class ResizeCoalescer:
+    """
+    <Configure> handler that relays out at most once per frame.
+
+    Dragging a window edge fires a Configure event for every pointer motion.
+    Bound in place of the real handler, this only records the latest size
+    and schedules a single callback frame_ms later, so a burst of events
+    costs one relayout with the final size.
+    """
+
+    def __init__(self, widget, callback, frame_ms=16):
+        """
+        Initialize the coalescer.
+
+        Args:
+            widget: Widget used to schedule the relayout
+            callback (callable): callback(width, height), run once per frame
+            frame_ms (int): Minimum time between relayouts
+        """
+        self.widget = widget
+        self.callback = callback
+        self.frame_ms = frame_ms
+        self.width = None
+        self.height = None
+        self.events = 0
+        self.relayouts = 0
+        self._job = None
+
+    def __call__(self, event):
+        """
+        Record a Configure event and schedule the relayout.
+
+        Args:
+            event: The Configure event
+        """
+        self.events += 1
+        self.width = event.width
+        self.height = event.height
+        if self._job is None:
+            self._job = self.widget.after(self.frame_ms, self._flush)
+
+    def _flush(self):
+        """
+        Run the relayout for the latest size.
+        """
+        self._job = None
+        self.relayouts += 1
+        self.callback(self.width, self.height)
+
+    def cancel(self):
+        """
+        Drop a pending relayout.
+        """
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
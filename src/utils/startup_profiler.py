@@ -0,0 +1,161 @@
+"""
+Startup time profiling (app.py --profile-startup).
+"""
+import sys
+import time
+
+class _TimedLoader:
+    """
+    Wraps a module loader and times exec_module.
+
+    Any other loader attribute is passed through, so resource and
+    introspection APIs keep working.
+    """
+
+    def __init__(self, loader, profiler, name):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter_import(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import()
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class StartupProfiler:
+    """
+    Records where startup time goes.
+
+    While installed, every module imported for the first time is timed;
+    its self time excludes the modules it imported in turn, like
+    ``python -X importtime``. Stages (theme creation, data load, first
+    paint, ...) are added with stage() or record(), and report() prints
+    both.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports = {}  # module -> (self ms, cumulative ms)
+        self.stages = {}  # stage -> ms
+        self._stack = []  # [module, started, child ms] for imports in progress
+        self._resolving = set()
+
+    def install(self):
+        """
+        Start timing imports.
+        """
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """
+        Stop timing imports.
+        """
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path, target=None):
+        """
+        Find a module with the remaining finders and wrap its loader (import hook).
+        """
+        if name in self._resolving:
+            return None
+        self._resolving.add(name)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._resolving.discard(name)
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+
+    def _enter_import(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_import(self):
+        name, started, child_ms = self._stack.pop()
+        total = (time.perf_counter() - started) * 1000
+        self.imports[name] = (total - child_ms, total)
+        if self._stack:
+            self._stack[-1][2] += total
+
+    def stage(self, name):
+        """
+        Time a block of code as a named stage.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            context manager
+        """
+        return _Stage(self, name)
+
+    def record(self, name, ms):
+        """
+        Record a stage timed elsewhere.
+
+        Args:
+            name (str): Stage name
+            ms (float): Duration in milliseconds
+        """
+        self.stages[name] = ms
+
+    def report(self, timeline=None, top=15):
+        """
+        Print the stage timings and the slowest imports.
+
+        Args:
+            timeline (dict): Stage -> ms since the app started, e.g.
+                TodoApp.startup_timings
+            top (int): Number of imports listed
+        """
+        print("=== Startup profile ===")
+        for name, ms in self.stages.items():
+            print(f"  {name:<28} {ms:>9.1f} ms")
+        if timeline:
+            print("  timeline (ms after TodoApp start):")
+            for name, ms in timeline.items():
+                print(f"    {name:<26} {ms:>9.1f}")
+
+        total_import = sum(self_ms for self_ms, _ in self.imports.values())
+        print(f"  imports: {len(self.imports)} modules, {total_import:.1f} ms")
+        print(f"  {'module':<40} {'self ms':>9} {'cumulative':>11}")
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        for name, (self_ms, total) in slowest:
+            print(f"  {name:<40} {self_ms:>9.1f} {total:>11.1f}")
+
+
+class _Stage:
+    """
+    Context manager returned by StartupProfiler.stage.
+    """
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, (time.perf_counter() - self.started) * 1000)
+        return False
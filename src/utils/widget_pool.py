@@ -0,0 +1,137 @@
+"""
+Pool of reusable card widgets.
+"""
+import time
+from .idle_scheduler import PRIORITY_LOW
+
+class WidgetPool:
+    """
+    Recycles card widgets instead of destroying and rebuilding them.
+
+    Released cards are kept hidden and rebound to new data on the next
+    acquire. At most high_water idle cards are kept, and cards left idle
+    longer than idle_timeout_ms are destroyed in the background.
+    """
+
+    def __init__(self, owner, create, rebind, high_water=200, idle_timeout_ms=30000, scheduler=None):
+        """
+        Initialize the pool.
+
+        Args:
+            owner: Any Tk widget, used to schedule idle trimming
+            create (callable): create(data) -> new widget showing data
+            rebind (callable): rebind(widget, data), shows data on a pooled widget
+            high_water (int): Maximum number of idle widgets kept
+            idle_timeout_ms (int): Idle time after which a pooled widget is destroyed
+            scheduler (IdleScheduler): Destroys expired widgets a few at a time
+                during idle slots instead of all at once
+        """
+        self.owner = owner
+        self.create = create
+        self.rebind = rebind
+        self.high_water = high_water
+        self.idle_timeout_ms = idle_timeout_ms
+        self.scheduler = scheduler
+        self.idle = []  # (released_at, widget), oldest first
+        self.created = 0
+        self.reused = 0
+        self._trim_job = None
+
+    def acquire(self, data):
+        """
+        Get a widget showing data, reusing an idle one when possible.
+
+        Args:
+            data: Item to show
+
+        Returns:
+            Widget
+        """
+        if self.idle:
+            # Take the most recently released widget; its styles are most likely warm
+            _, widget = self.idle.pop()
+            self.rebind(widget, data)
+            self.reused += 1
+            return widget
+
+        self.created += 1
+        return self.create(data)
+
+    def release(self, widget):
+        """
+        Return a widget to the pool. The caller must already have hidden it.
+
+        Args:
+            widget: Widget no longer shown
+        """
+        if len(self.idle) >= self.high_water:
+            widget.destroy()
+            return
+
+        self.idle.append((time.monotonic(), widget))
+        self._schedule_trim()
+
+    def _schedule_trim(self):
+        """
+        Schedule a pass that destroys widgets idle for too long.
+        """
+        if self._trim_job is None and self.idle_timeout_ms > 0:
+            self._trim_job = self.owner.after(self.idle_timeout_ms, self._trim)
+
+    def _trim(self):
+        """
+        Destroy widgets that stayed idle longer than the timeout.
+        """
+        self._trim_job = None
+        cutoff = time.monotonic() - self.idle_timeout_ms / 1000
+        keep = []
+        expired = []
+        for released_at, widget in self.idle:
+            if released_at <= cutoff:
+                expired.append(widget)
+            else:
+                keep.append((released_at, widget))
+        self.idle = keep
+        if self.idle:
+            self._schedule_trim()
+        
+        if self.scheduler is not None:
+            self.scheduler.schedule(self._destroy_steps(expired), PRIORITY_LOW, name="widget pool trim")
+        else:
+            for widget in expired:
+                widget.destroy()
+    
+    @staticmethod
+    def _destroy_steps(widgets):
+        """
+        Destroy widgets one per step (an IdleScheduler job).
+        
+        Args:
+            widgets (list): Widgets to destroy
+        
+        Yields:
+            None, after each widget
+        """
+        for widget in widgets:
+            widget.destroy()
+            yield
+
+    def clear(self):
+        """
+        Destroy every idle widget.
+        """
+        if self._trim_job is not None:
+            self.owner.after_cancel(self._trim_job)
+            self._trim_job = None
+        for _, widget in self.idle:
+            widget.destroy()
+        self.idle = []
+
+    def stats(self):
+        """
+        Get pool counters for diagnostics.
+
+        Returns:
+            dict: idle, created and reused counts
+        """
+        return {"idle": len(self.idle), "created": self.created, "reused": self.reused}
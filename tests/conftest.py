@@ -0,0 +1,76 @@
+"""
+Shared pytest setup: puts the repository root on sys.path and provides
+random task data for the brute-force checks.
+"""
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STATUSES = ["To Do", "In Progress", "Completed"]
+PRIORITIES = ["Low", "Medium", "High"]
+TAGS = ["work", "Home", "home", "errand", "urgent"]
+WORDS = ["alpha", "beta", "gamma", "report", "meet", "ab", "x", "zz", "Call", "plan"]
+TODAY = date(2026, 10, 18)
+
+
+class TaskFactory:
+    """
+    Builds random tasks shaped like the ones TaskManager stores.
+    """
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.counter = 0
+
+    def text(self, low, high):
+        return " ".join(self.rng.choice(WORDS) for _ in range(self.rng.randint(low, high)))
+
+    def due_date(self):
+        roll = self.rng.random()
+        if roll < 0.15:
+            return None
+        day = TODAY + timedelta(days=self.rng.randint(-40, 40))
+        if roll < 0.6:
+            return day.isoformat()
+        return datetime(day.year, day.month, day.day, self.rng.randint(0, 23), self.rng.randint(0, 59)).isoformat()
+
+    def task(self):
+        self.counter += 1
+        created = datetime(2026, 9, 1) + timedelta(minutes=self.rng.randint(0, 60 * 24 * 40))
+        return {
+            "id": f"task-{self.counter}",
+            "title": self.text(1, 4),
+            "description": self.text(0, 30),
+            "created_at": created.isoformat(),
+            "due_date": self.due_date(),
+            "priority": self.rng.choice(PRIORITIES),
+            "status": self.rng.choice(STATUSES),
+            "tags": self.rng.sample(TAGS, self.rng.randint(0, 3)),
+            "completed_at": None
+        }
+
+    def changes(self):
+        """
+        Random field updates for an existing task.
+        """
+        fresh = self.task()
+        fields = self.rng.sample(["title", "description", "due_date", "priority", "status", "tags"], self.rng.randint(1, 3))
+        return {field: fresh[field] for field in fields}
+
+
+@pytest.fixture
+def task_factory():
+    return TaskFactory(seed=1234)
+
+
+@pytest.fixture
+def task_manager(tmp_path):
+    from src.data.task_manager import TaskManager
+    manager = TaskManager(str(tmp_path / "todos.json"), str(tmp_path / "drafts.json"))
+    yield manager
+    manager.flush_saves()
@@ -0,0 +1,128 @@
+"""
+EventBus delivery and the change events TaskManager publishes.
+"""
+import pytest
+
+from src.data.event_bus import (
+    EventBus, ChangeEvent, TASK_EVENTS, DRAFT_EVENTS, TASK_ADDED, TASK_UPDATED,
+    TASK_DELETED, DRAFT_ADDED, DRAFT_UPDATED, DRAFT_DELETED, BULK_RELOADED
+)
+from src.data.task_index import SORT_OPTIONS, sort_key
+
+
+def test_handlers_run_in_order_and_can_unsubscribe():
+    bus = EventBus()
+    calls = []
+    first = lambda event: calls.append(("first", event.type))
+    unsubscribe = bus.subscribe(TASK_EVENTS, first)
+    bus.subscribe(TASK_ADDED, lambda event: calls.append(("second", event.type)))
+
+    bus.publish(ChangeEvent(TASK_ADDED, "1"))
+    bus.publish(ChangeEvent(TASK_DELETED, "1"))
+    unsubscribe()
+    bus.publish(ChangeEvent(TASK_ADDED, "2"))
+
+    assert calls == [("first", TASK_ADDED), ("second", TASK_ADDED), ("first", TASK_DELETED), ("second", TASK_ADDED)]
+    assert bus.published[TASK_ADDED] == 2
+
+
+def test_failing_handler_does_not_stop_the_others():
+    bus = EventBus()
+    calls = []
+
+    def failing(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(DRAFT_ADDED, failing)
+    bus.subscribe(DRAFT_ADDED, calls.append)
+    event = ChangeEvent(DRAFT_ADDED, "d")
+    bus.publish(event)
+    assert calls == [event]
+
+
+def test_handler_may_unsubscribe_during_delivery():
+    bus = EventBus()
+    calls = []
+
+    def once(event):
+        calls.append("once")
+        bus.unsubscribe(TASK_ADDED, once)
+
+    bus.subscribe(TASK_ADDED, once)
+    bus.subscribe(TASK_ADDED, lambda event: calls.append("always"))
+    bus.publish(ChangeEvent(TASK_ADDED))
+    bus.publish(ChangeEvent(TASK_ADDED))
+    assert calls == ["once", "always", "always"]
+
+
+def test_dispatcher_defers_delivery():
+    queued = []
+    bus = EventBus(dispatch=lambda deliver, event: queued.append((deliver, event)))
+    calls = []
+    bus.subscribe(TASK_ADDED, calls.append)
+    bus.publish(ChangeEvent(TASK_ADDED, "1"))
+    assert calls == [] and len(queued) == 1
+
+    deliver, event = queued.pop()
+    deliver(event)
+    assert calls == [event]
+
+
+def test_unknown_event_type_is_rejected():
+    with pytest.raises(ValueError):
+        EventBus().subscribe("task_renamed", print)
+
+
+def test_task_manager_events_describe_each_change(task_factory, task_manager):
+    events = []
+    task_manager.events.subscribe(sorted(set(TASK_EVENTS) | set(DRAFT_EVENTS)), events.append)
+    rng = task_factory.rng
+
+    for _ in range(150):
+        tasks = task_manager.get_all_tasks()
+        roll = rng.random()
+        if roll < 0.4 or not tasks:
+            fields = task_factory.task()
+            task = task_manager.add_task(**{field: fields[field] for field in ("title", "due_date", "priority", "tags", "status")})
+            event = events[-1]
+            assert (event.type, event.item_id, event.item) == (TASK_ADDED, task["id"], task)
+        elif roll < 0.85:
+            task = rng.choice(tasks)
+            before = dict(task)
+            slot = task_manager.index.slot_by_id[task["id"]]
+            old_keys = {sort_by: sort_key(sort_by, before, slot) for sort_by in SORT_OPTIONS}
+            changes = task_factory.changes()
+            task_manager.update_task(task["id"], **changes)
+            event = events[-1]
+            assert (event.type, event.item_id) == (TASK_UPDATED, task["id"])
+            assert event.previous == {key: value for key, value in before.items() if task[key] != value}
+            assert event.changed == frozenset(event.previous)
+            assert event.sort_keys == old_keys
+        else:
+            task = rng.choice(tasks)
+            task_manager.delete_task(task["id"])
+            event = events[-1]
+            assert (event.type, event.item_id, event.item) == (TASK_DELETED, task["id"], task)
+
+    draft = task_manager.add_draft("idea", tags=["home"])
+    task_manager.update_draft(draft["id"], title="better idea")
+    task_manager.delete_draft(draft["id"])
+    assert [event.type for event in events[-3:]] == [DRAFT_ADDED, DRAFT_UPDATED, DRAFT_DELETED]
+    assert events[-2].previous == {"title": "idea"}
+
+    task_manager.refresh_data()
+    assert events[-1].type == BULK_RELOADED and events[-1].item_id is None
+
+
+def test_sort_keys_survive_a_second_update(task_factory, task_manager):
+    events = []
+    task_manager.events.subscribe(TASK_UPDATED, events.append)
+    task = task_manager.add_task("task", due_date="2026-10-10")
+    first_key = task_manager.index.sort_key_of(task["id"], "Due Date")
+
+    task_manager.update_task(task["id"], due_date="2026-11-01")
+    task_manager.update_task(task["id"], due_date="2026-12-01")
+
+    # The first event still knows where the card was before either update
+    assert events[0].sort_keys["Due Date"] == first_key
+    assert events[1].sort_keys["Due Date"] != first_key
@@ -0,0 +1,150 @@
+"""
+IdleScheduler ordering, replacement and cancellation, driven by a fake Tk owner.
+"""
+import random
+
+from src.utils.idle_scheduler import IdleScheduler, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+
+
+class FakeOwner:
+    """Stands in for a Tk widget: after/after_idle just queue the callback."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay_ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_idle(self, callback):
+        return self.after(0, callback)
+
+    def run(self, limit=10000):
+        """Run queued callbacks, including the ones they queue, until none are left."""
+        while self.callbacks and limit:
+            self.callbacks.pop(0)()
+            limit -= 1
+        assert not self.callbacks
+
+
+def steps(log, name, count):
+    for step in range(count):
+        log.append((name, step))
+        yield
+
+
+def test_jobs_run_by_priority_then_in_order():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+    rng = random.Random(7)
+    expected = []
+    for n in range(50):
+        priority = rng.choice([PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW])
+        scheduler.schedule(lambda n=n: log.append(n), priority=priority, name="job")
+        expected.append((priority, n))
+
+    assert scheduler.depth == 50 and log == []
+    owner.run()
+    assert log == [n for _, n in sorted(expected)]
+    assert scheduler.depth == 0
+    assert scheduler.stats()["jobs"]["job"]["runs"] == 50
+
+
+def test_keyed_job_replaces_the_queued_one():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+    for n in range(5):
+        scheduler.schedule(lambda n=n: log.append(n), key="refresh")
+    scheduler.schedule(lambda: log.append("other"), key="other")
+    assert scheduler.depth == 2
+    owner.run()
+    assert log == [4, "other"]
+
+
+def test_cancel_by_job_and_by_key():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+    job = scheduler.schedule(lambda: log.append("a"))
+    scheduler.schedule(lambda: log.append("b"), key="b")
+    scheduler.schedule(lambda: log.append("c"))
+    scheduler.cancel(job)
+    scheduler.cancel("b")
+    scheduler.cancel("missing")
+    owner.run()
+    assert log == ["c"]
+
+
+def test_generator_steps_interleave_with_more_important_work():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+    scheduler.schedule(steps(log, "low", 3), priority=PRIORITY_LOW, name="low")
+    scheduler._run_next()
+    scheduler.schedule(steps(log, "high", 2), priority=PRIORITY_HIGH, name="high")
+    owner.run()
+    assert log == [("low", 0), ("high", 0), ("high", 1), ("low", 1), ("low", 2)]
+
+    jobs = scheduler.stats()["jobs"]
+    # The final step is the one that raises StopIteration
+    assert (jobs["low"]["runs"], jobs["low"]["steps"]) == (1, 4)
+    assert (jobs["high"]["runs"], jobs["high"]["steps"]) == (1, 3)
+
+
+def test_cancelled_generator_stops_before_its_next_step():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+    scheduler.schedule(steps(log, "job", 10), key="job")
+    scheduler._run_next()
+    scheduler._run_next()
+    scheduler.cancel("job")
+    owner.run()
+    assert log == [("job", 0), ("job", 1)]
+    assert scheduler.depth == 0
+
+
+def test_job_may_schedule_and_cancel_others():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+
+    def first():
+        log.append("first")
+        scheduler.cancel("doomed")
+        scheduler.schedule(lambda: log.append("follow-up"), priority=PRIORITY_HIGH)
+
+    scheduler.schedule(first, priority=PRIORITY_HIGH)
+    scheduler.schedule(lambda: log.append("doomed"), key="doomed")
+    scheduler.schedule(lambda: log.append("last"), priority=PRIORITY_LOW)
+    owner.run()
+    assert log == ["first", "follow-up", "last"]
+
+
+def test_failing_job_does_not_stop_the_queue():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    scheduler.schedule(broken)
+    scheduler.schedule(lambda: log.append("after"))
+    owner.run()
+    assert log == ["after"]
+    assert scheduler.stats()["jobs"]["broken"]["runs"] == 1
+
+
+def test_run_pending_drains_everything_without_the_loop():
+    owner = FakeOwner()
+    scheduler = IdleScheduler(owner)
+    log = []
+    scheduler.schedule(steps(log, "gen", 3), priority=PRIORITY_LOW)
+    scheduler.schedule(lambda: log.append("now"))
+    scheduler.run_pending()
+    assert log == ["now", ("gen", 0), ("gen", 1), ("gen", 2)]
+    assert scheduler.depth == 0
+    assert scheduler.stats()["slots"] == 0
@@ -0,0 +1,136 @@
+"""
+KeyedReconciler checked against the item lists it is given, over random renders.
+"""
+import random
+
+from src.utils.reconciler import KeyedReconciler
+
+
+class Card:
+    def __init__(self, data):
+        self.data = data
+        self.released = False
+
+
+class Layout:
+    """
+    Records what the reconciler places, like the grid layouts do.
+    """
+
+    def __init__(self):
+        self.items = []
+
+    def set_items(self, widgets):
+        self.items = list(widgets)
+
+    def forget_items(self, widgets):
+        gone = set(map(id, widgets))
+        self.items = [widget for widget in self.items if id(widget) not in gone]
+
+    def forget_item(self, widget):
+        self.forget_items([widget])
+
+
+def make_reconciler():
+    layout = Layout()
+    released = []
+
+    def update_card(card, data):
+        card.data = data
+
+    def release_card(card):
+        card.released = True
+        released.append(card)
+
+    return KeyedReconciler(layout, Card, update_card, release_card), layout, released
+
+
+def random_items(rng, versions):
+    """
+    A random ordered selection of keys, some with a new version.
+    """
+    keys = rng.sample(sorted(versions), rng.randint(0, len(versions)))
+    for key in keys:
+        if rng.random() < 0.2:
+            versions[key] += 1
+    return [(key, versions[key], (key, versions[key])) for key in keys]
+
+
+def check_state(reconciler, layout, items):
+    assert reconciler.order == [key for key, _, _ in items]
+    assert set(reconciler.cards) == {key for key, _, _ in items}
+    assert layout.items == [reconciler.cards[key] for key, _, _ in items]
+    for key, version, data in items:
+        card = reconciler.cards[key]
+        assert card.data == data and not card.released
+        assert reconciler.versions[key] == version
+
+
+def test_reconcile_matches_item_lists():
+    rng = random.Random(7)
+    versions = {f"k{i}": 1 for i in range(40)}
+    reconciler, layout, released = make_reconciler()
+    for _ in range(300):
+        items = random_items(rng, versions)
+        old_cards = dict(reconciler.cards)
+        old_versions = dict(reconciler.versions)
+        released.clear()
+
+        stats = reconciler.reconcile(items)
+
+        check_state(reconciler, layout, items)
+        keys = {key for key, _, _ in items}
+        gone = set(old_cards) - keys
+        assert {id(card) for card in released} == {id(old_cards[key]) for key in gone}
+        assert stats["removed"] == len(gone)
+        assert stats["created"] == len(keys - set(old_cards))
+        assert stats["updated"] == sum(1 for key, version, _ in items if key in old_cards and old_versions[key] != version)
+        assert stats["created"] + stats["updated"] + stats["kept"] == len(items)
+        # Cards that stayed are the same widgets
+        for key in keys & set(old_cards):
+            assert reconciler.cards[key] is old_cards[key]
+
+
+def test_interrupted_steps_leave_a_consistent_state():
+    rng = random.Random(11)
+    versions = {f"k{i}": 1 for i in range(60)}
+    reconciler, layout, _ = make_reconciler()
+    for _ in range(200):
+        items = random_items(rng, versions)
+        steps = reconciler.reconcile_steps(items, first_chunk=rng.randint(0, 10), chunk_size=rng.randint(1, 6))
+        # The first next() runs the first chunk, like ProgressiveRenderer.start
+        for _ in range(rng.randint(1, 6)):
+            if next(steps, StopIteration) is StopIteration:
+                break
+
+        # Every item has a cell; cells not reached yet are empty unless the
+        # item already had a card, which keeps showing until its chunk
+        assert len(layout.items) == len(items)
+        for (key, _, _), card in zip(items, layout.items):
+            if card is not None:
+                assert card is reconciler.cards[key] and not card.released
+        assert set(reconciler.cards) <= {key for key, _, _ in items}
+
+        if rng.random() < 0.5:
+            final = random_items(rng, versions)
+            reconciler.reconcile(final)
+            check_state(reconciler, layout, final)
+
+
+def test_patch_and_remove():
+    reconciler, layout, released = make_reconciler()
+    items = [(key, 1, (key, 1)) for key in "abc"]
+    reconciler.reconcile(items)
+
+    assert not reconciler.patch("b", 1, ("b", "same version"))
+    assert reconciler.patch("b", 2, ("b", 2))
+    assert reconciler.cards["b"].data == ("b", 2)
+    assert not reconciler.patch("missing", 1, None)
+
+    card = reconciler.cards["a"]
+    assert reconciler.remove("a")
+    assert released == [card] and card not in layout.items
+    assert not reconciler.remove("a")
+
+    reconciler.clear()
+    assert not reconciler.cards and all(card.released for card in released)
@@ -0,0 +1,150 @@
+"""
+SearchIndex checked against brute-force substring search over random edits.
+"""
+import pytest
+
+from src.data import search_index
+from src.data.search_index import SearchIndex, SEARCH_FIELDS, field_texts, find_spans
+
+QUERIES = ["", "a", "A", "ab", "al", "alpha", "pha b", "eta g", "report", "x", "zz a", "call", "plan\nwork", "nomatch", "work", "home"]
+
+
+def brute_force_ids(items, query, kind=None):
+    term = query.lower()
+    return {
+        item_id for (item_kind, item_id), item in items.items()
+        if kind in (None, item_kind) and any(term in text for text in field_texts(item).values())
+    }
+
+
+def check_postings(index):
+    """
+    The posting bitsets are exactly the trigrams of the indexed documents.
+    """
+    expected = {}
+    for key, (_, texts) in index.documents.items():
+        slot = index.slot_by_key[key]
+        assert index.slots[slot] == key
+        for gram in search_index.document_grams(texts)[0]:
+            expected[gram] = expected.get(gram, 0) | (1 << slot)
+    assert index.postings == expected
+    assert set(index.slot_by_key) == set(index.documents)
+
+
+def run_random_edits(index, factory, steps):
+    """
+    Mirror random adds, updates, removes and rebuilds in a dict.
+
+    Yields:
+        dict: (kind, id) -> item, after every operation
+    """
+    rng = factory.rng
+    items = {}
+    for _ in range(steps):
+        roll = rng.random()
+        if roll < 0.45 or not items:
+            item = factory.task()
+            kind = rng.choice(["task", "draft"])
+            items[(kind, item["id"])] = item
+            index.add(kind, item)
+        elif roll < 0.75:
+            key = rng.choice(sorted(items))
+            items[key].update(factory.changes())
+            index.update(key[0], items[key])
+        elif roll < 0.92:
+            key = rng.choice(sorted(items))
+            del items[key]
+            assert index.remove(*key)
+        else:
+            index.rebuild(
+                [item for (kind, _), item in items.items() if kind == "task"],
+                [item for (kind, _), item in items.items() if kind == "draft"]
+            )
+            index.index_pending(rng.randint(0, len(items)))
+        yield items
+
+
+@pytest.mark.parametrize("max_chars", [search_index.MAX_INDEXED_CHARS, 12])
+def test_match_ids_matches_brute_force(task_factory, monkeypatch, max_chars):
+    # A small limit puts most descriptions past the indexed prefix
+    monkeypatch.setattr(search_index, "MAX_INDEXED_CHARS", max_chars)
+    index = SearchIndex()
+    for step, items in enumerate(run_random_edits(index, task_factory, 800)):
+        if step % 20:
+            continue
+        assert len(index) == len(items)
+        check_postings(index)
+        for query in QUERIES:
+            for kind in (None, "task", "draft"):
+                assert index.match_ids(query, kind) == brute_force_ids(items, query, kind), (query, kind)
+
+
+def test_search_results_and_spans(task_factory):
+    index = SearchIndex()
+    for step, items in enumerate(run_random_edits(index, task_factory, 300)):
+        if step % 30:
+            continue
+        for query in QUERIES:
+            results = index.search(query)
+            if not query:
+                assert results == []
+                continue
+            assert {(result.kind, result.id) for result in results} == {
+                key for key in items if key[1] in brute_force_ids(items, query)
+            }
+            for result in results:
+                texts = field_texts(items[(result.kind, result.id)])
+                assert result.item is items[(result.kind, result.id)]
+                expected = {field: find_spans(texts[field], query.lower()) for field in SEARCH_FIELDS}
+                assert result.spans == {field: spans for field, spans in expected.items() if spans}
+
+            drafts_only = index.search(query, kinds=["draft"], limit=3)
+            assert [result.kind for result in drafts_only] == ["draft"] * len(drafts_only)
+            assert drafts_only == [result for result in results if result.kind == "draft"][:3]
+
+
+def test_titles_rank_first():
+    index = SearchIndex()
+    index.add("task", {"id": "1", "title": "later", "description": "plan ahead", "tags": []})
+    index.add("task", {"id": "2", "title": "plan", "description": "", "tags": []})
+    index.add("draft", {"id": "3", "title": "a plan", "description": "", "tags": ["plan"]})
+    assert [result.id for result in index.search("plan")] == ["2", "3", "1"]
+
+
+def test_pending_documents_are_searchable_before_indexing(task_factory):
+    tasks = [task_factory.task() for _ in range(50)]
+    drafts = [task_factory.task() for _ in range(20)]
+    items = {("task", item["id"]): item for item in tasks}
+    items.update({("draft", item["id"]): item for item in drafts})
+
+    index = SearchIndex()
+    index.rebuild(tasks, drafts)
+    assert not index.documents and len(index) == 70
+
+    while True:
+        for query in QUERIES:
+            assert index.match_ids(query) == brute_force_ids(items, query)
+        if not index.index_pending(17):
+            break
+    assert not index.pending and len(index.documents) == 70
+
+    # A queued document edited before it is indexed is found by its new text
+    index.rebuild(tasks, drafts)
+    tasks[0]["title"] = "freshly renamed"
+    index.update("task", tasks[0])
+    index.remove("draft", drafts[0]["id"])
+    del items[("draft", drafts[0]["id"])]
+    assert index.match_ids("freshly") == {tasks[0]["id"]}
+    index.index_pending()
+    for query in QUERIES:
+        assert index.match_ids(query) == brute_force_ids(items, query)
+
+
+def test_matches_checks_a_single_item(task_factory):
+    index = SearchIndex()
+    task = task_factory.task()
+    task["title"] = "Quarterly report"
+    index.add("task", task)
+    assert index.matches("task", task["id"], "REPORT")
+    assert not index.matches("task", task["id"], "nomatch")
+    assert not index.matches("draft", task["id"], "report")
@@ -0,0 +1,203 @@
+"""
+TaskIndex checked against brute-force filtering over random task edits.
+"""
+import itertools
+from datetime import timedelta
+
+from src.data.task_index import TaskIndex, SORT_OPTIONS, iter_bits, count_bits, parse_due_date, sort_key
+from src.data.task_manager import TaskManager
+from conftest import STATUSES, PRIORITIES, TAGS, TODAY
+
+
+def apply_random_ops(index, tasks, factory, steps):
+    """
+    Add, update and delete random tasks on both the index and a plain dict.
+
+    Yields:
+        None: After every operation
+    """
+    rng = factory.rng
+    for _ in range(steps):
+        roll = rng.random()
+        if roll < 0.5 or not tasks:
+            task = factory.task()
+            tasks[task["id"]] = task
+            index.add(task)
+        elif roll < 0.8:
+            task = tasks[rng.choice(sorted(tasks))]
+            task.update(factory.changes())
+            index.update(task)
+        else:
+            task_id = rng.choice(sorted(tasks))
+            del tasks[task_id]
+            assert index.remove(task_id)
+        yield
+
+
+def ids(tasks):
+    return {task["id"] for task in tasks}
+
+
+def check_bookkeeping(index, tasks):
+    """
+    Slots, counts and tags agree with the stored tasks.
+    """
+    used = [slot for slot, task in enumerate(index.slots) if task is not None]
+    assert len(index) == len(tasks) == len(used)
+    assert set(iter_bits(index.all_bits)) == set(used)
+    assert {index.slots[slot]["id"]: slot for slot in used} == index.slot_by_id
+    assert sorted(index.free_slots) == [slot for slot, task in enumerate(index.slots) if task is None]
+
+    for status in STATUSES:
+        expected = sum(1 for task in tasks.values() if task["status"] == status)
+        assert index.status_counts.get(status, 0) == expected
+        assert count_bits(index.status(status)) == expected
+    for priority in PRIORITIES:
+        expected = sum(1 for task in tasks.values() if task["priority"] == priority)
+        assert index.priority_counts.get(priority, 0) == expected
+
+    tag_keys = {tag.casefold() for task in tasks.values() for tag in task["tags"]}
+    assert {tag.casefold() for tag in index.all_tags()} == tag_keys
+
+
+def test_query_matches_brute_force(task_factory):
+    index = TaskIndex()
+    tasks = {}
+    rng = task_factory.rng
+    for step, _ in enumerate(apply_random_ops(index, tasks, task_factory, 600)):
+        if step % 10:
+            continue
+        check_bookkeeping(index, tasks)
+        for _ in range(5):
+            statuses = rng.sample(STATUSES, rng.randint(0, 2))
+            priorities = rng.sample(PRIORITIES, rng.randint(0, 2))
+            tags = rng.sample(TAGS, rng.randint(0, 2))
+            exclude = rng.sample(STATUSES, rng.randint(0, 1))
+            match_all = rng.random() < 0.5
+
+            def keep(task):
+                task_tags = {tag.casefold() for tag in task["tags"]}
+                wanted = [tag.casefold() for tag in tags]
+                if statuses and task["status"] not in statuses:
+                    return False
+                if priorities and task["priority"] not in priorities:
+                    return False
+                if tags and not (all if match_all else any)(tag in task_tags for tag in wanted):
+                    return False
+                return task["status"] not in exclude
+
+            bits = index.query(statuses, priorities, tags, exclude, match_all)
+            assert ids(index.tasks_for_bits(bits)) == {task["id"] for task in tasks.values() if keep(task)}
+
+
+def test_slots_are_reused_lowest_first(task_factory):
+    index = TaskIndex()
+    added = [task_factory.task() for _ in range(10)]
+    for task in added:
+        index.add(task)
+    for task in (added[7], added[2], added[5]):
+        index.remove(task["id"])
+
+    assert [index.add(task_factory.task()) for _ in range(4)] == [2, 5, 7, 10]
+    assert index.all_bits == (1 << 11) - 1
+
+
+def test_update_of_unknown_task_adds_it(task_factory):
+    index = TaskIndex()
+    task = task_factory.task()
+    index.update(task)
+    assert index.slot_by_id == {task["id"]: 0}
+    assert not index.remove("missing")
+
+
+def test_bits_for_ids_ignores_unknown_ids(task_factory):
+    index = TaskIndex()
+    tasks = [task_factory.task() for _ in range(20)]
+    for task in tasks:
+        index.add(task)
+    index.remove(tasks[3]["id"])
+
+    chosen = [task["id"] for task in itertools.islice(tasks, 0, 20, 3)] + ["missing"]
+    assert ids(index.tasks_for_bits(index.bits_for_ids(chosen))) == set(chosen) - {tasks[3]["id"], "missing"}
+
+
+def due_day(task):
+    return parse_due_date(task["due_date"])
+
+
+def test_due_ranges_match_brute_force(task_factory):
+    index = TaskIndex()
+    tasks = {}
+    rng = task_factory.rng
+    for step, _ in enumerate(apply_random_ops(index, tasks, task_factory, 400)):
+        if step % 10:
+            continue
+        assert ids(index.tasks_for_bits(index.no_due_bits)) == {
+            task["id"] for task in tasks.values() if due_day(task) is None
+        }
+        for _ in range(5):
+            start = TODAY + timedelta(days=rng.randint(-45, 45)) if rng.random() < 0.8 else None
+            end = TODAY + timedelta(days=rng.randint(-45, 45)) if rng.random() < 0.8 else None
+            expected = {
+                task["id"] for task in tasks.values()
+                if due_day(task) is not None
+                and (start is None or due_day(task) >= start)
+                and (end is None or due_day(task) <= end)
+            }
+            bits = index.due_between(start, end)
+            assert ids(index.tasks_for_bits(bits)) == expected
+            assert index.count_due_between(start, end) == len(expected)
+
+            # The single-slot form agrees with the full bitset
+            for task_id, slot in index.slot_by_id.items():
+                assert index.due_between(start, end, slot=slot) == bits & (1 << slot)
+
+
+def test_due_filters_match_brute_force(task_factory, task_manager):
+    for _ in range(300):
+        task = task_factory.task()
+        task_manager.add_task(**{field: task[field] for field in ("title", "description", "due_date", "priority", "tags", "status")})
+    tasks = {task["id"]: task for task in task_manager.get_all_tasks()}
+    index = task_manager.index
+
+    counts = task_manager.get_due_filter_counts(today=TODAY)
+    for name in TaskManager.DUE_FILTERS:
+        bits = task_manager.get_due_filter_bits(name, today=TODAY)
+        if name == "No Due Date":
+            expected = {task["id"] for task in tasks.values() if due_day(task) is None}
+        else:
+            start, end = TaskManager.get_due_range(name, TODAY)
+            expected = {
+                task["id"] for task in tasks.values()
+                if due_day(task) is not None
+                and (start is None or due_day(task) >= start)
+                and due_day(task) <= end
+            }
+        assert ids(index.tasks_for_bits(bits)) == expected, name
+        assert counts[name] == len(expected), name
+
+
+def test_orderings_match_sorted(task_factory):
+    index = TaskIndex()
+    tasks = {}
+    rng = task_factory.rng
+    for step, _ in enumerate(apply_random_ops(index, tasks, task_factory, 500)):
+        if step % 10:
+            continue
+        slots = index.slot_by_id
+        for sort_by in SORT_OPTIONS:
+            keys = {task_id: sort_key(sort_by, task, slots[task_id]) for task_id, task in tasks.items()}
+            assert index.orderings[sort_by] == sorted(keys.values())
+            for task_id, key in keys.items():
+                assert index.sort_key_of(task_id, sort_by) == key
+
+            chosen = {task_id for task_id in tasks if rng.random() < 0.5}
+            expected = sorted(chosen, key=keys.get)
+            bits = index.bits_for_ids(chosen)
+            assert [task["id"] for task in index.ordered(bits, sort_by)] == expected
+            assert [task["id"] for task in index.ordered(bits, sort_by, reverse=True)] == expected[::-1]
+
+        groups = {}
+        for task_id, task in tasks.items():
+            groups.setdefault((task["priority"], task["status"]), []).append(sort_key("Due Date", task, slots[task_id]))
+        assert index.due_groups == {group: sorted(keys) for group, keys in groups.items()}
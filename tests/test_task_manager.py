@@ -0,0 +1,62 @@
+"""
+TaskManager queries checked against brute force over random task edits.
+"""
+import heapq
+from datetime import datetime, timedelta
+
+from src.data.task_index import parse_stored_datetime
+from conftest import TODAY
+
+FIELDS = ("title", "description", "due_date", "priority", "tags", "status")
+
+
+def fill(task_manager, task_factory, count):
+    """
+    Add random tasks, then update and delete some of them.
+    """
+    rng = task_factory.rng
+    for _ in range(count):
+        task = task_factory.task()
+        task_manager.add_task(**{field: task[field] for field in FIELDS})
+    for task in rng.sample(task_manager.get_all_tasks(), count // 3):
+        task_manager.update_task(task["id"], **task_factory.changes())
+    for task in rng.sample(task_manager.get_all_tasks(), count // 6):
+        task_manager.delete_task(task["id"])
+
+
+def brute_force_top(task_manager, k, today):
+    """
+    Score every open task and take the K best: higher score, then earlier
+    due date, then lower slot.
+    """
+    slot_by_id = task_manager.index.slot_by_id
+    scored = []
+    for task in task_manager.get_all_tasks():
+        if task["status"] == "Completed":
+            continue
+        due = parse_stored_datetime(task["due_date"])
+        score = task_manager.urgency_score(task, due, today)
+        scored.append((-score, due or datetime.max, slot_by_id[task["id"]], task["id"]))
+    return [entry[-1] for entry in heapq.nsmallest(k, scored)]
+
+
+def test_top_tasks_matches_brute_force(task_factory, task_manager):
+    fill(task_manager, task_factory, 400)
+    for offset in range(-10, 80, 7):
+        today = TODAY + timedelta(days=offset)
+        for k in (1, 5, 10, 40):
+            top = [task["id"] for task in task_manager.top_tasks(k, today=today)]
+            assert top == brute_force_top(task_manager, k, today), (offset, k)
+        # A shorter list is a prefix of a longer one, so views can share one call
+        assert task_manager.top_tasks(10, today=today)[:5] == task_manager.top_tasks(5, today=today)
+
+
+def test_top_tasks_follows_edits(task_factory, task_manager):
+    fill(task_manager, task_factory, 60)
+    rng = task_factory.rng
+    for _ in range(60):
+        task = rng.choice(task_manager.get_all_tasks())
+        task_manager.update_task(task["id"], **task_factory.changes())
+        top = [task["id"] for task in task_manager.top_tasks(5, today=TODAY)]
+        assert top == brute_force_top(task_manager, 5, TODAY)
+    assert task_manager.top_tasks(0) == []